@@ -3,12 +3,34 @@ from tkinter import ttk, StringVar, PhotoImage
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import seaborn as sns
 from datetime import datetime
 import warnings
+import argparse
+import atexit
+import asyncio
+import bisect
+import glob
+import difflib
+import heapq
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from multiprocessing import shared_memory
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
 from PIL import Image, ImageTk
-from scipy.stats import ttest_ind, chi2_contingency
+from scipy.stats import ttest_ind, chi2_contingency, t as t_dist
 warnings.filterwarnings("ignore")
 
 plt.rcParams['axes.linewidth'] = 1.5
@@ -16,9 +38,2317 @@ plt.rcParams['axes.edgecolor'] = '#333333'
 plt.rcParams['figure.facecolor'] = '#ffffff'
 sns.set_style("whitegrid", {'axes.grid': False, 'axes.linewidth': 1.5})
 
+class PandasMatchStore:
+    # Default backend: the whole match history held in one DataFrame
+    def __init__(self, matches_df):
+        self.matches_df = matches_df
+
+    def matches(self, season="All", team=None, opponent=None, columns=None):
+        df = self.matches_df
+        mask = pd.Series(True, index=df.index)
+        if season != "All":
+            mask &= df['season'] == season
+        if team is not None and opponent is not None:
+            mask &= ((df['team1'] == team) & (df['team2'] == opponent)) | ((df['team1'] == opponent) & (df['team2'] == team))
+        elif team is not None:
+            mask &= (df['team1'] == team) | (df['team2'] == team)
+        result = df if mask.all() else df[mask]
+        return result if columns is None else result[columns]
+
+    def coded(self, season="All", columns=None):
+        # Rows for aggregations that only compare and group; the labels are already in memory here
+        return self.matches(season, columns=columns)
+
+    def seasons(self):
+        return sorted(self.matches_df['season'].dropna().unique().tolist())
+
+    def meeting_counts(self, team1, team2, season="All"):
+        meetings = self.matches(season, team1, team2, ['team1', 'winner', 'target_runs'])
+        return {
+            'total': len(meetings),
+            'team1_wins': int((meetings['winner'] == team1).sum()),
+            'team2_wins': int((meetings['winner'] == team2).sum()),
+            'avg_runs_team1': float(meetings.loc[meetings['team1'] == team1, 'target_runs'].mean()) if len(meetings) else 0.0
+        }
+
+    def last_meeting_winner(self, team1, team2):
+        h2h_matches = self.matches(team=team1, opponent=team2)
+        if len(h2h_matches) == 0:
+            return "No matches played"
+        h2h_matches['date'] = pd.to_datetime(h2h_matches['date'], dayfirst=True, errors='coerce')
+        h2h_matches = h2h_matches.sort_values('date', ascending=False)
+        last_match = h2h_matches.iloc[0]
+        return last_match['winner'] if not pd.isna(last_match['winner']) else "No Result"
+
+    def team_season_matrix(self):
+        matches = self.matches_df
+        # One row per (match, participating team), so every team is aggregated in the same pass
+        long = pd.concat([
+            pd.DataFrame({'team': matches[side], 'season': matches['season'], 'winner': matches['winner'],
+                          'toss_winner': matches['toss_winner'], 'toss_decision': matches['toss_decision'],
+                          'target_runs': matches['target_runs']})
+            for side in ('team1', 'team2')
+        ], ignore_index=True).dropna(subset=['team'])
+        won = long['winner'] == long['team']
+        toss_won = long['toss_winner'] == long['team']
+        bat_first = toss_won & (long['toss_decision'] == 'bat')
+        field_first = toss_won & (long['toss_decision'] == 'field')
+
+        flags = pd.DataFrame({
+            'team': long['team'],
+            'season': long['season'],
+            'played': 1,
+            'won': won.astype(int),
+            'toss_won': toss_won.astype(int),
+            'won_toss_and_match': (won & toss_won).astype(int),
+            'bat_first_matches': bat_first.astype(int),
+            'bat_first_wins': (bat_first & won).astype(int),
+            'field_first_matches': field_first.astype(int),
+            'field_first_wins': (field_first & won).astype(int),
+            'target_runs': long['target_runs']
+        })
+        grouped = flags.groupby(['team', 'season'])
+        matrix = grouped[['played', 'won', 'toss_won', 'won_toss_and_match', 'bat_first_matches',
+                          'bat_first_wins', 'field_first_matches', 'field_first_wins']].sum()
+        runs = grouped['target_runs'].agg(['max', 'min', 'sum', 'count'])
+        matrix[['runs_max', 'runs_min', 'runs_sum', 'runs_count']] = runs
+        return matrix.sort_index()
+
+
+class SQLiteMatchStore:
+    # File-backed backend built locally from the CSV; filters and aggregates run as SQL
+    def __init__(self, db_path="ipl_matches.sqlite"):
+        self.db_path = db_path
+        self.local = threading.local()
+
+    def connection(self):
+        # sqlite3 connections are per-thread; the API server calls in from a worker pool
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            self.local.conn = conn
+        return conn
+
+    def build(self, source, data_version, standardize, chunksize=50000):
+        conn = self.connection()
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        if row is not None and row[0] == data_version:
+            return
+
+        conn.execute("DROP TABLE IF EXISTS matches")
+        # Streamed in chunks so building never needs the whole archive in memory
+        for chunk in source.chunks(chunksize):
+            chunk = standardize(chunk)
+            chunk['match_date'] = pd.to_datetime(chunk['date'], dayfirst=True, errors='coerce').dt.strftime('%Y-%m-%d')
+            chunk.to_sql("matches", conn, if_exists="append", index=False)
+        for column in ("team1", "team2", "winner", "season", "match_date"):
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_matches_{column} ON matches ({column})")
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('data_version', ?)", (data_version,))
+        conn.commit()
+
+    def query(self, sql, params=()):
+        return pd.read_sql_query(sql, self.connection(), params=params)
+
+    def matches(self, season="All", team=None, opponent=None, columns=None):
+        clauses = []
+        params = []
+        if season != "All":
+            clauses.append("season = ?")
+            params.append(season)
+        if team is not None and opponent is not None:
+            clauses.append("((team1 = ? AND team2 = ?) OR (team1 = ? AND team2 = ?))")
+            params.extend([team, opponent, opponent, team])
+        elif team is not None:
+            clauses.append("(team1 = ? OR team2 = ?)")
+            params.extend([team, team])
+        select = ", ".join(f'"{c}"' for c in columns) if columns else "*"
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        result = self.query(f"SELECT {select} FROM matches{where} ORDER BY rowid", params)
+        return result.drop(columns=['match_date']) if columns is None else result
+
+    def coded(self, season="All", columns=None):
+        return self.matches(season, columns=columns)
+
+    def seasons(self):
+        return self.query("SELECT DISTINCT season FROM matches WHERE season IS NOT NULL ORDER BY season")['season'].tolist()
+
+    def meeting_counts(self, team1, team2, season="All"):
+        sql = ("SELECT COUNT(*), TOTAL(winner = ?), TOTAL(winner = ?), AVG(CASE WHEN team1 = ? THEN target_runs END) FROM matches "
+               "WHERE ((team1 = ? AND team2 = ?) OR (team1 = ? AND team2 = ?))")
+        params = [team1, team2, team1, team1, team2, team2, team1]
+        if season != "All":
+            sql += " AND season = ?"
+            params.append(season)
+        total, team1_wins, team2_wins, avg_runs = self.connection().execute(sql, params).fetchone()
+        return {
+            'total': total,
+            'team1_wins': int(team1_wins),
+            'team2_wins': int(team2_wins),
+            'avg_runs_team1': (np.nan if avg_runs is None else float(avg_runs)) if total else 0.0
+        }
+
+    def last_meeting_winner(self, team1, team2):
+        rows = self.connection().execute(
+            "SELECT winner FROM matches WHERE (team1 = ? AND team2 = ?) OR (team1 = ? AND team2 = ?) "
+            "ORDER BY match_date DESC LIMIT 1", (team1, team2, team2, team1)).fetchall()
+        if not rows:
+            return "No matches played"
+        return rows[0][0] if rows[0][0] is not None else "No Result"
+
+    def team_season_matrix(self):
+        def count(condition):
+            return f"SUM(CASE WHEN {condition} THEN 1 ELSE 0 END)"
+
+        matrix = self.query(f"""
+            SELECT team, season, COUNT(*) AS played,
+                   {count("winner = team")} AS won,
+                   {count("toss_winner = team")} AS toss_won,
+                   {count("winner = team AND toss_winner = team")} AS won_toss_and_match,
+                   {count("toss_winner = team AND toss_decision = 'bat'")} AS bat_first_matches,
+                   {count("toss_winner = team AND toss_decision = 'bat' AND winner = team")} AS bat_first_wins,
+                   {count("toss_winner = team AND toss_decision = 'field'")} AS field_first_matches,
+                   {count("toss_winner = team AND toss_decision = 'field' AND winner = team")} AS field_first_wins,
+                   MAX(target_runs) AS runs_max, MIN(target_runs) AS runs_min,
+                   TOTAL(target_runs) AS runs_sum, COUNT(target_runs) AS runs_count
+            FROM (SELECT team1 AS team, season, winner, toss_winner, toss_decision, target_runs FROM matches
+                  UNION ALL
+                  SELECT team2 AS team, season, winner, toss_winner, toss_decision, target_runs FROM matches)
+            WHERE team IS NOT NULL
+            GROUP BY team, season
+            ORDER BY team, season""")
+        return matrix.set_index(['team', 'season'])
+
+
+class ArrayMatchStore:
+    # Compact backend: one NumPy structured record per match. Text columns are small integer codes into per-column
+    # vocabularies (all team columns share one, so winner == team1 compares codes), dates are int32 days, runs and
+    # margins int16 with -1 for missing, overs float32. Filters and aggregates run on the codes; only the rows a
+    # caller asks for are decoded back into a DataFrame
+    team_columns = ('team1', 'team2', 'winner', 'toss_winner')
+    date_columns = ('date',)
+
+    def __init__(self, matches_df):
+        self.columns = list(matches_df.columns)
+        self.vocab = {}
+        # Float columns stored as int16/int32 decode back to float, with -1 as NaN
+        self.float_columns = {column for column in self.columns if matches_df[column].dtype.kind == 'f'}
+        fields = []
+        values = {}
+        if any(column in matches_df for column in self.team_columns):
+            teams = pd.concat([matches_df[column] for column in self.team_columns if column in matches_df])
+            self.vocab['team'] = pd.Index(teams.dropna().unique())
+        for column in self.columns:
+            series = matches_df[column]
+            if column in self.date_columns:
+                days = pd.to_datetime(series, dayfirst=True, errors='coerce').to_numpy().astype('datetime64[D]')
+                values[column] = np.where(np.isnat(days), np.iinfo(np.int32).min, days.astype(np.int64)).astype(np.int32)
+            elif pd.api.types.is_numeric_dtype(series):
+                numbers = series.to_numpy(dtype=float)
+                present = numbers[~np.isnan(numbers)]
+                whole = len(present) and np.all(present == np.round(present)) and present.min() >= 0
+                # -1 marks a missing value, so only non-negative whole numbers are stored as small integers; negative
+                # or very large whole numbers stay exact (int64, or float64 with NaN) rather than collide or round
+                if whole and present.max() < 2 ** 15:
+                    values[column] = np.where(np.isnan(numbers), -1, numbers).astype(np.int16)
+                elif whole and present.max() < 2 ** 31:
+                    values[column] = np.where(np.isnan(numbers), -1, numbers).astype(np.int32)
+                elif len(present) and np.all(present == np.round(present)):
+                    values[column] = numbers if column in self.float_columns else series.to_numpy(dtype=np.int64)
+                else:
+                    values[column] = numbers.astype(np.float32)
+            else:
+                vocab = self.vocab['team'] if column in self.team_columns else pd.Index(series.dropna().unique())
+                self.vocab.setdefault(column, vocab)
+                dtype = np.int8 if len(vocab) < 2 ** 7 else np.int16 if len(vocab) < 2 ** 15 else np.int32
+                values[column] = vocab.get_indexer(series).astype(dtype)
+            fields.append((column, values[column].dtype))
+        self.rows = np.empty(len(matches_df), dtype=fields)
+        for column in self.columns:
+            self.rows[column] = values[column]
+
+    @property
+    def bytes_per_match(self):
+        return self.rows.dtype.itemsize
+
+    def code(self, column, value):
+        vocab = self.vocab['team'] if column in self.team_columns else self.vocab[column]
+        return vocab.get_loc(value) if value in vocab else -2
+
+    def decode(self, rows, columns, coded=False):
+        # coded=True keeps text columns as categoricals over the stored codes and dates as datetime64
+        decoded = {}
+        for column in columns:
+            codes = rows[column]
+            if column in self.date_columns:
+                days = np.where(codes == np.iinfo(np.int32).min, np.datetime64('NaT'), codes.astype('datetime64[D]'))
+                decoded[column] = days if coded else pd.Series(days).dt.strftime('%d-%m-%Y').to_numpy()
+            elif column in self.vocab or column in self.team_columns:
+                vocab = self.vocab['team'] if column in self.team_columns else self.vocab[column]
+                if coded:
+                    decoded[column] = pd.Categorical.from_codes(codes.astype(np.int64), categories=vocab)
+                    continue
+                # -1 (missing) picks the trailing NaN
+                decoded[column] = np.append(vocab.to_numpy(dtype=object), np.nan)[codes]
+            elif codes.dtype.kind == 'i' and column in self.float_columns:
+                decoded[column] = np.where(codes < 0, np.nan, codes)
+            elif codes.dtype.kind == 'f':
+                # float32 -> float64 without the float32 noise (9.2 stays 9.2)
+                decoded[column] = np.round(codes.astype(np.float64), 4)
+            else:
+                decoded[column] = codes.astype(np.int64)
+        return decoded
+
+    def mask(self, season="All", team=None, opponent=None):
+        rows = self.rows
+        mask = np.ones(len(rows), dtype=bool)
+        if season != "All":
+            mask &= rows['season'] == self.code('season', season)
+        if team is not None and opponent is not None:
+            a, b = self.code('team1', team), self.code('team1', opponent)
+            mask &= ((rows['team1'] == a) & (rows['team2'] == b)) | ((rows['team1'] == b) & (rows['team2'] == a))
+        elif team is not None:
+            a = self.code('team1', team)
+            mask &= (rows['team1'] == a) | (rows['team2'] == a)
+        return mask
+
+    def matches(self, season="All", team=None, opponent=None, columns=None):
+        mask = self.mask(season, team, opponent)
+        index = np.flatnonzero(mask)
+        return pd.DataFrame(self.decode(self.rows[index], columns or self.columns), index=index,
+                            columns=columns or self.columns)
+
+    def coded(self, season="All", columns=None):
+        # Same rows as matches(), but text stays as codes (pandas categoricals sharing this store's vocabularies)
+        index = np.flatnonzero(self.mask(season))
+        return pd.DataFrame(self.decode(self.rows[index], columns or self.columns, coded=True), index=index,
+                            columns=columns or self.columns)
+
+    def seasons(self):
+        return sorted(self.vocab['season'].tolist())
+
+    def meeting_counts(self, team1, team2, season="All"):
+        rows = self.rows[self.mask(season, team1, team2)]
+        a, b = self.code('team1', team1), self.code('team1', team2)
+        runs = self.decode(rows[rows['team1'] == a], ['target_runs'])['target_runs'].astype(float)
+        runs = runs[~np.isnan(runs)]
+        return {
+            'total': len(rows),
+            'team1_wins': int(np.count_nonzero(rows['winner'] == a)),
+            'team2_wins': int(np.count_nonzero(rows['winner'] == b)),
+            'avg_runs_team1': (float(runs.mean()) if len(runs) else np.nan) if len(rows) else 0.0
+        }
+
+    def last_meeting_winner(self, team1, team2):
+        rows = self.rows[self.mask(team=team1, opponent=team2)]
+        if len(rows) == 0:
+            return "No matches played"
+        winner = rows['winner'][np.argmax(rows['date'])]
+        return self.vocab['team'][winner] if winner >= 0 else "No Result"
+
+    def team_season_matrix(self):
+        rows = self.rows
+        n_seasons = len(self.vocab['season'])
+        team = np.concatenate([rows['team1'], rows['team2']]).astype(np.int64)
+        season = np.tile(rows['season'].astype(np.int64), 2)
+        winner = np.tile(rows['winner'], 2)
+        toss_winner = np.tile(rows['toss_winner'], 2)
+        decision = np.tile(rows['toss_decision'], 2)
+        runs = np.tile(rows['target_runs'], 2).astype(float)
+        runs[runs < 0] = np.nan
+
+        valid = (team >= 0) & (season >= 0)
+        key = (team * n_seasons + season)[valid]
+        size = len(self.vocab['team']) * n_seasons
+        won = (winner == team)[valid]
+        toss_won = (toss_winner == team)[valid]
+        bat_first = toss_won & (decision[valid] == self.code('toss_decision', 'bat'))
+        field_first = toss_won & (decision[valid] == self.code('toss_decision', 'field'))
+
+        def total(flags):
+            return np.bincount(key, weights=flags, minlength=size)
+
+        runs = runs[valid]
+        has_runs = ~np.isnan(runs)
+        runs_max = np.full(size, -np.inf)
+        runs_min = np.full(size, np.inf)
+        np.maximum.at(runs_max, key[has_runs], runs[has_runs])
+        np.minimum.at(runs_min, key[has_runs], runs[has_runs])
+        columns = {
+            'played': total(np.ones(len(key))),
+            'won': total(won),
+            'toss_won': total(toss_won),
+            'won_toss_and_match': total(won & toss_won),
+            'bat_first_matches': total(bat_first),
+            'bat_first_wins': total(bat_first & won),
+            'field_first_matches': total(field_first),
+            'field_first_wins': total(field_first & won),
+        }
+        present = columns['played'] > 0
+        matrix = pd.DataFrame({name: values[present].astype(np.int64) for name, values in columns.items()},
+                              index=pd.MultiIndex.from_arrays([
+                                  self.vocab['team'][np.flatnonzero(present) // n_seasons],
+                                  self.vocab['season'][np.flatnonzero(present) % n_seasons]], names=['team', 'season']))
+        matrix['runs_max'] = np.where(np.isinf(runs_max), np.nan, runs_max)[present]
+        matrix['runs_min'] = np.where(np.isinf(runs_min), np.nan, runs_min)[present]
+        matrix['runs_sum'] = np.bincount(key[has_runs], weights=runs[has_runs], minlength=size)[present]
+        matrix['runs_count'] = np.bincount(key[has_runs], minlength=size)[present].astype(np.int64)
+        return matrix.sort_index()
+
+
+def parse_schedule_dates(dates):
+    # "22-Mar-25", with day-first dates of any other spelling as a fallback
+    parsed = pd.to_datetime(dates, format='%d-%b-%y', errors='coerce')
+    return parsed.fillna(pd.to_datetime(dates, dayfirst=True, errors='coerce', format='mixed'))
+
+
+class ScheduleIndex:
+    # Fixtures sorted by start time, so day, range and next-N lookups are binary searches
+    def __init__(self, schedule_df):
+        dates = parse_schedule_dates(schedule_df['Date'])
+        times = pd.to_datetime(schedule_df['Start'], format='%I:%M %p', errors='coerce')
+        starts = dates + (times - times.dt.normalize()).fillna(pd.Timedelta(0))
+        valid = starts.notna().to_numpy()
+        # Rows left out of the index, kept for callers to report
+        self.skipped = [{'match_no': match_no, 'reason': "unreadable date or start time"}
+                        for match_no in schedule_df.loc[~valid, 'Match No']]
+        order = np.argsort(starts.to_numpy()[valid], kind='stable')
+        fixtures = schedule_df[valid].iloc[order]
+        self.starts = starts.to_numpy()[valid][order].astype('datetime64[m]')
+        self.days = self.starts.astype('datetime64[D]').astype(str).tolist()
+        self.columns = {name: fixtures[column].astype(object).where(fixtures[column].notna(), None).to_numpy()
+                        for name, column in (('match_no', 'Match No'), ('start', 'Start'), ('home', 'Home'),
+                                             ('away', 'Away'), ('venue', 'Venue'))}
+
+    def rows(self, lo, hi):
+        columns = self.columns
+        return [{
+            'match_no': int(columns['match_no'][i]),
+            'date': self.days[i],
+            'start': columns['start'][i],
+            'home': columns['home'][i],
+            'away': columns['away'][i],
+            'venue': columns['venue'][i]
+        } for i in range(lo, min(hi, len(self.starts)))]
+
+    def position(self, when, side='left'):
+        return int(np.searchsorted(self.starts, np.datetime64(pd.Timestamp(when), 'm'), side=side))
+
+    def on(self, day):
+        day = pd.Timestamp(day).normalize()
+        return self.rows(self.position(day), self.position(day + pd.Timedelta(days=1)))
+
+    def between(self, start, end):
+        # Inclusive of both days
+        start = pd.Timestamp(start).normalize()
+        end = pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+        return self.rows(self.position(start), self.position(end))
+
+    def upcoming(self, after, n=5):
+        lo = self.position(after)
+        return self.rows(lo, lo + n)
+
+    def last_year(self):
+        return int(self.starts[-1].astype('datetime64[Y]').astype(int) + 1970) if len(self.starts) else None
+
+
+class PlayerSearchIndex:
+    # Sorted (key, name) pairs for every name token, so a prefix is a bisect; difflib catches typos
+    def __init__(self, players):
+        entries = set()
+        for name in players:
+            lowered = name.lower()
+            entries.add((lowered, name))
+            for token in lowered.split()[1:]:
+                entries.add((token, name))
+        entries = sorted(entries)
+        self.keys = [key for key, _ in entries]
+        self.names = [name for _, name in entries]
+        self.full_names = sorted({name.lower(): name for name in players}.items())
+        self.last = ("", 0, len(self.keys))
+
+    def prefix_range(self, prefix):
+        # A query that extends the previous one only has to search inside the previous range
+        last_query, lo, hi = self.last
+        if not prefix.startswith(last_query):
+            lo, hi = 0, len(self.keys)
+        lo = bisect.bisect_left(self.keys, prefix, lo, hi)
+        hi = bisect.bisect_left(self.keys, prefix + "\uffff", lo, hi)
+        self.last = (prefix, lo, hi)
+        return lo, hi
+
+    def search(self, query, limit=20):
+        query = " ".join(query.lower().split())
+        if not query:
+            return [name for _, name in self.full_names[:limit]]
+        lo, hi = self.prefix_range(query)
+        # Names that start with the query rank above surname matches; ranked over the whole range before cutting to limit
+        starts, others = {}, {}
+        for i in range(lo, hi):
+            name = self.names[i]
+            (starts if name.lower().startswith(query) else others)[name] = None
+        results = (list(starts) + [name for name in others if name not in starts])[:limit]
+        if not results:
+            lowered = difflib.get_close_matches(query, [key for key, _ in self.full_names], n=limit, cutoff=0.6)
+            names = dict(self.full_names)
+            results = [names[key] for key in lowered]
+        return results
+
+
+class Leaderboards:
+    # Top-K per (metric, season) kept sorted; sync() only re-places entries whose value changed
+    def __init__(self, k=10):
+        self.k = k
+        self.values = {}
+        self.tops = {}
+        # Group ('players' / 'teams') -> data version its boards were last synced to
+        self.synced = {}
+
+    def sync(self, board, values):
+        # values: name -> value, in tie-break order (earlier ranks first on equal values)
+        entries = self.values.get(board)
+        if entries is None:
+            self.values[board] = {name: (value, order) for order, (name, value) in enumerate(values.items())}
+            self.refill(board)
+            return
+        for name in set(entries) - set(values.index):
+            self.remove(board, name)
+        for order, (name, value) in enumerate(values.items()):
+            if entries.get(name) != (value, order):
+                self.update(board, name, value, order)
+
+    def refill(self, board):
+        keys = ((-value, order, name) for name, (value, order) in self.values[board].items())
+        self.tops[board] = heapq.nsmallest(self.k, keys)
+
+    def remove(self, board, name):
+        value, order = self.values[board].pop(name)
+        top = self.tops[board]
+        key = (-value, order, name)
+        i = bisect.bisect_left(top, key)
+        if i < len(top) and top[i] == key:
+            # Whatever ranked K+1 moves up
+            self.refill(board)
+
+    def update(self, board, name, value, order):
+        if name in self.values[board]:
+            self.remove(board, name)
+        self.values[board][name] = (value, order)
+        top = self.tops[board]
+        key = (-value, order, name)
+        if len(top) < self.k or key < top[-1]:
+            bisect.insort(top, key)
+            del top[self.k:]
+
+    def top(self, board, n=None):
+        return [(name, -value) for value, _, name in self.tops.get(board, [])[:n]]
+
+
+class SharedColumnStore:
+    # Column arrays of several frames packed into one shared-memory block; text columns are stored as
+    # int32 codes plus their labels, so worker processes attach with a small manifest instead of a pickled frame
+    def __init__(self, block, layout, categories, owner):
+        self.block = block
+        self.layout = layout
+        self.categories = categories
+        self.owner = owner
+
+    @classmethod
+    def create(cls, frames):
+        arrays = []
+        categories = {}
+        for frame_name, df in frames.items():
+            for column in df.columns:
+                series = df[column]
+                if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+                    array = series.to_numpy()
+                else:
+                    codes, labels = pd.factorize(series)
+                    array = codes.astype(np.int32)
+                    categories[f"{frame_name}/{column}"] = labels.tolist()
+                arrays.append((frame_name, column, np.ascontiguousarray(array)))
+
+        layout = []
+        offset = 0
+        for frame_name, column, array in arrays:
+            layout.append((frame_name, column, array.dtype.str, len(array), offset))
+            offset += -(-array.nbytes // 8) * 8
+        block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for (frame_name, column, array), (_, _, dtype, length, start) in zip(arrays, layout):
+            np.ndarray(length, dtype=dtype, buffer=block.buf, offset=start)[:] = array
+        store = cls(block, layout, categories, owner=True)
+        atexit.register(store.release)
+        return store
+
+    @classmethod
+    def attach(cls, manifest):
+        try:
+            block = shared_memory.SharedMemory(name=manifest['name'], track=False)
+        except TypeError:
+            # Before Python 3.13 there is no track flag; pool workers share the parent's resource tracker,
+            # so the extra registration is harmless and the owner's unlink still clears it
+            block = shared_memory.SharedMemory(name=manifest['name'])
+        return cls(block, manifest['layout'], manifest['categories'], owner=False)
+
+    @property
+    def manifest(self):
+        return {'name': self.block.name, 'layout': self.layout, 'categories': self.categories}
+
+    def columns(self, frame_name):
+        # Zero-copy views; text columns come back as codes (-1 for missing)
+        return {column: np.ndarray(length, dtype=dtype, buffer=self.block.buf, offset=start)
+                for name, column, dtype, length, start in self.layout if name == frame_name}
+
+    def frame(self, frame_name):
+        data = {}
+        for column, array in self.columns(frame_name).items():
+            labels = self.categories.get(f"{frame_name}/{column}")
+            data[column] = array if labels is None else pd.Categorical.from_codes(array, labels).astype(object)
+        return pd.DataFrame(data, copy=False)
+
+    def release(self):
+        if self.block is None:
+            return
+        self.block.close()
+        if self.owner:
+            try:
+                self.block.unlink()
+            except FileNotFoundError:
+                pass
+        self.block = None
+
+
+# Set in each pool worker by attach_shared_columns
+worker_columns = None
+
+
+def attach_shared_columns(manifest):
+    global worker_columns
+    worker_columns = SharedColumnStore.attach(manifest)
+
+
+def overs_to_balls(overs):
+    # Cricket overs notation: "261.1" is 261 overs and 1 ball, not a decimal fraction
+    if len(overs) == 0:
+        return np.zeros(0)
+    # An all-missing column partitions into a single column, so pin all three
+    text = pd.Series(overs, dtype=object).astype(str).str.strip().str.partition('.').reindex(columns=range(3))
+    whole = pd.to_numeric(text[0], errors='coerce')
+    extra = pd.to_numeric(text[2], errors='coerce').fillna(0)
+    return (whole * 6 + extra).to_numpy(dtype=float)
+
+
+def runs_and_balls(values):
+    # "2245/261.1" -> (2245, 1567)
+    if len(values) == 0:
+        return np.zeros(0), np.zeros(0)
+    text = pd.Series(values, dtype=object).astype(str).str.partition('/').reindex(columns=range(3))
+    return pd.to_numeric(text[0], errors='coerce').to_numpy(dtype=float), overs_to_balls(text[2])
+
+
+def net_run_rate(runs_scored, balls_faced, runs_conceded, balls_bowled):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        nrr = 6 * runs_scored / balls_faced - 6 * runs_conceded / balls_bowled
+    return np.where((balls_faced > 0) & (balls_bowled > 0), nrr, 0)
+
+
+class StandingsCube:
+    # Running per-team totals after every league match of a season (matches sorted by date); row 0 is the empty
+    # table, so the standings after any match or on any date are a single row lookup
+    stats = ('played', 'won', 'lost', 'no_result', 'runs_scored', 'balls_faced', 'runs_conceded', 'balls_bowled', 'estimated')
+    columns = ['date', 'match_type', 'team1', 'team2', 'toss_winner', 'toss_decision', 'winner', 'result',
+               'result_margin', 'target_runs', 'target_overs']
+    # Balls used by a winning chase are not recorded: assume 2% of the quota is left per wicket in hand, which
+    # fits the official For/Against totals best across all seasons. NRR built on such a chase is flagged as
+    # estimated; it is still the only NRR known at that point of the season, so it orders the table
+    chase_share_per_wicket = 0.02
+
+    team_columns = ('team1', 'team2', 'winner', 'toss_winner')
+
+    def __init__(self, matches, teams, season):
+        matches = matches[matches['match_type'] == 'League']
+        codes, labels = self.team_codes(matches)
+        # Teams that played this season, current franchises first in their usual order
+        played = np.concatenate([codes['team1'], codes['team2']])
+        playing = set(labels[np.unique(played[played >= 0])])
+        self.teams = [team for team in teams if team in playing] + sorted(playing.difference(teams))
+        self.season = season
+        dates = pd.to_datetime(matches['date'], dayfirst=True, errors='coerce').to_numpy().astype('datetime64[D]')
+        order = np.argsort(dates, kind='stable')
+        self.dates = dates[order]
+        matches = matches.iloc[order]
+        codes = {column: values[order] for column, values in codes.items()}
+
+        # Label code -> column of the table (NaN for none); the trailing entry catches missing (-1) codes
+        lookup = np.full(len(labels) + 1, np.nan)
+        lookup[labels.get_indexer(self.teams)] = np.arange(len(self.teams))
+
+        n = len(matches)
+        innings = self.innings(matches, codes)
+        batting_first = lookup[innings['batting_first'].to_numpy()]
+        chasing = lookup[innings['chasing'].to_numpy()]
+        winner = lookup[codes['winner']]
+        no_result = matches['result'].eq('no result').to_numpy()
+        decided = ~np.isnan(winner)
+        loser = np.where(winner == batting_first, chasing, batting_first)
+        counted = innings['counted'].to_numpy()
+
+        rows = np.arange(n)
+        per_match = {stat: np.zeros((n, len(self.teams))) for stat in self.stats}
+
+        def add(stat, team, values, mask=True):
+            mask = mask & ~np.isnan(team)
+            np.add.at(per_match[stat], (rows[mask], team[mask].astype(int)), np.broadcast_to(values, n)[mask])
+
+        for team in (batting_first, chasing):
+            add('played', team, 1)
+            add('no_result', team, 1, no_result)
+            add('estimated', team, 1, innings['estimated'].to_numpy())
+        add('won', winner, 1)
+        add('lost', loser, 1, decided)
+        for team, other, side in ((batting_first, chasing, 'first'), (chasing, batting_first, 'second')):
+            add('runs_scored', team, innings[f'{side}_runs'].to_numpy(), counted)
+            add('balls_faced', team, innings[f'{side}_balls'].to_numpy(), counted)
+            add('runs_conceded', other, innings[f'{side}_runs'].to_numpy(), counted)
+            add('balls_bowled', other, innings[f'{side}_balls'].to_numpy(), counted)
+
+        self.totals = {stat: np.vstack([np.zeros((1, len(self.teams))), values.cumsum(axis=0)])
+                       for stat, values in per_match.items()}
+
+    @classmethod
+    def team_codes(cls, matches):
+        # The team columns as integer codes into one shared label index, -1 for missing. Categorical columns
+        # (ArrayMatchStore.coded) already share their categories, so their codes are used without decoding
+        if all(isinstance(matches[column].dtype, pd.CategoricalDtype) for column in cls.team_columns):
+            return ({column: matches[column].cat.codes.to_numpy(dtype=np.int64) for column in cls.team_columns},
+                    matches['team1'].cat.categories)
+        codes, labels = pd.factorize(pd.concat([matches[column].astype(object) for column in cls.team_columns], ignore_index=True))
+        return dict(zip(cls.team_columns, np.split(codes.astype(np.int64), len(cls.team_columns)))), pd.Index(labels)
+
+    @classmethod
+    def innings(cls, matches, codes):
+        # Both innings of each match as runs and balls. The data only records the chase target (first innings + 1)
+        # and its overs quota, so the chase is rebuilt from the result:
+        #   lost by runs   -> target - 1 - margin off the full quota (all out counts as the full quota)
+        #   tie            -> target - 1 off the full quota
+        #   won by wickets -> the target, off an estimated share of the quota
+        # On a revised (D/L) target the first innings counts as target - 1 off the chase quota, as in the playing
+        # conditions. No-result matches do not count towards net run rate.
+        # Sides are team codes from team_codes(); a missing team (-1) never equals another
+        result = matches['result']
+        decision = matches['toss_decision']
+        team1, team2, winner, toss_winner = (codes[column] for column in cls.team_columns)
+
+        def other(team):
+            return np.where((team == team1) & (team1 >= 0), team2, team1)
+
+        toss_bat = np.select([decision.eq('bat').to_numpy(), decision.eq('field').to_numpy()], [toss_winner, other(toss_winner)], -1)
+        batting_first = np.select(
+            [result.eq('runs').to_numpy(), result.eq('wickets').to_numpy()],
+            [winner, other(winner)],
+            np.where(toss_bat >= 0, toss_bat, team1))
+        chasing = other(batting_first)
+
+        target = matches['target_runs'].to_numpy(dtype=float)
+        balls = overs_to_balls(matches['target_overs'])
+        margin = matches['result_margin'].fillna(0).to_numpy(dtype=float)
+        second_runs = np.select([result.eq('runs'), result.eq('wickets')], [target - 1 - margin, target], target - 1)
+        second_balls = np.where(result.eq('wickets'), np.ceil(balls * (1 - cls.chase_share_per_wicket * margin)), balls)
+        return pd.DataFrame({
+            'batting_first': batting_first,
+            'chasing': chasing,
+            'first_runs': target - 1,
+            'first_balls': balls,
+            'second_runs': second_runs,
+            'second_balls': second_balls,
+            'counted': ~result.eq('no result').to_numpy() & ~np.isnan(target) & ~np.isnan(balls),
+            'estimated': result.eq('wickets').to_numpy() & ~np.isnan(target) & ~np.isnan(balls)
+        }, index=matches.index)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def position(self, when):
+        # Number of matches played on or before the given date
+        return int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(when), 'D'), side='right'))
+
+    def table(self, after=None):
+        i = len(self) if after is None else after
+        totals = {stat: values[i] for stat, values in self.totals.items()}
+        nrr = net_run_rate(totals['runs_scored'], totals['balls_faced'], totals['runs_conceded'], totals['balls_bowled'])
+
+        won = totals['won'].astype(int)
+        points_table = pd.DataFrame({
+            'year': self.season,
+            'team': self.teams,
+            'matchs played': totals['played'].astype(int),
+            'Won': won,
+            'Lost': totals['lost'].astype(int),
+            'Net Run Rate': np.round(nrr, 3),
+            'points': won * 2 + totals['no_result'].astype(int),
+            'nrr_estimated': totals['estimated'] > 0,
+            'source': 'computed'
+        })
+        # Only results up to this match decide places: points, then NRR, then wins (team name keeps it stable)
+        points_table = points_table.sort_values(by=['points', 'Net Run Rate', 'Won', 'team'], ascending=[False, False, False, True])
+        points_table['pos'] = range(1, len(points_table) + 1)
+        return points_table
+
+    def date_after(self, i):
+        return None if i == 0 or pd.isna(self.dates[i - 1]) else str(self.dates[i - 1])
+
+
+def read_csv_source(path, source, chunksize=None):
+    # Compressed files (.gz, .zst, .bz2, .xz) are detected from the suffix
+    return pd.read_csv(path, chunksize=chunksize, **source.options)
+
+
+def read_parquet_source(path, source, chunksize=None):
+    frame = pd.read_parquet(path, **source.options)
+    return frame if chunksize is None else iter([frame])
+
+
+def read_sqlite_source(path, source, chunksize=None):
+    conn = sqlite3.connect(path)
+    query = source.query or f'SELECT * FROM "{source.table or source.name}"'
+    if chunksize is None:
+        try:
+            return pd.read_sql_query(query, conn)
+        finally:
+            conn.close()
+
+    def chunks():
+        try:
+            yield from pd.read_sql_query(query, conn, chunksize=chunksize)
+        finally:
+            conn.close()
+    return chunks()
+
+
+class DataSource:
+    # One dataset: a path or glob (matching files are read in name order and stacked) and the reader for it,
+    # picked from the file suffix unless named; register() plugs in readers for other formats
+    readers = {'csv': read_csv_source, 'parquet': read_parquet_source, 'sqlite': read_sqlite_source}
+    suffixes = {'.csv': 'csv', '.gz': 'csv', '.zst': 'csv', '.bz2': 'csv', '.xz': 'csv',
+                '.parquet': 'parquet', '.pq': 'parquet', '.sqlite': 'sqlite', '.db': 'sqlite'}
+
+    def __init__(self, name, path, reader=None, table=None, query=None, **options):
+        self.name = name
+        self.path = path
+        self.reader = reader
+        self.table = table
+        self.query = query
+        self.options = options
+
+    @classmethod
+    def from_config(cls, name, config):
+        # A bare path, or a dict of the constructor arguments
+        return cls(name, config) if isinstance(config, str) else cls(name, **config)
+
+    @classmethod
+    def register(cls, name, reader, suffixes=()):
+        cls.readers[name] = reader
+        for suffix in suffixes:
+            cls.suffixes[suffix] = name
+
+    def files(self):
+        # A plain path that does not exist is kept, so reading it raises FileNotFoundError
+        return sorted(glob.glob(self.path)) or [self.path]
+
+    def reader_for(self, path):
+        name = self.reader or self.suffixes.get(os.path.splitext(path)[1].lower())
+        if name not in self.readers:
+            raise ValueError(f"No reader for {path}")
+        return self.readers[name]
+
+    def read(self):
+        frames = [self.reader_for(path)(path, self) for path in self.files()]
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def chunks(self, chunksize):
+        for path in self.files():
+            yield from self.reader_for(path)(path, self, chunksize)
+
+    def fingerprint(self):
+        return ";".join(f"{path}:{os.stat(path).st_size}:{os.stat(path).st_mtime_ns}" for path in self.files())
+
+
+# Data and aggregates behind every section, kept free of Tk so the GUI and the JSON server share them
+def source_version():
+    # Hash of this module: a snapshot written by any other version of the code is ignored
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def frame_to_arrays(frame):
+    # A DataFrame as a JSON spec plus one plain array per column (text as strings with a missing mask), or None
+    # when it holds anything else
+    default_index = isinstance(frame.index, pd.RangeIndex) and frame.index.start == 0 and frame.index.step == 1
+    flat = frame if default_index else frame.reset_index()
+    spec = {'columns': [], 'index': None if default_index else [list(flat.columns[:frame.index.nlevels]), list(frame.index.names)]}
+    arrays = []
+    for column in flat.columns:
+        series = flat[column]
+        if not isinstance(column, str) or isinstance(series.dtype, pd.CategoricalDtype):
+            return None
+        if series.dtype.kind in 'biufM':
+            values = series.to_numpy()
+            if values.dtype == object:
+                return None
+            arrays.append(values)
+        else:
+            missing = series.isna().to_numpy()
+            if not all(isinstance(value, str) for value in series[~missing]):
+                return None
+            arrays += [series.where(~missing, "").to_numpy(dtype=str), missing]
+        spec['columns'].append({'name': column, 'dtype': str(series.dtype), 'text': series.dtype.kind not in 'biufM'})
+    return spec, arrays
+
+
+def arrays_to_frame(spec, arrays):
+    arrays = iter(arrays)
+    data = {}
+    for column in spec['columns']:
+        values = next(arrays)
+        if column['text']:
+            values = pd.Series(values.astype(object)).where(~next(arrays), np.nan)
+        data[column['name']] = pd.Series(values).astype(column['dtype'])
+    frame = pd.DataFrame(data)
+    if spec['index'] is not None:
+        columns, names = spec['index']
+        frame = frame.set_index(columns)
+        frame.index.names = names
+    return frame
+
+
+class AggregateCache:
+    # Least recently used aggregates are dropped past max_entries and rebuilt if asked for again; inserts counts
+    # every build so the prefetcher can measure how much of the cache a batch has used
+    def __init__(self, max_entries=600):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.inserts = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self.entries:
+                return default
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            self.inserts += 1
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def update(self, items):
+        for key, value in items.items():
+            self.put(key, value)
+
+    def items(self):
+        with self.lock:
+            return list(self.entries.items())
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __getitem__(self, key):
+        return self.entries[key]
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class IPLDataCore:
+    def __init__(self, backend="pandas", db_path="ipl_matches.sqlite", load=True, sources=None, max_aggregates=600):
+        self.backend = backend
+        self.max_aggregates = max_aggregates
+        self.db_path = db_path
+        self.team_name_map = {
+            "Chennai Super Kings": ["Chennai Super Kings", "CSK"],
+            "Mumbai Indians": ["Mumbai Indians", "MI"],
+            "Royal Challengers Bengaluru": ["Royal Challengers Bangalore", "Royal Challengers Bengaluru", "RCB"],
+            "Kolkata Knight Riders": ["Kolkata Knight Riders", "KKR"],
+            "Delhi Capitals": ["Delhi Capitals", "Delhi Daredevils", "DC", "DD"],
+            "Sunrisers Hyderabad": ["Sunrisers Hyderabad", "SRH"],
+            "Punjab Kings": ["Punjab Kings", "Kings XI Punjab", "PBKS", "KXIP"],
+            "Rajasthan Royals": ["Rajasthan Royals", "RR"],
+            "Gujarat Titans": ["Gujarat Titans", "GT"],
+            "Lucknow Super Giants": ["Lucknow Super Giants", "LSG"]
+        }
+        self.teams = list(self.team_name_map.keys())
+        # Franchises no longer playing; the official tables use their abbreviations
+        self.former_team_map = {
+            "Deccan Chargers": ["Deccan Chargers", "DEC"],
+            "Kochi Tuskers Kerala": ["Kochi Tuskers Kerala", "KTK"],
+            "Pune Warriors": ["Pune Warriors", "PWI"],
+            "Gujarat Lions": ["Gujarat Lions", "GL"],
+            "Rising Pune Supergiant": ["Rising Pune Supergiant", "Rising Pune Supergiants", "RPS"]
+        }
+        # Grounds that were renamed or are spelled differently across seasons
+        self.venue_name_map = {
+            "Arun Jaitley Stadium": ["Feroz Shah Kotla"],
+            "Narendra Modi Stadium": ["Sardar Patel Stadium"],
+            "M Chinnaswamy Stadium": ["M.Chinnaswamy Stadium"],
+            "Punjab Cricket Association IS Bindra Stadium": ["Punjab Cricket Association Stadium"],
+            "Rajiv Gandhi International Stadium": ["Rajiv Gandhi Intl Stadium"],
+            "Bharat Ratna Shri Atal Bihari Vajpayee Ekana Cricket Stadium": ["Ekana Stadium"],
+            "Dr. Y.S. Rajasekhara Reddy ACA-VDCA Cricket Stadium": ["ACA-VDCA Stadium"],
+            "Barsapara Cricket Stadium": ["ACA Stadium"],
+            "Zayed Cricket Stadium": ["Sheikh Zayed Stadium"],
+            "Maharaja Yadavindra Singh International Cricket Stadium": ["New Chandigarh"]
+        }
+        self.city_name_map = {
+            "Bengaluru": ["Bangalore"],
+            "Dharamshala": ["Dharamsala"]
+        }
+        # Dataset -> path, glob or reader settings (see DataSource); sources overrides any of them
+        self.data_sources = {
+            'schedule': 'IPL_2025_Match_Schedule_Full.csv',
+            'matches': 'ipl_all_matches (1).csv',
+            'players': 'Player_Performance (1).csv',
+            'points': 'points_table_historic (1).csv'
+        }
+        self.data_sources.update(sources or {})
+        self.sources = {name: DataSource.from_config(name, config) for name, config in self.data_sources.items()}
+        self.datasets = {}
+        self.dataset_lock = threading.RLock()
+        self.elo = None
+        self.elo_lock = threading.Lock()
+        self.boards = Leaderboards()
+        self.boards_lock = threading.Lock()
+        self.shared_store = None
+        self.shared_lock = threading.Lock()
+        # Leaderboard metric -> Player_Performance column; strike rate needs a minimum of balls faced
+        self.player_metrics = {'runs': 'Runs', 'strike_rate': 'SR', 'sixes': '6s', 'fours': '4s'}
+        self.min_balls_for_strike_rate = 60
+        # Official NRRs are printed to three decimals
+        self.nrr_tolerance = 0.0005
+        if load:
+            self.load_data()
+
+    def load_data(self):
+        # Only the file fingerprints are read here; each dataset loads when a section first needs it
+        try:
+            with self.dataset_lock:
+                self.data_version = self.compute_data_version()
+                self.aggregates = AggregateCache(self.max_aggregates)
+                self.datasets = {}
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            raise
+
+    def dataset(self, name):
+        with self.dataset_lock:
+            if name not in self.datasets:
+                try:
+                    self.datasets[name] = self.read_dataset(name)
+                except Exception as e:
+                    print(f"Error loading {name} data: {e}")
+                    raise
+            return self.datasets[name]
+
+    def read_dataset(self, name):
+        source = self.sources[name]
+        if name == 'matches':
+            if self.backend == "sqlite":
+                store = SQLiteMatchStore(self.db_path)
+                store.build(source, self.data_version, self.standardize_matches)
+                return store
+            if self.backend == "numpy":
+                return ArrayMatchStore(self.standardize_matches(source.read()))
+            return PandasMatchStore(self.standardize_matches(source.read()))
+        frame = source.read()
+        if name == 'players':
+            return self.standardize_players(frame)
+        if name == 'points':
+            frame['team'] = frame['team'].apply(self.standardize_team_name)
+        elif name == 'schedule':
+            frame['Home'] = frame['Home'].apply(self.standardize_team_name)
+            frame['Away'] = frame['Away'].apply(self.standardize_team_name)
+        return frame
+
+    @property
+    def store(self):
+        return self.dataset('matches')
+
+    @property
+    def schedule_df(self):
+        return self.dataset('schedule')
+
+    @property
+    def players_df(self):
+        return self.dataset('players')
+
+    @property
+    def points_df(self):
+        return self.dataset('points')
+
+    @property
+    def players(self):
+        return self.get_aggregate('player_names', lambda: self.players_df['Player'].dropna().unique().tolist())
+
+    @property
+    def seasons(self):
+        return self.get_aggregate('seasons', lambda: ['All'] + self.store.seasons())
+
+    def attach_frames(self, matches_df, players_df, data_version):
+        # Serve already standardized frames (a pool worker's shared columns) instead of reading the files
+        self.data_version = data_version
+        self.aggregates = AggregateCache(self.max_aggregates)
+        self.datasets = {'matches': PandasMatchStore(matches_df), 'players': players_df}
+        return self
+
+    def compute_data_version(self):
+        # Size + mtime of every input file; changes whenever the data on disk does
+        fingerprint = hashlib.sha1()
+        for source in self.sources.values():
+            fingerprint.update(f"{source.name}={source.fingerprint()};".encode())
+        return fingerprint.hexdigest()[:16]
+
+    def standardize_team_name(self, name):
+        if pd.isna(name):
+            return name
+        for name_map in (self.team_name_map, self.former_team_map):
+            for std_name, variations in name_map.items():
+                if name in variations:
+                    return std_name
+        return name
+
+    def team_abbreviation(self, team):
+        for name_map in (self.team_name_map, self.former_team_map):
+            for variation in name_map.get(team, []):
+                if variation.isupper():
+                    return variation
+        return team
+
+    def standardize_matches(self, matches_df):
+        matches_df['team1'] = matches_df['team1'].apply(self.standardize_team_name)
+        matches_df['team2'] = matches_df['team2'].apply(self.standardize_team_name)
+        matches_df['winner'] = matches_df['winner'].apply(self.standardize_team_name)
+        matches_df['toss_winner'] = matches_df['toss_winner'].apply(self.standardize_team_name)
+        # A season file holding only "2008" parses as numbers; "2007/08" style labels keep them all text
+        matches_df['season'] = matches_df['season'].where(matches_df['season'].isna(), matches_df['season'].astype(str))
+        return matches_df
+
+    def standardize_players(self, players_df):
+        # HS "87*" -> 87 plus a not-out flag; Avg is "-" for batters never dismissed
+        high_scores = players_df['HS'].astype(str).str.strip()
+        players_df['HS_not_out'] = high_scores.str.endswith('*')
+        players_df['HS'] = pd.to_numeric(high_scores.str.rstrip('*'), errors='coerce')
+        players_df['Avg'] = pd.to_numeric(players_df['Avg'], errors='coerce')
+        return players_df
+
+    @property
+    def matches_df(self):
+        # Full match table; with the SQLite backend this reads every row, so sections use store queries instead
+        return self.store.matches()
+
+    def save_snapshot(self, path, charts=None, filters=None):
+        # An .npz of plain arrays with a JSON manifest keyed by the data fingerprint and code version. Only data
+        # frames and JSON values are kept; cubes, indexes, ratings and leaderboards are rebuilt on demand
+        arrays = {}
+        entries = []
+        for (version, name), value in self.aggregates.items():
+            if version != self.data_version:
+                continue
+            entry = {'name': list(name) if isinstance(name, tuple) else name}
+            if isinstance(value, pd.DataFrame):
+                packed = frame_to_arrays(value)
+                if packed is None:
+                    continue
+                entry['frame'], columns = packed
+                arrays.update({f"a{len(entries)}_{i}": column for i, column in enumerate(columns)})
+            else:
+                try:
+                    if json.loads(json.dumps(value)) != value:
+                        continue
+                except (TypeError, ValueError):
+                    continue
+                entry['value'] = value
+            entries.append(entry)
+        charts = dict(charts or {})
+        arrays.update({f"chart{i}": np.frombuffer(data, dtype=np.uint8) for i, data in enumerate(charts.values())})
+        manifest = {'code_version': source_version(), 'data_version': self.data_version, 'aggregates': entries,
+                    'charts': list(charts), 'filters': filters or {}}
+        arrays['manifest'] = np.array(json.dumps(manifest))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing snapshot: {e}")
+
+    def load_snapshot(self, path):
+        # Returns the saved charts and filters, or None when the snapshot is missing, from other code or unreadable.
+        # Nothing is unpickled; aggregates are used only when the data fingerprint still matches
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                manifest = json.loads(str(archive['manifest']))
+                if manifest.get('code_version') != source_version():
+                    return None
+                filters = {key: value for key, value in manifest['filters'].items() if isinstance(value, str)}
+                if manifest['data_version'] != self.data_version:
+                    return {'charts': {}, 'filters': filters}
+                aggregates = {}
+                for i, entry in enumerate(manifest['aggregates']):
+                    name = tuple(entry['name']) if isinstance(entry['name'], list) else entry['name']
+                    if 'frame' in entry:
+                        count = sum(2 if column['text'] else 1 for column in entry['frame']['columns'])
+                        value = arrays_to_frame(entry['frame'], [archive[f"a{i}_{j}"] for j in range(count)])
+                    else:
+                        value = entry['value']
+                    aggregates[(self.data_version, name)] = value
+                charts = {key: archive[f"chart{i}"].tobytes() for i, key in enumerate(manifest['charts'])}
+        except Exception as e:
+            print(f"Error reading snapshot: {e}")
+            return None
+        self.aggregates.update(aggregates)
+        return {'charts': charts, 'filters': filters}
+
+    def get_aggregate(self, name, build):
+        # Aggregates are built once per data version (load_data resets the store) and kept while recently used
+        key = (self.data_version, name)
+        missing = object()
+        value = self.aggregates.get(key, missing)
+        if value is missing:
+            value = build()
+            self.aggregates.put(key, value)
+        return value
+
+    def view(self, section, *args):
+        # Section view models memoized like aggregates, so states warmed by the prefetcher are served as-is
+        return self.get_aggregate(('view', section, args), lambda: getattr(self, section)(*args))
+
+    def get_season_matches(self, season="All", columns=None):
+        return self.store.matches(season, columns=columns)
+
+    def calculate_points_table(self, season="All"):
+        # Final row of the season's standings cube, or the official table once it covers every computed match
+        # (official tables also count washed-out games the match data lacks); callers copy before changing it
+        def build():
+            table = self.standings_cube(season).table()
+            official = self.official_standings(season)
+            if len(official) and official['matchs played'].sum() >= table['matchs played'].sum():
+                return official
+            return table
+        return self.get_aggregate(('points_table', season), build)
+
+    def standings_cube(self, season="All"):
+        return self.get_aggregate(('standings', season),
+                                  lambda: StandingsCube(self.store.coded(season, StandingsCube.columns), self.teams, season))
+
+    def official_run_rates(self):
+        # The historic table's For/Against totals as runs and balls, with NRR recomputed from them
+        def build():
+            official = self.points_df[['year', 'team', 'Net Run Rate']].copy()
+            official['runs_scored'], official['balls_faced'] = runs_and_balls(self.points_df['For'])
+            official['runs_conceded'], official['balls_bowled'] = runs_and_balls(self.points_df['Against'])
+            official['nrr_from_totals'] = np.round(net_run_rate(
+                official['runs_scored'], official['balls_faced'], official['runs_conceded'], official['balls_bowled']), 3)
+            return official
+        return self.get_aggregate('official_run_rates', build)
+
+    def season_years(self):
+        # Official tables are keyed by the year played: "2007/08" is 2008 but "2020/21" is 2020
+        def build():
+            matches = self.get_season_matches(columns=['season', 'date'])
+            years = pd.to_datetime(matches['date'], dayfirst=True, errors='coerce').dt.year
+            return {season: int(year) for season, year in years.groupby(matches['season']).min().dropna().items()}
+        return self.get_aggregate('season_years', build)
+
+    def official_standings(self, season):
+        year = self.season_years().get(season)
+        official = self.points_df[self.points_df['year'] == year]
+        return official.assign(year=season, source='official')[['year', 'team', 'matchs played', 'Won', 'Lost', 'Net Run Rate',
+                                                                'points', 'pos', 'source']].sort_values('pos')
+
+    def reconcile_standings(self):
+        # Final standings computed from the match data alone (no official positions or totals go into them) joined
+        # once against the official tables; one row per mismatch
+        def build():
+            years = self.season_years()
+            seasons = [season for season, year in years.items() if year in set(self.points_df['year'])]
+            computed = pd.concat([self.standings_cube(season).table().assign(year=years[season]) for season in seasons],
+                                 ignore_index=True)
+            computed['team'] = computed['team'].map(self.standardize_team_name)
+            official = self.points_df[self.points_df['year'].isin([years[season] for season in seasons])]
+            joined = computed.merge(official, on=['year', 'team'], how='outer', suffixes=('', '_official'))
+            joined['season'] = joined['year'].map({year: season for season, year in years.items()})
+
+            # Every field is compared, NRR included; rows flag whether the computed NRR rests on estimated chase overs
+            fields = {'pos': 0, 'matchs played': 0, 'Won': 0, 'Lost': 0, 'Net Run Rate': self.nrr_tolerance, 'points': 0}
+            estimated = joined['nrr_estimated'].fillna(False).astype(bool)
+            frames = []
+            for field, tolerance in fields.items():
+                differs = ~((joined[field] - joined[f'{field}_official']).abs() <= tolerance)
+                frames.append(pd.DataFrame({
+                    'season': joined['season'][differs],
+                    'team': joined['team'][differs],
+                    'field': field,
+                    'computed': joined[field][differs],
+                    'official': joined[f'{field}_official'][differs],
+                    'nrr_estimated': estimated[differs]
+                }))
+            mismatches = pd.concat(frames, ignore_index=True).sort_values(['season', 'team'], kind='stable')
+            nrr_error = (joined['Net Run Rate'] - joined['Net Run Rate_official']).abs()
+            return {'seasons': seasons, 'teams_checked': len(joined), 'nrr_estimated': int(estimated.sum()),
+                    'nrr_mean_abs_diff': round(float(nrr_error.mean()), 3), 'mismatches': mismatches.reset_index(drop=True)}
+        return self.get_aggregate('reconcile_standings', build)
+
+    def standings_check(self):
+        report = self.reconcile_standings()
+        mismatches = report['mismatches']
+        return {
+            'seasons': report['seasons'],
+            'teams_checked': report['teams_checked'],
+            'nrr_estimated': report['nrr_estimated'],
+            'nrr_mean_abs_diff': report['nrr_mean_abs_diff'],
+            'mismatches_by_field': mismatches['field'].value_counts().to_dict(),
+            'mismatches': mismatches.to_dict('records')
+        }
+
+    def playback_frames(self, season, start=1):
+        # Streams one frame per league match (standings, win % per team, running season runs); every stage is
+        # a lookup in the season's cumulative totals, so frames are produced as fast as they are drawn
+        cube = self.standings_cube(season)
+        runs = cube.totals['runs_scored'].sum(axis=1)
+        rows = ((i, {stat: values[i] for stat, values in cube.totals.items()}) for i in range(start, len(cube) + 1))
+        for i, totals in rows:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                win_pct = np.where(totals['played'] > 0, 100 * totals['won'] / totals['played'], 0)
+            yield {'matches': i, 'as_of': cube.date_after(i), 'table': self.standings_after(season, i), 'win_pct': win_pct,
+                   'runs': runs[1:i + 1]}
+
+    def standings_after(self, season, i):
+        # The last step is the season's points table (official where it covers the season), so the first view,
+        # the slider and playback all end on the same table
+        cube = self.standings_cube(season)
+        return self.calculate_points_table(season) if i >= len(cube) else cube.table(i)
+
+    def standings_rows(self, points_table):
+        return [{
+            'pos': int(row['pos']),
+            'team': row['team'],
+            'played': int(row['matchs played']),
+            'won': int(row['Won']),
+            'lost': int(row['Lost']),
+            'nrr': float(row['Net Run Rate']),
+            'nrr_estimated': bool(row.get('nrr_estimated', False)),
+            'points': int(row['points'])
+        } for _, row in points_table.iterrows()]
+
+    def standings_as_of(self, season, date):
+        cube = self.standings_cube(season)
+        i = cube.position(date)
+        table = self.standings_after(season, i)
+        return {'season': season, 'matches': i, 'as_of': cube.date_after(i), 'source': table['source'].iloc[0] if len(table) else 'computed',
+                'table': self.standings_rows(table)}
+
+    def standings_race(self, season):
+        # One frame per match, all read from the same cumulative totals
+        cube = self.standings_cube(season)
+        tables = ((i, self.standings_after(season, i)) for i in range(1, len(cube) + 1))
+        return [{'matches': i, 'as_of': cube.date_after(i), 'source': table['source'].iloc[0] if len(table) else 'computed',
+                 'table': self.standings_rows(table)} for i, table in tables]
+
+    def points_table(self, season="All"):
+        return self.standings_rows(self.calculate_points_table(season))
+
+    def home_summary(self, season="All"):
+        season_matches = self.get_season_matches(season, ['target_runs'])
+        total_runs = season_matches['target_runs'].sum()
+        avg_runs = season_matches['target_runs'].mean() if not season_matches['target_runs'].empty else 0
+        runs_variance = season_matches['target_runs'].var() if not season_matches['target_runs'].empty else 0
+
+        team_success = dict(self.leaderboards('win_pct').top(('win_pct', season), 5))
+
+        return {
+            'season': season,
+            'total_matches': len(season_matches),
+            'total_runs': float(total_runs),
+            'avg_runs': float(avg_runs),
+            'runs_variance': float(runs_variance),
+            'top_teams_by_win_pct': team_success
+        }
+
+    def head_to_head(self, team1, team2, season="All"):
+        # Counted by the store on its own columns; both tests only depend on these counts
+        counts = self.store.meeting_counts(team1, team2, season)
+        total_matches = counts['total']
+        team1_wins = counts['team1_wins']
+        team2_wins = counts['team2_wins']
+        avg_runs_team1 = counts['avg_runs_team1']
+
+        # Statistical Tests
+        team1_wins_binary = np.repeat([1, 0], [team1_wins, total_matches - team1_wins])
+        team2_wins_binary = np.repeat([1, 0], [team2_wins, total_matches - team2_wins])
+        t_stat, p_val = ttest_ind(team1_wins_binary, team2_wins_binary, equal_var=False)
+        # Rows: won by team1 (no/yes), columns: won by team2 (no/yes); outcomes that never occur are dropped
+        contingency_table = np.array([[total_matches - team1_wins - team2_wins, team2_wins], [team1_wins, 0]])
+        contingency_table = contingency_table[np.ix_(contingency_table.sum(axis=1) > 0, contingency_table.sum(axis=0) > 0)]
+        if contingency_table.size == 0 or contingency_table.shape[0] <= 1 or contingency_table.shape[1] <= 1:
+            chi2 = 0
+        else:
+            chi2, _, _, _ = chi2_contingency(contingency_table)
+
+        team1_totals = self.team_totals(team1, season)
+        team2_totals = self.team_totals(team2, season)
+        team1_matches = int(team1_totals['played'])
+        team1_total_wins = int(team1_totals['won'])
+        team2_matches = int(team2_totals['played'])
+        team2_total_wins = int(team2_totals['won'])
+        team1_runs = self.store.matches(season, team1, columns=['target_runs'])['target_runs'].dropna()
+        team2_runs = self.store.matches(season, team2, columns=['target_runs'])['target_runs'].dropna()
+
+        return {
+            'team1': team1,
+            'team2': team2,
+            'season': season,
+            'total_matches': total_matches,
+            'team1_wins': team1_wins,
+            'team2_wins': team2_wins,
+            'no_result': total_matches - team1_wins - team2_wins,
+            'avg_runs_team1': float(avg_runs_team1),
+            't_stat': float(t_stat),
+            'p_val': float(p_val),
+            'chi2': float(chi2),
+            'team1_matches': team1_matches,
+            'team1_total_wins': team1_total_wins,
+            'team2_matches': team2_matches,
+            'team2_total_wins': team2_total_wins,
+            'team1_runs': team1_runs.tolist(),
+            'team2_runs': team2_runs.tolist(),
+            'last_match_winner': self.get_last_match_winner(team1, team2)
+        }
+
+    def get_last_match_winner(self, team1, team2):
+        return self.store.last_meeting_winner(team1, team2)
+
+    def team_season_matrix(self):
+        return self.get_aggregate('team_season_matrix', self.store.team_season_matrix)
+
+    def team_totals(self, team, season="All"):
+        matrix = self.team_season_matrix()
+        if team not in matrix.index.get_level_values('team'):
+            return pd.Series(0, index=matrix.columns)
+        team_seasons = matrix.loc[team]
+        return (team_seasons if season == "All" else team_seasons[team_seasons.index == season]).sum()
+
+    def team_performance(self, team, season="All"):
+        reports = self.team_performance_all(season)
+        if team in reports:
+            return reports[team]
+        # Former franchises are built on demand; a name that never played is an error, not a zero report
+        if team not in self.team_season_matrix().index.get_level_values('team'):
+            raise LookupError(f"unknown team {team!r}")
+        return self.build_team_performance(season, [team])[team]
+
+    def team_performance_all(self, season="All"):
+        # Every franchise's report comes out of one pass, so the GUI and exports share it
+        return self.get_aggregate(('team_performance', season), lambda: self.build_team_performance(season))
+
+    def build_team_performance(self, season="All", teams=None):
+        teams = list(teams or self.teams)
+        matrix = self.team_season_matrix()
+        matrix = matrix[matrix.index.get_level_values('team').isin(teams)]
+        rows = matrix if season == "All" else matrix[matrix.index.get_level_values('season') == season]
+        by_team = rows.groupby(level='team')
+        totals = by_team.sum().reindex(teams, fill_value=0)
+
+        played = totals['played']
+        has_played = played > 0
+        max_score = by_team['runs_max'].max().reindex(teams).where(has_played, 0)
+        min_score = by_team['runs_min'].min().reindex(teams).where(has_played, 0)
+        avg_runs = (totals['runs_sum'] / totals['runs_count'].where(totals['runs_count'] > 0)).where(has_played, 0)
+        win_percentage = (totals['won'] / played.where(has_played) * 100).fillna(0)
+
+        # Welch t-test of wins per season, earlier half of each team's seasons against the later half
+        wins = matrix['won'].reset_index()
+        season_rank = wins.groupby('team').cumcount()
+        season_count = wins.groupby('team')['season'].transform('size')
+        later = season_rank >= season_count // 2
+        first = wins[~later].groupby('team')['won'].agg(['size', 'mean', 'var']).reindex(teams)
+        second = wins[later].groupby('team')['won'].agg(['size', 'mean', 'var']).reindex(teams)
+        n1, n2 = first['size'], second['size']
+        vn1, vn2 = first['var'] / n1, second['var'] / n2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = (first['mean'] - second['mean']) / np.sqrt(vn1 + vn2)
+            dof = (vn1 + vn2) ** 2 / (vn1 ** 2 / (n1 - 1) + vn2 ** 2 / (n2 - 1))
+        # As in scipy: zero variances leave the degrees of freedom undefined, which does not change the p-value
+        dof = dof.where(dof.notna() | (vn1 + vn2).isna(), 1)
+        p_val = pd.Series(2 * t_dist.sf(np.abs(t_stat), dof), index=teams)
+        both_halves = (n1 > 0) & (n2 > 0)
+        t_stat = t_stat.where(both_halves, 0)
+        p_val = p_val.where(both_halves, 1)
+
+        # Won match vs won toss as 2x2 tables, chi-square with Yates' correction like chi2_contingency
+        both = totals['won_toss_and_match']
+        observed = np.stack([
+            played - totals['won'] - totals['toss_won'] + both, totals['toss_won'] - both,
+            totals['won'] - both, both
+        ], axis=1).reshape(-1, 2, 2).astype(float)
+        row_sums = observed.sum(axis=2, keepdims=True)
+        col_sums = observed.sum(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            expected = row_sums * col_sums / observed.sum(axis=(1, 2), keepdims=True)
+            diff = expected - observed
+            corrected = observed + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+            chi2 = ((corrected - expected) ** 2 / expected).sum(axis=(1, 2))
+        # An empty row or column is dropped by crosstab, leaving no 2x2 table to test
+        full_table = (row_sums.min(axis=(1, 2)) > 0) & (col_sums.min(axis=(1, 2)) > 0)
+        chi2 = np.where(full_table, chi2, 0)
+
+        batting_win_pct = (totals['bat_first_wins'] / totals['bat_first_matches'].where(totals['bat_first_matches'] > 0) * 100).fillna(0)
+        bowling_win_pct = (totals['field_first_wins'] / totals['field_first_matches'].where(totals['field_first_matches'] > 0) * 100).fillna(0)
+
+        season_win_pct = matrix['won'] / matrix['played'] * 100
+        wins_by_season = {team: {} for team in teams}
+        win_pct_by_season = {team: {} for team in teams}
+        for (team, s), won, pct in zip(matrix.index, matrix['won'], season_win_pct):
+            wins_by_season[team][s] = int(won)
+            win_pct_by_season[team][s] = float(pct)
+
+        return {team: {
+            'team': team,
+            'season': season,
+            'max_score': float(max_score[team]),
+            'min_score': float(min_score[team]),
+            'win_pct': float(win_percentage[team]),
+            'avg_runs': float(avg_runs[team]),
+            't_stat': float(t_stat[team]),
+            'p_val': float(p_val[team]),
+            'chi2': float(chi2[i]),
+            'wins_by_season': wins_by_season[team],
+            'batting_first_win_pct': float(batting_win_pct[team]),
+            'bowling_first_win_pct': float(bowling_win_pct[team]),
+            'win_pct_by_season': win_pct_by_season[team]
+        } for i, team in enumerate(teams)}
+
+    def player_performance(self, player):
+        player_data = self.players_df[self.players_df['Player'] == player]
+        if not player_data.empty:
+            runs = player_data['Runs'].iloc[0]
+            strike_rate = player_data['SR'].iloc[0]
+            fours = player_data['4s'].iloc[0]
+            sixes = player_data['6s'].iloc[0]
+        else:
+            runs = strike_rate = fours = sixes = 0
+
+        top_scorers = [runs for _, runs in self.leaderboards('runs').top(('runs', 'All'), 10)]
+        top_scorer_runs = top_scorers[0]
+        other_scorers_runs = top_scorers[1:]
+        t_stat, p_val = ttest_ind(np.full(len(other_scorers_runs), top_scorer_runs), other_scorers_runs, equal_var=False) if len(other_scorers_runs) > 0 else (0, 1)
+        contingency_table = pd.crosstab(self.players_df['Runs'] > self.players_df['Runs'].median(), self.players_df['SR'] > self.players_df['SR'].median())
+        if contingency_table.size > 0 and contingency_table.shape[0] > 1 and contingency_table.shape[1] > 1:
+            chi2, chi2_p = chi2_contingency(contingency_table)[:2]
+        else:
+            chi2, chi2_p = 0, 1
+
+        top_batsmen = self.leaderboards('runs').top(('runs', 'All'), 5)
+        top_scorer = self.players_df[self.players_df['Player'] == top_batsmen[0][0]].iloc[0]
+        avg_text = f"{top_scorer['Avg']:.2f}" if pd.notna(top_scorer['Avg']) else "-"
+
+        return {
+            'player': player,
+            'runs': float(runs),
+            'strike_rate': float(strike_rate),
+            'fours': float(fours),
+            'sixes': float(sixes),
+            't_stat': float(t_stat),
+            'p_val': float(p_val),
+            'chi2': float(chi2),
+            'top_scorer': {
+                'Player': top_scorer['Player'],
+                'Runs': int(top_scorer['Runs']),
+                'SR': float(top_scorer['SR']),
+                'Avg': avg_text,
+                '4s': int(top_scorer['4s']),
+                '6s': int(top_scorer['6s']),
+                '0s': int(top_scorer.get('0s', 0))
+            },
+            'top_batsmen': [{'Player': name, 'Runs': int(runs)} for name, runs in top_batsmen]
+        }
+
+    def build_season_trend_aggregates(self):
+        matches = self.get_season_matches(columns=['season', 'target_runs', 'toss_decision', 'toss_winner', 'winner'])
+        runs = matches[['season', 'target_runs']].dropna()
+        runs_by_season = matches.groupby('season')['target_runs'].sum()
+
+        # Box plot statistics per season (Tukey whiskers at 1.5 IQR, as seaborn draws them)
+        quartiles = runs.groupby('season')['target_runs'].quantile([0.25, 0.5, 0.75]).unstack()
+        quartiles.columns = ['q1', 'med', 'q3']
+        iqr = quartiles['q3'] - quartiles['q1']
+        limits = pd.DataFrame({'lower': quartiles['q1'] - 1.5 * iqr, 'upper': quartiles['q3'] + 1.5 * iqr})
+        bounds = runs.join(limits, on='season')
+        within = (bounds['target_runs'] >= bounds['lower']) & (bounds['target_runs'] <= bounds['upper'])
+        inside = bounds[within]
+        outside = bounds[~within]
+        quartiles['whislo'] = inside.groupby('season')['target_runs'].min()
+        quartiles['whishi'] = inside.groupby('season')['target_runs'].max()
+        fliers = outside.groupby('season')['target_runs'].agg(list)
+
+        toss_won_match = (matches['toss_winner'] == matches['winner']).astype(float)
+        toss_decision = toss_won_match.groupby([matches['toss_decision'], matches['season']]).mean().mul(100).unstack().fillna(0)
+
+        return {
+            'runs_by_season': {s: float(r) for s, r in runs_by_season.items()},
+            'runs_quantiles': [{
+                'season': season,
+                'q1': float(row['q1']),
+                'med': float(row['med']),
+                'q3': float(row['q3']),
+                'whislo': float(row['whislo']),
+                'whishi': float(row['whishi']),
+                'fliers': [float(v) for v in fliers.get(season, [])]
+            } for season, row in quartiles.iterrows()],
+            'toss_win_rate': {decision: {s: float(v) for s, v in row.items()} for decision, row in toss_decision.iterrows()}
+        }
+
+    def season_trends(self):
+        aggregates = self.get_aggregate('season_trends', self.build_season_trend_aggregates)
+
+        projection = self.season_projection()
+        ranked = sorted(projection['teams'].items(), key=lambda item: item[1]['title_pct'], reverse=True)
+        win_probabilities = {team: probs['title_pct'] for team, probs in ranked}
+        playoff_probabilities = {team: probs['playoff_pct'] for team, probs in ranked}
+
+        return {
+            'runs_by_season': aggregates['runs_by_season'],
+            'runs_quantiles': aggregates['runs_quantiles'],
+            'toss_win_rate': aggregates['toss_win_rate'],
+            'projection_season': projection['season'],
+            'win_probabilities': win_probabilities,
+            'playoff_probabilities': playoff_probabilities,
+            'skipped_fixtures': projection['skipped_fixtures']
+        }
+
+    def ratings(self):
+        # The engine outlives data versions: after a reload it is only fed the results it has not seen
+        with self.elo_lock:
+            if self.elo is None or self.elo.data_version != self.data_version:
+                matches = self.get_season_matches(columns=['id', 'date', 'season', 'team1', 'team2', 'winner'])
+                self.elo = (self.elo or EloRatings()).extend(matches)
+                self.elo.data_version = self.data_version
+            return self.elo
+
+    def win_expectation(self, team1, team2):
+        return float(self.ratings().expected(team1, team2) * 100)
+
+    def team_ratings(self):
+        current = self.ratings().current()
+        ranked = sorted(((team, current.get(team, self.ratings().initial)) for team in self.teams), key=lambda item: item[1], reverse=True)
+        return [{'rank': i + 1, 'team': team, 'rating': round(rating, 1)} for i, (team, rating) in enumerate(ranked)]
+
+    def rating_history(self, team):
+        history = self.ratings().history(team)
+        return {
+            'team': team,
+            'dates': history['date'].dt.strftime('%Y-%m-%d').tolist(),
+            'ratings': [round(r, 1) for r in history['rating']]
+        }
+
+    def standardize_venues(self, venues):
+        # Drop the ", City" suffix, then fold renamed grounds onto their current name
+        names = venues.str.split(",").str[0].str.strip()
+        return names.replace({old: new for new, olds in self.venue_name_map.items() for old in olds})
+
+    def standardize_cities(self, cities):
+        return cities.replace({old: new for new, olds in self.city_name_map.items() for old in olds})
+
+    def build_venue_aggregates(self):
+        matches = self.get_season_matches(columns=['date', 'season', 'city', 'venue', 'team1', 'team2', 'toss_winner',
+                                                   'toss_decision', 'winner', 'result', 'target_runs'])
+        matches = matches.assign(venue=self.standardize_venues(matches['venue']),
+                                 city=self.standardize_cities(matches['city']),
+                                 match_date=pd.to_datetime(matches['date'], dayfirst=True, errors='coerce'))
+        decided = matches['winner'].notna() & (matches['result'] != 'no result')
+        other_team = matches['team2'].where(matches['toss_winner'] == matches['team1'], matches['team1'])
+        chaser = matches['toss_winner'].where(matches['toss_decision'] == 'field', other_team.where(matches['toss_decision'] == 'bat'))
+        chase_known = decided & chaser.notna()
+
+        flags = pd.DataFrame({
+            'venue': matches['venue'],
+            'matches': 1,
+            'target_runs': matches['target_runs'],
+            'decided': decided.astype(int),
+            'chase_known': chase_known.astype(int),
+            'chase_won': (chase_known & (matches['winner'] == chaser)).astype(int),
+            'toss_won_match': (decided & (matches['toss_winner'] == matches['winner'])).astype(int),
+            'chose_field': (matches['toss_decision'] == 'field').astype(int)
+        })
+        grouped = flags.groupby('venue')
+        venues = grouped[['matches', 'decided', 'chase_known', 'chase_won', 'toss_won_match', 'chose_field']].sum()
+        venues['avg_target'] = grouped['target_runs'].mean()
+        venues['chase_win_pct'] = venues['chase_won'] / venues['chase_known'].where(venues['chase_known'] > 0) * 100
+        venues['toss_win_pct'] = venues['toss_won_match'] / venues['decided'].where(venues['decided'] > 0) * 100
+        venues['field_first_pct'] = venues['chose_field'] / venues['matches'] * 100
+        latest = matches.sort_values('match_date').groupby('venue').tail(1).set_index('venue')
+        venues['city'] = latest['city']
+        venues['last_season'] = latest['season']
+        venues = venues.sort_values('matches', ascending=False)
+
+        # Team record per ground, both sides of every match in one frame
+        sides = pd.concat([
+            pd.DataFrame({'venue': matches['venue'], 'team': matches[side], 'won': (matches['winner'] == matches[side]).astype(int)})
+            for side in ('team1', 'team2')
+        ])
+        team_records = sides.groupby(['venue', 'team'])['won'].agg(played='size', won='sum')
+        team_records['win_pct'] = team_records['won'] / team_records['played'] * 100
+
+        # A schedule only names the city, so it maps to the ground last used there
+        city_venue = matches.dropna(subset=['city']).sort_values('match_date').groupby('city')['venue'].last()
+
+        return {'venues': venues, 'team_records': team_records, 'city_venue': city_venue}
+
+    def venue_aggregates(self):
+        return self.get_aggregate('venues', self.build_venue_aggregates)
+
+    def venue_row(self, venue, row):
+        return {
+            'venue': venue,
+            'city': None if pd.isna(row['city']) else row['city'],
+            'matches': int(row['matches']),
+            'avg_target': float(row['avg_target']),
+            'chase_win_pct': float(row['chase_win_pct']),
+            'toss_win_pct': float(row['toss_win_pct']),
+            'field_first_pct': float(row['field_first_pct']),
+            'last_season': row['last_season']
+        }
+
+    def venue_summary(self):
+        return [self.venue_row(venue, row) for venue, row in self.venue_aggregates()['venues'].iterrows()]
+
+    def venue_report(self, venue):
+        aggregates = self.venue_aggregates()
+        if venue not in aggregates['venues'].index:
+            raise LookupError(f"unknown venue {venue!r}")
+        records = aggregates['team_records'].loc[venue].sort_values(['won', 'played'], ascending=False)
+        fixtures = [f for f in self.scheduled_fixture_venues() if f['venue'] == venue]
+        return {
+            **self.venue_row(venue, aggregates['venues'].loc[venue]),
+            'team_records': [{'team': team, 'played': int(r['played']), 'won': int(r['won']), 'win_pct': float(r['win_pct'])}
+                             for team, r in records.iterrows()],
+            'fixtures': fixtures
+        }
+
+    def scheduled_fixture_venues(self):
+        # Every schedule row joined to the stats of the ground in its city
+        def build():
+            aggregates = self.venue_aggregates()
+            schedule = self.schedule_df[['Match No', 'Date', 'Start', 'Home', 'Away', 'Venue']]
+            city = self.standardize_cities(schedule['Venue'])
+            joined = schedule.assign(ground=city.map(aggregates['city_venue']), match_date=parse_schedule_dates(schedule['Date'])).join(aggregates['venues'][['avg_target', 'chase_win_pct', 'toss_win_pct']], on='ground')
+            return [{
+                'match_no': int(row['Match No']),
+                'date': None if pd.isna(row['match_date']) else row['match_date'].date().isoformat(),
+                'start': row['Start'],
+                'home': row['Home'],
+                'away': None if pd.isna(row['Away']) else row['Away'],
+                'city': row['Venue'],
+                'venue': None if pd.isna(row['ground']) else row['ground'],
+                'avg_target': None if pd.isna(row['avg_target']) else float(row['avg_target']),
+                'chase_win_pct': None if pd.isna(row['chase_win_pct']) else float(row['chase_win_pct']),
+                'toss_win_pct': None if pd.isna(row['toss_win_pct']) else float(row['toss_win_pct'])
+            } for _, row in joined.iterrows()]
+
+        return self.get_aggregate('scheduled_fixture_venues', build)
+
+    def player_index(self):
+        return self.get_aggregate('player_index', lambda: PlayerSearchIndex(self.players))
+
+    def search_players(self, query, limit=20):
+        return self.player_index().search(query, int(limit))
+
+    def leaderboards(self, metric=None):
+        # Kept across data versions: a reload re-places only the entries whose values moved. Player and team
+        # boards sync separately, so team pages never read the player file
+        groups = ['teams'] if metric == 'win_pct' else ['players'] if metric else ['players', 'teams']
+        with self.boards_lock:
+            if 'players' in groups and self.boards.synced.get('players') != self.data_version:
+                players = self.players_df.dropna(subset=['Player']).drop_duplicates('Player').set_index('Player')
+                for name, column in self.player_metrics.items():
+                    rows = players[players['BF'] >= self.min_balls_for_strike_rate] if name == 'strike_rate' else players
+                    self.boards.sync((name, 'All'), rows[column].dropna().astype(float))
+                self.boards.synced['players'] = self.data_version
+
+            if 'teams' in groups and self.boards.synced.get('teams') != self.data_version:
+                matrix = self.team_season_matrix()
+                for season in self.seasons:
+                    season_rows = matrix if season == "All" else matrix[matrix.index.get_level_values('season') == season]
+                    totals = season_rows.groupby(level='team')[['played', 'won']].sum().reindex(self.teams, fill_value=0)
+                    win_pct = (totals['won'] / totals['played'].where(totals['played'] > 0) * 100).fillna(0)
+                    self.boards.sync(('win_pct', season), win_pct)
+                self.boards.synced['teams'] = self.data_version
+            return self.boards
+
+    def leaderboard(self, metric, season="All", n=10):
+        metrics = list(self.player_metrics) + ['win_pct']
+        if metric not in metrics:
+            raise ValueError(f"unknown metric {metric!r}; expected one of {', '.join(metrics)}")
+        # The player file holds one row per player across seasons, so player boards only exist for "All"
+        seasons = self.seasons if metric == 'win_pct' else ["All"]
+        if season not in seasons:
+            raise ValueError(f"unsupported season {season!r} for {metric}; expected one of {', '.join(seasons)}")
+        n = int(n)
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}")
+        return [{'rank': i + 1, 'name': name, 'value': value}
+                for i, (name, value) in enumerate(self.leaderboards(metric).top((metric, season), n))]
+
+    def shared_columns(self):
+        # One shared-memory copy of matches/players per data version; the previous one is released
+        with self.shared_lock:
+            store, version = self.shared_store or (None, None)
+            if version != self.data_version:
+                if store is not None:
+                    store.release()
+                store = SharedColumnStore.create({'matches': self.store.matches(), 'players': self.players_df})
+                self.shared_store = (store, self.data_version)
+            return store
+
+    def process_pool(self, max_workers=None):
+        # Workers find the match and player columns in worker_columns without anything being pickled
+        return ProcessPoolExecutor(max_workers, initializer=attach_shared_columns, initargs=(self.shared_columns().manifest,))
+
+    def schedule_index(self):
+        return self.get_aggregate('schedule_index', lambda: ScheduleIndex(self.schedule_df))
+
+    def fixtures_on(self, day=None):
+        return self.schedule_index().on(day or datetime.now())
+
+    def upcoming_fixtures(self, n=5, after=None):
+        return self.schedule_index().upcoming(after or datetime.now(), int(n))
+
+    def fixtures_between(self, start, end):
+        return self.schedule_index().between(start, end)
+
+    def season_projection(self):
+        # Seeded from the data version so the same results always give the same table
+        return self.get_aggregate('season_projection', lambda: SeasonSimulator(self, seed=int(self.data_version[:8], 16)).run())
+
+class EloRatings:
+    # Chronological Elo ratings; the per-match timeline lives in flat NumPy arrays and grows as results arrive
+    def __init__(self, k=20.0, initial=1500.0, season_regression=1 / 3):
+        self.k = k
+        self.initial = initial
+        self.season_regression = season_regression
+        self.team_codes = {}
+        self.ratings = np.zeros(0, dtype=np.float64)
+        self.size = 0
+        self.match_id = np.zeros(0, dtype=np.int64)
+        self.date = np.zeros(0, dtype='datetime64[D]')
+        self.team_a = np.zeros(0, dtype=np.int16)
+        self.team_b = np.zeros(0, dtype=np.int16)
+        self.rating_a = np.zeros(0, dtype=np.float32)
+        self.rating_b = np.zeros(0, dtype=np.float32)
+        self.expected_a = np.zeros(0, dtype=np.float32)
+        self.seen_ids = set()
+        self.last_date = None
+        self.last_season = None
+        self.data_version = None
+
+    def code(self, team):
+        if team not in self.team_codes:
+            self.team_codes[team] = len(self.team_codes)
+            self.ratings = np.append(self.ratings, self.initial)
+        return self.team_codes[team]
+
+    def grow(self):
+        capacity = max(2 * len(self.match_id), 256)
+        for name in ('match_id', 'date', 'team_a', 'team_b', 'rating_a', 'rating_b', 'expected_a'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def expected(self, team_a, team_b):
+        rating_a = self.ratings[self.team_codes[team_a]] if team_a in self.team_codes else self.initial
+        rating_b = self.ratings[self.team_codes[team_b]] if team_b in self.team_codes else self.initial
+        return 1 / (1 + 10 ** ((rating_b - rating_a) / 400))
+
+    def update(self, match_id, date, season, team1, team2, winner):
+        # One result: regress towards the mean at a season boundary, then move both teams by K * surprise
+        if self.last_season is not None and season != self.last_season:
+            self.ratings += (self.initial - self.ratings) * self.season_regression
+        self.last_season = season
+
+        a, b = self.code(team1), self.code(team2)
+        expected_a = self.expected(team1, team2)
+        if winner == team1 or winner == team2:
+            delta = self.k * ((1.0 if winner == team1 else 0.0) - expected_a)
+            self.ratings[a] += delta
+            self.ratings[b] -= delta
+
+        if self.size == len(self.match_id):
+            self.grow()
+        i = self.size
+        self.match_id[i] = match_id
+        self.date[i] = np.datetime64(date, 'D')
+        self.team_a[i], self.team_b[i] = a, b
+        self.rating_a[i], self.rating_b[i] = self.ratings[a], self.ratings[b]
+        self.expected_a[i] = expected_a
+        self.size += 1
+        self.seen_ids.add(match_id)
+        self.last_date = date
+
+    def extend(self, matches):
+        # Only results not seen before are applied; anything dated before the last processed match forces a refit
+        matches = matches.assign(match_date=pd.to_datetime(matches['date'], dayfirst=True, errors='coerce'))
+        new = matches[~matches['id'].isin(self.seen_ids) & matches['match_date'].notna()]
+        if new.empty:
+            return self
+        if self.last_date is not None and new['match_date'].min() < self.last_date:
+            fresh = EloRatings(self.k, self.initial, self.season_regression)
+            return fresh.extend(matches)
+        new = new.sort_values(['match_date', 'id'], kind='stable')
+        for row in zip(new['id'], new['match_date'], new['season'], new['team1'], new['team2'], new['winner']):
+            self.update(*row)
+        return self
+
+    def current(self):
+        return {team: float(self.ratings[code]) for team, code in self.team_codes.items()}
+
+    def history(self, team):
+        if team not in self.team_codes:
+            return pd.DataFrame({'date': pd.Series(dtype='datetime64[ns]'), 'rating': pd.Series(dtype=float)})
+        code = self.team_codes[team]
+        team_a = self.team_a[:self.size]
+        as_a = team_a == code
+        rows = as_a | (self.team_b[:self.size] == code)
+        rating = np.where(as_a, self.rating_a[:self.size], self.rating_b[:self.size])[rows]
+        return pd.DataFrame({'date': self.date[:self.size][rows].astype('datetime64[ns]'), 'rating': rating.astype(float)})
+
+
+class SeasonSimulator:
+    # Monte Carlo projection of the rest of the current season from the schedule and team strengths
+    def __init__(self, core, n_sims=20000, seed=None):
+        self.core = core
+        self.n_sims = n_sims
+        self.rng = np.random.default_rng(seed)
+        self.skipped = []
+
+    def current_season(self):
+        return str(self.core.schedule_index().last_year())
+
+    def remaining_fixtures(self, season):
+        schedule = self.core.schedule_df
+        is_league = schedule['Home'].isin(self.core.teams) & schedule['Away'].isin(self.core.teams)
+        league = schedule[is_league]
+
+        # Playoff slots have no away side yet; anything else that is not two known teams is a bad row
+        self.skipped = [{'match_no': int(row['Match No']), 'home': row['Home'], 'away': row['Away'], 'venue': row['Venue']}
+                        for _, row in schedule[~is_league & schedule['Away'].notna()].iterrows()]
+
+        # Each played meeting uses up the pair's earliest scheduled fixture, so rescheduled games still line up
+        played = self.core.get_season_matches(season, ['team1', 'team2'])
+        played_count = {}
+        for a, b in zip(played['team1'], played['team2']):
+            pair = frozenset((a, b))
+            played_count[pair] = played_count.get(pair, 0) + 1
+
+        remaining = []
+        for home, away in zip(league['Home'], league['Away']):
+            pair = frozenset((home, away))
+            if played_count.get(pair, 0) > 0:
+                played_count[pair] -= 1
+            else:
+                remaining.append((home, away))
+        return remaining
+
+    def team_strengths(self):
+        # Elo ratings on the logistic scale, so a strength difference gives the Elo win expectation
+        ratings = self.core.ratings()
+        current = ratings.current()
+        return np.array([current.get(team, ratings.initial) for team in self.core.teams]) * np.log(10) / 400
+
+    def scoring(self):
+        # Average first-innings score and winning margin in runs over the whole history
+        matches = self.core.get_season_matches(columns=['result', 'result_margin', 'target_runs'])
+        return (matches['target_runs'] - 1).mean(), matches.loc[matches['result'] == 'runs', 'result_margin'].mean()
+
+    def run(self):
+        teams = self.core.teams
+        n_teams = len(teams)
+        team_index = {team: i for i, team in enumerate(teams)}
+        season = self.current_season()
+
+        standings = self.core.calculate_points_table(season).set_index('team').reindex(teams)
+        points_now = standings['points'].fillna(0).to_numpy(dtype=float)
+        # Runs and balls so far, from the same match totals as the computed standings
+        cube = self.core.standings_cube(season)
+        totals = {stat: pd.Series(cube.totals[stat][-1], index=cube.teams).reindex(teams, fill_value=0).to_numpy()
+                  for stat in ('runs_scored', 'balls_faced', 'runs_conceded', 'balls_bowled')}
+
+        strengths = self.team_strengths()
+        remaining = self.remaining_fixtures(season)
+        home = np.array([team_index[h] for h, _ in remaining], dtype=np.int64)
+        away = np.array([team_index[a] for _, a in remaining], dtype=np.int64)
+        n = self.n_sims
+
+        # League stage: one row per simulation, one column per remaining fixture
+        home_win_prob = 1 / (1 + np.exp(strengths[away] - strengths[home]))
+        home_wins = self.rng.random((n, len(remaining))) < home_win_prob
+        winners = np.where(home_wins, home, away)
+        losers = np.where(home_wins, away, home)
+        sim_offsets = (np.arange(n) * n_teams)[:, None]
+        wins = np.bincount((winners + sim_offsets).ravel(), minlength=n * n_teams).reshape(n, n_teams)
+        points = points_now + 2 * wins
+
+        # Each remaining match is 20 overs a side: the loser makes the average score and the winner beats it by a
+        # margin drawn from the historic winning margins, added to the current totals for the season's NRR
+        par, mean_margin = self.scoring()
+        won_runs = par + self.rng.exponential(mean_margin, winners.shape)
+
+        def per_team(sides, values):
+            values = np.broadcast_to(values, sides.shape)
+            return np.bincount((sides + sim_offsets).ravel(), values.ravel(), n * n_teams).reshape(n, n_teams)
+
+        balls = 120 * np.bincount(np.concatenate([home, away]), minlength=n_teams)
+        runs_scored = totals['runs_scored'] + per_team(winners, won_runs) + per_team(losers, par)
+        runs_conceded = totals['runs_conceded'] + per_team(winners, par) + per_team(losers, won_runs)
+        nrr = net_run_rate(runs_scored, totals['balls_faced'] + balls, runs_conceded, totals['balls_bowled'] + balls)
+        wins_total = standings['Won'].fillna(0).to_numpy(dtype=float) + wins
+
+        # Points, then net run rate, then wins, as in the computed standings
+        order = np.lexsort((-wins_total, -nrr, -points), axis=1)
+        top4 = order[:, :4]
+
+        def play(a, b):
+            prob = 1 / (1 + np.exp(strengths[b] - strengths[a]))
+            a_wins = self.rng.random(n) < prob
+            return np.where(a_wins, a, b), np.where(a_wins, b, a)
+
+        # IPL playoff bracket
+        q1_winner, q1_loser = play(top4[:, 0], top4[:, 1])
+        elim_winner, _ = play(top4[:, 2], top4[:, 3])
+        q2_winner, _ = play(q1_loser, elim_winner)
+        champion, _ = play(q1_winner, q2_winner)
+
+        playoff_prob = np.bincount(top4.ravel(), minlength=n_teams) / n * 100
+        top2_prob = np.bincount(order[:, :2].ravel(), minlength=n_teams) / n * 100
+        title_prob = np.bincount(champion, minlength=n_teams) / n * 100
+
+        return {
+            'season': season,
+            'simulations': n,
+            'remaining_fixtures': len(remaining),
+            'skipped_fixtures': self.skipped,
+            'teams': {team: {
+                'title_pct': float(title_prob[i]),
+                'playoff_pct': float(playoff_prob[i]),
+                'top2_pct': float(top2_prob[i]),
+                'expected_points': float(points[:, i].mean())
+            } for i, team in enumerate(teams)}
+        }
+
+
+class IPLChartCache:
+    def __init__(self, cache_dir=".chart_cache", max_memory_items=64, max_disk_bytes=64 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+
+    def make_key(self, chart_type, fingerprint, size, theme, fmt):
+        # Content-addressed: identical inputs always map to the same rendered bytes
+        parts = json.dumps([chart_type, fingerprint, list(size), theme, fmt], sort_keys=True)
+        return hashlib.sha256(parts.encode("utf-8")).hexdigest()
+
+    def disk_path(self, key, fmt):
+        return os.path.join(self.cache_dir, f"{key}.{fmt}")
+
+    def get(self, key, fmt):
+        with self.lock:
+            data = self.memory.get(key)
+            if data is not None:
+                self.memory.move_to_end(key)
+                return data
+        path = self.disk_path(key, fmt)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        self.remember(key, data)
+        return data
+
+    def put(self, key, fmt, data):
+        self.remember(key, data)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self.disk_path(key, fmt) + f".{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.disk_path(key, fmt))
+            self.evict_disk()
+        except OSError as e:
+            print(f"Error writing chart cache: {e}")
+
+    def remember(self, key, data):
+        with self.lock:
+            self.memory[key] = data
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.max_memory_items:
+                self.memory.popitem(last=False)
+
+    def evict_disk(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        # Least recently used files go first
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def get_or_render(self, chart_type, fingerprint, size, theme, fmt, render):
+        key = self.make_key(chart_type, fingerprint, size, theme, fmt)
+        data = self.get(key, fmt)
+        if data is None:
+            data = render()
+            self.put(key, fmt, data)
+        return data
+
+
+class IPLChartRenderer:
+    def __init__(self, core, cache=None):
+        self.core = core
+        self.cache = cache or IPLChartCache()
+
+    def fingerprint(self, data):
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            return hashlib.sha1(pd.util.hash_pandas_object(data, index=False).values.tobytes()).hexdigest()
+        return hashlib.sha1(json.dumps(to_json_safe(data), sort_keys=True).encode("utf-8")).hexdigest()
+
+    def render(self, chart_type, data, draw, size=(6, 4), theme=None, fmt="png"):
+        def render_figure():
+            # Plain Agg figure rather than pyplot, so rendering is safe off the Tk thread
+            fig = Figure(figsize=size)
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+            draw(ax, data, theme or {})
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=fmt)
+            return buffer.getvalue()
+
+        return self.cache.get_or_render(chart_type, self.fingerprint(data), size, theme or {}, fmt, render_figure)
+
+    def runs_distribution(self, size=(6, 4), fmt="png"):
+        data = self.core.season_trends()['runs_quantiles']
+
+        def draw(ax, data, theme):
+            stats = [{**row, 'label': row['season']} for row in data]
+            boxes = ax.bxp(stats, patch_artist=True, widths=0.8)
+            for patch, color in zip(boxes['boxes'], sns.color_palette(theme['palette'], len(stats))):
+                patch.set_facecolor(color)
+            ax.set_xlabel('Season')
+            ax.set_ylabel('Runs')
+            ax.set_title('Runs Distribution Across Seasons')
+            ax.tick_params(axis='x', rotation=45)
+
+        return self.render("runs_distribution", data, draw, size, {'palette': 'Set2'}, fmt)
+
+    def runs_violin(self, team, season="All", color="#3498db", size=(6, 4), fmt="png"):
+        data = self.core.store.matches(season, team, columns=['target_runs'])['target_runs'].dropna()
+
+        def draw(ax, data, theme):
+            sns.violinplot(y=data, ax=ax, color=theme['color'])
+            ax.set_title(f'{team} Runs Distribution')
+            ax.set_ylabel('Runs')
+
+        return self.render("runs_violin", data, draw, size, {'team': team, 'color': color}, fmt)
+
+    def rating_trend(self, team, color="#3498db", size=(6, 4), fmt="png"):
+        history = self.core.ratings().history(team)
+
+        def draw(ax, data, theme):
+            ax.plot(data['date'], data['rating'], color=theme['color'], linewidth=1.5)
+            ax.axhline(self.core.ratings().initial, color='grey', linestyle='--', linewidth=0.8)
+            ax.set_xlabel('Date')
+            ax.set_ylabel('Elo Rating')
+            ax.set_title(f'{team} Rating Over Time')
+
+        return self.render("rating_trend", history, draw, size, {'team': team, 'color': color}, fmt)
+
+
+class IPLPrefetcher:
+    # Warms likely next views on one background thread. Each new view replaces the queued work, and a batch stops
+    # at its time budget or once it has built cache_share of the aggregate cache, so warming only ever pushes that
+    # much of what was opened before out of the LRU
+    def __init__(self, core, budget_ms=1500, cache_share=0.25):
+        self.core = core
+        self.budget_ms = budget_ms
+        self.cache_share = cache_share
+        self.generation = 0
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ipl-prefetch")
+        # Windows closed without on_close (or a non-GUI run) still stop the thread at exit
+        atexit.register(self.shutdown)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def submit(self, tasks):
+        # tasks: (callable, *args) tuples, most likely next view first
+        self.generation += 1
+        self.executor.submit(self.run, self.generation, tasks)
+
+    def run(self, generation, tasks):
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        aggregates = self.core.aggregates
+        start, limit = aggregates.inserts, int(aggregates.max_entries * self.cache_share)
+        for task, *args in tasks:
+            if generation != self.generation or time.perf_counter() > deadline or aggregates.inserts - start >= limit:
+                return
+            try:
+                task(*args)
+            except Exception as e:
+                print(f"Error prefetching {getattr(task, '__name__', task)}: {e}")
+
+    def shutdown(self):
+        self.generation += 1
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        atexit.unregister(self.shutdown)
+
+
+class IPLPlaybackPanel:
+    # Win % bars and running season runs that step through a season match by match. Axes are fixed up front and
+    # only the bars and the line are redrawn (blitted) per frame; on_frame lets a page update its own widgets
+    def __init__(self, root, parent, core, season, team_colors, fps=20, on_frame=None, bg="#ffffff"):
+        self.root = root
+        self.core = core
+        self.season = season
+        self.interval = 1000 / fps
+        self.on_frame = on_frame
+        self.frames = None
+        self.job = None
+        self.background = None
+        cube = core.standings_cube(season)
+        self.length = len(cube)
+
+        controls = tk.Frame(parent, bg=bg)
+        controls.pack(fill="x")
+        self.button = tk.Button(controls, text="▶ Play Season", font=("Arial", 11), bg="#004BA0", fg="#ffffff", command=self.toggle)
+        self.button.pack(side="left")
+        self.label = tk.Label(controls, text="", font=("Arial", 11), bg=bg, anchor="w")
+        self.label.pack(side="left", fill="x", expand=True, padx=10)
+
+        self.figure = Figure(figsize=(6, 5))
+        ax_bars, ax_runs = self.figure.subplots(2, 1)
+        positions = np.arange(len(cube.teams))
+        self.bars = ax_bars.bar(positions, np.zeros(len(cube.teams)), animated=True,
+                                color=[team_colors.get(team, '#95a5a6') for team in cube.teams])
+        ax_bars.set_xticks(positions)
+        ax_bars.set_xticklabels([core.team_abbreviation(team) for team in cube.teams], fontsize=8)
+        ax_bars.set_ylim(0, 100)
+        ax_bars.set_ylabel('Win %')
+        total_runs = cube.totals['runs_scored'][-1].sum()
+        (self.line,) = ax_runs.plot([], [], color='#004BA0', linewidth=1.5, animated=True)
+        ax_runs.set_xlim(0, max(self.length, 1))
+        ax_runs.set_ylim(0, max(total_runs, 1) * 1.05)
+        ax_runs.set_xlabel('Match')
+        ax_runs.set_ylabel('Season Runs')
+        self.figure.tight_layout()
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=parent)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas.get_tk_widget().bind("<Destroy>", lambda e: self.stop())
+        self.canvas.mpl_connect('draw_event', self.capture_background)
+        self.show(next(core.playback_frames(season, start=self.length), None), notify=False)
+        self.canvas.draw()
+
+    def capture_background(self, event):
+        # Full redraws (first paint, resizes) leave out the animated artists; keep that as the blit background
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_artists()
+
+    def draw_artists(self):
+        for bar in self.bars:
+            bar.axes.draw_artist(bar)
+        self.line.axes.draw_artist(self.line)
+        self.canvas.blit(self.figure.bbox)
+
+    def show(self, frame, notify=True):
+        if frame is None:
+            return
+        for bar, value in zip(self.bars, frame['win_pct']):
+            bar.set_height(value)
+        self.line.set_data(np.arange(1, frame['matches'] + 1), frame['runs'])
+        if self.background is not None:
+            self.canvas.restore_region(self.background)
+            self.draw_artists()
+        leader = frame['table']['team'].iloc[0] if frame['matches'] else ""
+        self.label.config(text=f"After match {frame['matches']} ({frame['as_of'] or 'start'})  Leader: {leader}")
+        if notify and self.on_frame is not None:
+            self.on_frame(frame)
+
+    def toggle(self):
+        if self.job is not None:
+            self.stop()
+            return
+        if self.frames is None:
+            self.frames = self.core.playback_frames(self.season)
+        self.button.config(text="⏸ Pause")
+        self.tick()
+
+    def tick(self):
+        started = time.perf_counter()
+        frame = next(self.frames, None)
+        if frame is None:
+            self.frames = None
+            self.stop()
+            return
+        self.show(frame)
+        # Time spent drawing comes off the wait, so the frame rate holds steady
+        elapsed = (time.perf_counter() - started) * 1000
+        self.job = self.root.after(max(1, int(self.interval - elapsed)), self.tick)
+
+    def stop(self):
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        if self.button.winfo_exists():
+            self.button.config(text="▶ Play Season")
+
+
 class IPLDashboard:
-    def __init__(self, root):
+    sections = ("home", "team_comparison", "team_performance", "player_performance", "season_trends", "venue_analytics")
+
+    def __init__(self, root, core=None, snapshot_path=None, autosave_ms=300000, start_frame="home", charts=None,
+                 prefetch_budget_ms=1500):
         self.root = root
+        self.core = core
+        self.charts = charts
+        self.prefetch_budget_ms = prefetch_budget_ms
+        self.prefetcher = None
+        self.prefetch_job = None
+        self.snapshot_path = snapshot_path
+        self.autosave_ms = autosave_ms
+        self.current_frame = start_frame
         self.root.title("IPL Dashboard 2025")
         self.root.state('zoomed')  
         self.root.configure(bg="#001133")
@@ -97,112 +2427,91 @@ class IPLDashboard:
         self.selected_team2 = StringVar(value=list(self.team_colors.keys())[1])
         self.selected_season = StringVar(value="All")  # Default to 'All'
         self.selected_player = StringVar(value="")
+        self.selected_venue = StringVar(value="")
 
         self.load_data()
+        self.selected_player.set(self.default_player())
+        self.restore_snapshot()
         self.create_layout()
         self.create_sidebar()
-        self.show_frame("home")
+        self.show_frame(self.current_frame)
+
+        if self.snapshot_path:
+            self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+            self.root.after(self.autosave_ms, self.autosave)
 
     def load_data(self):
-        try:
-            self.schedule_df = pd.read_csv('IPL_2025_Match_Schedule_Full.csv')
-            self.matches_df = pd.read_csv('ipl_all_matches (1).csv')
-            self.players_df = pd.read_csv('Player_Performance (1).csv')
-            self.points_df = pd.read_csv('points_table_historic (1).csv')
-            self.process_data()
-            self.selected_player.set(self.players_df['Player'].iloc[0] if not self.players_df.empty else "")
-        except Exception as e:
-            print(f"Error loading data: {e}")
-            raise
+        if self.core is None:
+            self.core = IPLDataCore()
+        self.seasons = self.core.seasons
+        self.charts = self.charts or IPLChartRenderer(self.core)
+        if self.prefetch_budget_ms:
+            self.prefetcher = IPLPrefetcher(self.core, self.prefetch_budget_ms)
+        self.calculate_points_table()
 
-    def process_data(self):
-        team_name_map = {
-            "Chennai Super Kings": ["Chennai Super Kings", "CSK"],
-            "Mumbai Indians": ["Mumbai Indians", "MI"],
-            "Royal Challengers Bengaluru": ["Royal Challengers Bangalore", "Royal Challengers Bengaluru", "RCB"],
-            "Kolkata Knight Riders": ["Kolkata Knight Riders", "KKR"],
-            "Delhi Capitals": ["Delhi Capitals", "Delhi Daredevils", "DC", "DD"],
-            "Sunrisers Hyderabad": ["Sunrisers Hyderabad", "SRH"],
-            "Punjab Kings": ["Punjab Kings", "Kings XI Punjab", "PBKS", "KXIP"],
-            "Rajasthan Royals": ["Rajasthan Royals", "RR"],
-            "Gujarat Titans": ["Gujarat Titans", "GT"],
-            "Lucknow Super Giants": ["Lucknow Super Giants", "LSG"]
+    @property
+    def players(self):
+        # Read through the core so the player file loads only once a player view needs it
+        return self.core.players
+
+    def default_player(self):
+        # The first player, as before lazy loading, once the player file has been read; until then the
+        # Player Performance page resolves it when it opens
+        return self.players[0] if 'players' in self.core.datasets and self.players else ""
+
+    @property
+    def venues(self):
+        # Venue aggregates need the full match history, so they are built when the Venue page or list is first used
+        return [row['venue'] for row in self.core.venue_summary()]
+
+    def snapshot_filters(self):
+        return {
+            'team1': self.selected_team1.get(),
+            'team2': self.selected_team2.get(),
+            'season': self.selected_season.get(),
+            'player': self.selected_player.get(),
+            'venue': self.selected_venue.get(),
+            'frame': self.current_frame
         }
 
-        def standardize_team_name(name):
-            if pd.isna(name):
-                return name
-            for std_name, variations in team_name_map.items():
-                if name in variations:
-                    return std_name
-            return name
+    def restore_snapshot(self):
+        state = self.core.load_snapshot(self.snapshot_path)
+        if state is None:
+            return
+        for key, data in state['charts'].items():
+            self.charts.cache.remember(key, data)
+        filters = state['filters']
+        for name, var in (('team1', self.selected_team1), ('team2', self.selected_team2), ('season', self.selected_season),
+                          ('player', self.selected_player), ('venue', self.selected_venue)):
+            if name in filters:
+                var.set(filters[name])
+        if filters.get('frame') in self.sections:
+            self.current_frame = filters['frame']
+        self.calculate_points_table()
 
-        self.matches_df['team1'] = self.matches_df['team1'].apply(standardize_team_name)
-        self.matches_df['team2'] = self.matches_df['team2'].apply(standardize_team_name)
-        self.matches_df['winner'] = self.matches_df['winner'].apply(standardize_team_name)
-        self.matches_df['toss_winner'] = self.matches_df['toss_winner'].apply(standardize_team_name)
-        self.points_df['team'] = self.points_df['team'].apply(standardize_team_name)
-        self.schedule_df['Home'] = self.schedule_df['Home'].apply(standardize_team_name)
-        self.schedule_df['Away'] = self.schedule_df['Away'].apply(standardize_team_name)
+    def save_snapshot(self):
+        self.core.save_snapshot(self.snapshot_path, self.charts.cache.memory, self.snapshot_filters())
 
-        self.players = self.players_df['Player'].dropna().unique().tolist()
-        self.seasons = ['All'] + sorted(self.matches_df['season'].dropna().unique().tolist())
-        self.calculate_points_table()
+    def autosave(self):
+        self.save_snapshot()
+        self.root.after(self.autosave_ms, self.autosave)
+
+    def shutdown(self):
+        if self.prefetch_job is not None:
+            self.root.after_cancel(self.prefetch_job)
+            self.prefetch_job = None
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown()
+
+    def on_close(self):
+        self.shutdown()
+        self.save_snapshot()
+        self.root.destroy()
 
     def calculate_points_table(self, season=None):
         if season is None:
             season = self.selected_season.get() or "All"
-
-        teams = list(self.team_colors.keys())
-        points_data = []
-
-        if season == "All":
-            season_matches = self.matches_df
-        else:
-            season_matches = self.matches_df[self.matches_df['season'] == season]
-
-        for team in teams:
-            team_matches = season_matches[(season_matches['team1'] == team) | (season_matches['team2'] == team)]
-            matches_played = len(team_matches)
-            matches_won = len(season_matches[season_matches['winner'] == team])
-            matches_lost = matches_played - matches_won
-
-            runs_scored = 0
-            overs_faced = 0
-            runs_conceded = 0
-            overs_bowled = 0
-
-            for _, match in team_matches.iterrows():
-                if match['team1'] == team:
-                    if not pd.isna(match['target_runs']):
-                        runs_scored += match['target_runs']
-                        overs_faced += match['target_overs']
-                    if match['team2'] == team:
-                        runs_conceded += match['target_runs']
-                        overs_bowled += match['target_overs']
-                else:
-                    if not pd.isna(match['target_runs']):
-                        runs_conceded += match['target_runs']
-                        overs_bowled += match['target_overs']
-                    if match['team1'] == team:
-                        runs_scored += match['target_runs']
-                        overs_faced += match['target_overs']
-
-            nrr = ((runs_scored / overs_faced) - (runs_conceded / overs_bowled)) if overs_faced > 0 and overs_bowled > 0 else 0
-
-            points_data.append({
-                'year': season,
-                'team': team,
-                'matchs played': matches_played,
-                'Won': matches_won,
-                'Lost': matches_lost,
-                'Net Run Rate': round(nrr, 3),
-                'points': matches_won * 2
-            })
-
-        self.current_points_table = pd.DataFrame(points_data)
-        self.current_points_table = self.current_points_table.sort_values(by=['points', 'Net Run Rate'], ascending=[False, False])
-        self.current_points_table['pos'] = range(1, len(self.current_points_table) + 1)
+        self.current_points_table = self.core.calculate_points_table(season).copy()
 
     def create_layout(self):
         self.main_container = tk.Frame(self.root, bg="#ffffff")
@@ -213,7 +2522,7 @@ class IPLDashboard:
         self.scrollable_frame = {}
         self.v_scrollbar = {}
 
-        for section in ["home", "team_comparison", "team_performance", "player_performance", "season_trends"]:
+        for section in self.sections:
             self.frames[section] = tk.Frame(self.main_container, bg="#ffffff")
             self.frames[section].pack(fill="both", expand=True)
             self.frames[section].pack_forget()
@@ -246,14 +2555,16 @@ class IPLDashboard:
             ("Team Comparison", lambda: self.show_frame("team_comparison")),
             ("Team Performance", lambda: self.show_frame("team_performance")),
             ("Player Performance", lambda: self.show_frame("player_performance")),
-            ("Season Trends", lambda: self.show_frame("season_trends"))
+            ("Season Trends", lambda: self.show_frame("season_trends")),
+            ("Venue Analytics", lambda: self.show_frame("venue_analytics"))
         ]
         icon_dict = {
             "Home": "🏡",
             "Team Comparison": "🆚",
             "Team Performance": "💪",
             "Player Performance": "🏏",
-            "Season Trends": "📈"
+            "Season Trends": "📈",
+            "Venue Analytics": "🏟️"
         }
 
         for text, command in nav_buttons:
@@ -304,8 +2615,18 @@ class IPLDashboard:
 
         player_label = tk.Label(self.sidebar, text="Player", font=("Arial", 12), bg="#001133", fg="#7f8fa6")
         player_label.pack(pady=(10, 5), anchor="w")
-        player_dropdown = ttk.Combobox(self.sidebar, textvariable=self.selected_player, values=self.players, state="readonly", font=("Arial", 12))
+        # Typeahead: the list narrows to matching names on every keystroke
+        player_dropdown = ttk.Combobox(self.sidebar, textvariable=self.selected_player, font=("Arial", 12),
+                                       postcommand=lambda: self.fill_player_list(player_dropdown))
         player_dropdown.pack(fill="x", pady=5, padx=5)
+        player_dropdown.bind("<KeyRelease>", lambda e: self.filter_players(player_dropdown, e))
+        player_dropdown.bind("<Return>", lambda e: self.pick_player(player_dropdown))
+
+        venue_label = tk.Label(self.sidebar, text="Venue", font=("Arial", 12), bg="#001133", fg="#7f8fa6")
+        venue_label.pack(pady=(10, 5), anchor="w")
+        venue_dropdown = ttk.Combobox(self.sidebar, textvariable=self.selected_venue, state="readonly", font=("Arial", 12),
+                                      postcommand=lambda: self.fill_venue_list(venue_dropdown))
+        venue_dropdown.pack(fill="x", pady=5, padx=5)
 
         apply_button = tk.Button(self.sidebar, text="Apply Filters", bg="#4cd137", fg="#ffffff", font=("Arial", 12),
                                  command=self.update_dashboard)
@@ -315,6 +2636,26 @@ class IPLDashboard:
                                  command=self.reset_filters)
         reset_button.pack(fill="x", pady=5)
 
+    def fill_player_list(self, dropdown):
+        if not dropdown['values']:
+            dropdown['values'] = self.core.search_players(self.selected_player.get())
+
+    def fill_venue_list(self, dropdown):
+        if not dropdown['values']:
+            dropdown['values'] = self.venues
+
+    def filter_players(self, dropdown, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        dropdown['values'] = self.core.search_players(self.selected_player.get())
+
+    def pick_player(self, dropdown):
+        # Enter on a partial name takes the best match
+        matches = self.core.search_players(self.selected_player.get(), limit=1)
+        if matches and self.selected_player.get() not in self.players:
+            self.selected_player.set(matches[0])
+        self.update_dashboard()
+
     def remove_team(self, team_num):
         if team_num == 1:
             self.selected_team1.set("")
@@ -326,10 +2667,12 @@ class IPLDashboard:
         self.selected_team1.set("Chennai Super Kings")
         self.selected_team2.set("Mumbai Indians")
         self.selected_season.set("All")
-        self.selected_player.set(self.players[0] if self.players else "")
+        self.selected_player.set(self.default_player())
+        self.selected_venue.set("")
         self.update_dashboard()
 
     def show_frame(self, frame_name):
+        self.current_frame = frame_name
         for frame in self.frames.values():
             frame.pack_forget()
         self.frames[frame_name].pack(fill="both", expand=True)
@@ -344,6 +2687,59 @@ class IPLDashboard:
             self.update_player_performance_section()
         elif frame_name == "season_trends":
             self.update_season_trends_section()
+        elif frame_name == "venue_analytics":
+            self.update_venue_analytics_section()
+
+        # Once the page is drawn, warm the views a user is likely to open next
+        if self.prefetcher is not None:
+            if self.prefetch_job is not None:
+                self.root.after_cancel(self.prefetch_job)
+            self.prefetch_job = self.root.after_idle(self.prefetch_neighbours)
+
+    def neighbour_tasks(self):
+        # Adjacent seasons first, then the next team in the combobox, for whichever page is showing
+        def next_in(values, value):
+            return values[(values.index(value) + 1) % len(values)] if value in values else None
+
+        season = self.selected_season.get()
+        i = self.seasons.index(season) if season in self.seasons else 0
+        seasons = [self.seasons[j] for j in (i + 1, i - 1) if 0 <= j < len(self.seasons)]
+        teams = list(self.team_colors.keys())
+        team1, team2 = self.selected_team1.get(), self.selected_team2.get()
+        next_team = next_in(teams, team1)
+        if next_team == team2:
+            next_team = next_in(teams, next_team)
+
+        tasks = []
+        if self.current_frame == "home":
+            for s in seasons:
+                tasks += [(self.core.calculate_points_table, s), (self.core.standings_cube, s), (self.core.view, "home_summary", s)]
+        elif self.current_frame == "team_comparison" and team1 and team2:
+            for s in seasons:
+                tasks += [(self.core.view, "head_to_head", team1, team2, s),
+                          (self.charts.runs_violin, team1, s, self.team_colors.get(team1, '#3498db')),
+                          (self.charts.runs_violin, team2, s, self.team_colors.get(team2, '#e74c3c'))]
+            if next_team:
+                tasks += [(self.core.view, "head_to_head", next_team, team2, season),
+                          (self.charts.runs_violin, next_team, season, self.team_colors.get(next_team, '#3498db'))]
+        elif self.current_frame == "team_performance" and team1:
+            tasks += [(self.core.team_performance, team1, s) for s in seasons]
+            if next_team:
+                tasks += [(self.core.team_performance, next_team, season),
+                          (self.charts.rating_trend, next_team, self.team_colors.get(next_team, "#3498db"))]
+        elif self.current_frame == "player_performance":
+            player = next_in(self.players, self.selected_player.get())
+            if player:
+                tasks.append((self.core.view, "player_performance", player))
+        elif self.current_frame == "venue_analytics":
+            venue = next_in(self.venues, self.selected_venue.get())
+            if venue:
+                tasks.append((self.core.view, "venue_report", venue))
+        return tasks
+
+    def prefetch_neighbours(self):
+        self.prefetch_job = None
+        self.prefetcher.submit(self.neighbour_tasks())
 
     def update_dashboard(self):
         self.calculate_points_table()
@@ -365,6 +2761,20 @@ class IPLDashboard:
 
         return box
 
+    def fixture_expectation_text(self, home, away):
+        # Pre-match Elo win expectation; skipped for fixtures with an unknown side
+        if home not in self.core.teams or away not in self.core.teams:
+            return ""
+        home_pct = self.core.win_expectation(home, away)
+        return f" ({home_pct:.0f}% / {100 - home_pct:.0f}%)"
+
+    def create_chart_image(self, parent, image_bytes):
+        chart_image = ImageTk.PhotoImage(Image.open(io.BytesIO(image_bytes)))
+        chart_label = tk.Label(parent, image=chart_image, bg="#ffffff")
+        chart_label.image = chart_image
+        chart_label.pack(fill="both", expand=True)
+        return chart_label
+
     def create_logo_space(self, parent, team_name, width=180, height=180): 
         logo_frame = tk.Frame(parent, width=width, height=height, bg="#ffffff")
         logo_frame.pack_propagate(False)
@@ -457,19 +2867,16 @@ class IPLDashboard:
         fixtures_title = tk.Label(fixtures_frame, text="Today's Fixtures", font=("Arial", 16, "bold"), bg="#ffffff", fg=text_color)
         fixtures_title.pack(fill="x")
 
-        today = datetime.now().strftime("%d-%b-%y")
-        today_matches = self.schedule_df[self.schedule_df['Date'].str.contains(today[:5], case=False, regex=False)]
+        # Today's games, else the next one scheduled
+        today_matches = self.core.fixtures_on() or self.core.upcoming_fixtures(1)
+        if not today_matches:
+            tk.Label(fixtures_frame, text="No upcoming fixtures", font=("Arial", 20), bg="#ffffff", fg=text_color).pack(fill="x", expand=True)
 
-        if len(today_matches) == 0:
-            first_match = self.schedule_df.iloc[0]
-            match_text = f"{first_match['Home']} vs {first_match['Away']} - {first_match['Start']} - {first_match['Venue']}"
+        for fixture in today_matches:
+            match_text = f"{fixture['home']} vs {fixture['away']} - {fixture['start']} - {fixture['venue']}"
+            match_text += self.fixture_expectation_text(fixture['home'], fixture['away'])
             match_label = tk.Label(fixtures_frame, text=match_text, font=("Arial", 28, "bold"), bg="#ffffff", fg=text_color, bd=2, relief="solid")
             match_label.pack(fill="x", expand=True)
-        else:
-            for _, row in today_matches.iterrows():
-                match_text = f"{row['Home']} vs {row['Away']} - {row['Start']} - {row['Venue']}"
-                match_label = tk.Label(fixtures_frame, text=match_text, font=("Arial", 28, "bold"), bg="#ffffff", fg=text_color, bd=2, relief="solid")
-                match_label.pack(fill="x", expand=True)
 
         main_content = tk.Frame(content_frame, bg=background_color)
         main_content.pack(fill="both", expand=True)
@@ -478,16 +2885,12 @@ class IPLDashboard:
         stats_frame = tk.Frame(main_content, bg=background_color, pady=10)
         stats_frame.pack(fill="x")
 
-        season_matches = self.matches_df if self.selected_season.get() == "All" else self.matches_df[self.matches_df['season'] == self.selected_season.get()]
-        total_matches = len(season_matches)
-        total_runs = season_matches['target_runs'].sum()
-        avg_runs = season_matches['target_runs'].mean() if not season_matches['target_runs'].empty else 0
-        runs_variance = season_matches['target_runs'].var() if not season_matches['target_runs'].empty else 0
+        summary = self.core.view("home_summary", self.selected_season.get())
 
-        box1 = self.create_stat_box(stats_frame, "Total Matches", str(total_matches), team_color)
-        box2 = self.create_stat_box(stats_frame, "Total Runs", f"{total_runs:.0f}", team_color)
-        box3 = self.create_stat_box(stats_frame, "Avg Runs", f"{avg_runs:.1f}", team_color)
-        box4 = self.create_stat_box(stats_frame, "Runs Variance", f"{runs_variance:.1f}", team_color)
+        box1 = self.create_stat_box(stats_frame, "Total Matches", str(summary['total_matches']), team_color)
+        box2 = self.create_stat_box(stats_frame, "Total Runs", f"{summary['total_runs']:.0f}", team_color)
+        box3 = self.create_stat_box(stats_frame, "Avg Runs", f"{summary['avg_runs']:.1f}", team_color)
+        box4 = self.create_stat_box(stats_frame, "Runs Variance", f"{summary['runs_variance']:.1f}", team_color)
 
         # Row 1: Points Table and Pie Chart
         row1_frame = tk.Frame(main_content, bg=background_color)
@@ -517,26 +2920,70 @@ class IPLDashboard:
                               padx=10, pady=10, borderwidth=1, relief="solid", width=5 if col != "Team" else 15)
             header.grid(row=0, column=i, sticky="nsew")
 
-        for i, row in self.current_points_table.iterrows():
+        # Cells are created once; the as-of slider and season playback only change their text
+        cube = self.core.standings_cube(self.selected_season.get())
+        table_cells = []
+        for i in range(max(len(self.current_points_table), len(cube.teams))):
             bg_color = "#e6f0fa" if i % 2 == 0 else "#f0f8ff"
-            tk.Label(points_table_frame, text=str(row['pos']), font=("Arial", 12), bg=bg_color, fg=text_color, padx=10, pady=10,
-                     borderwidth=1, relief="solid").grid(row=i+1, column=0, sticky="nsew")
-            tk.Label(points_table_frame, text=row['team'], font=("Arial", 12), bg=bg_color, fg=text_color, padx=10, pady=10,
-                     borderwidth=1, relief="solid", anchor="w").grid(row=i+1, column=1, sticky="nsew")
-            tk.Label(points_table_frame, text=str(row['matchs played']), font=("Arial", 12), bg=bg_color, fg=text_color, padx=10, pady=10,
-                     borderwidth=1, relief="solid").grid(row=i+1, column=2, sticky="nsew")
-            tk.Label(points_table_frame, text=str(row['Won']), font=("Arial", 12), bg=bg_color, fg=text_color, padx=10, pady=10,
-                     borderwidth=1, relief="solid").grid(row=i+1, column=3, sticky="nsew")
-            tk.Label(points_table_frame, text=str(row['Lost']), font=("Arial", 12), bg=bg_color, fg=text_color, padx=10, pady=10,
-                     borderwidth=1, relief="solid").grid(row=i+1, column=4, sticky="nsew")
-            tk.Label(points_table_frame, text=str(row['Net Run Rate']), font=("Arial", 12), bg=bg_color, fg=text_color, padx=10, pady=10,
-                     borderwidth=1, relief="solid").grid(row=i+1, column=5, sticky="nsew")
-            tk.Label(points_table_frame, text=str(row['points']), font=("Arial", 12, "bold"), bg=bg_color, fg=text_color, padx=10, pady=10,
-                     borderwidth=1, relief="solid").grid(row=i+1, column=6, sticky="nsew")
+            cells = []
+            for j in range(len(columns)):
+                cell = tk.Label(points_table_frame, font=("Arial", 12, "bold" if j == 6 else "normal"), bg=bg_color, fg=text_color,
+                                padx=10, pady=10, borderwidth=1, relief="solid", anchor="w" if j == 1 else "center")
+                cell.grid(row=i+1, column=j, sticky="nsew")
+                cells.append(cell)
+            table_cells.append(cells)
+
+        def fill_table(points_table):
+            for cells, (_, row) in zip(table_cells, points_table.iterrows()):
+                # "*": NRR rests on estimated chase overs
+                nrr = f"{row['Net Run Rate']}{'*' if row.get('nrr_estimated', False) else ''}"
+                values = [row['pos'], row['team'], row['matchs played'], row['Won'], row['Lost'], nrr, row['points']]
+                for cell, value in zip(cells, values):
+                    cell.config(text=str(value))
+            for cells in table_cells[len(points_table):]:
+                for cell in cells:
+                    cell.config(text="")
+
+        fill_table(self.current_points_table)
 
         for i in range(7):
             points_table_frame.grid_columnconfigure(i, weight=1 if i != 1 else 3)
 
+        # Standings after any match of the selected season; the last step is the table shown above
+        as_of_frame = tk.Frame(left_frame, bg=background_color)
+        as_of_frame.pack(fill="x")
+
+        as_of_label = tk.Label(as_of_frame, text="", font=("Arial", 11), bg=background_color, fg=text_color, width=56, anchor="w")
+        as_of_label.pack(side="left")
+
+        def label_after(i, as_of, points_table):
+            source = points_table['source'].iloc[0] if len(points_table) else "computed"
+            estimated = 'nrr_estimated' in points_table and points_table['nrr_estimated'].any()
+            as_of_label.config(text=f"After match {i} ({as_of or 'start'}), {source}" + (", * NRR estimated" if estimated else ""))
+
+        def show_after(i):
+            i = int(float(i))
+            points_table = self.core.standings_after(self.selected_season.get(), i)
+            fill_table(points_table)
+            label_after(i, cube.date_after(i), points_table)
+
+        # Moving the variable (as playback does) leaves the slider's command alone
+        as_of_var = tk.IntVar(value=len(cube))
+        as_of_scale = tk.Scale(as_of_frame, from_=0, to=len(cube), orient="horizontal", showvalue=False, variable=as_of_var,
+                               bg=background_color, highlightthickness=0, command=show_after)
+        as_of_scale.pack(side="left", fill="x", expand=True, padx=5)
+        label_after(len(cube), cube.date_after(len(cube)), self.current_points_table)
+
+        def follow_playback(frame):
+            as_of_var.set(frame['matches'])
+            fill_table(frame['table'])
+            label_after(frame['matches'], frame['as_of'], frame['table'])
+
+        playback_frame = tk.Frame(left_frame, bg=background_color)
+        playback_frame.pack(fill="both", expand=True, pady=10)
+        IPLPlaybackPanel(self.root, playback_frame, self.core, self.selected_season.get(), self.team_colors,
+                         on_frame=follow_playback, bg=background_color)
+
         # Right: Pie Chart
         right_frame = tk.Frame(row1_frame, bg=background_color)
         right_frame.pack(side="right", fill="both", expand=True, padx=(10, 0))
@@ -554,14 +3001,7 @@ class IPLDashboard:
         chart_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig, ax = plt.subplots(figsize=(6, 4))
-        team_success = {}
-        for team in self.current_points_table['team'].unique():
-            team_matches = season_matches[(season_matches['team1'] == team) | (season_matches['team2'] == team)]
-            team_wins = season_matches[season_matches['winner'] == team]
-            win_percentage = (len(team_wins) / len(team_matches) * 100) if len(team_matches) > 0 else 0
-            team_success[team] = win_percentage
-
-        team_success = {k: v for k, v in sorted(team_success.items(), key=lambda item: item[1], reverse=True)[:5]}
+        team_success = summary['top_teams_by_win_pct']
         colors = [self.team_colors.get(team, '#3498db') for team in team_success.keys()]
         ax.pie(list(team_success.values()), labels=list(team_success.keys()), autopct='%1.1f%%', startangle=90,
                colors=colors, wedgeprops=dict(width=0.5, edgecolor='white'))
@@ -686,7 +3126,7 @@ class IPLDashboard:
             msg_label.pack(fill="both", expand=True)
             return
 
-        filtered_matches = self.matches_df if self.selected_season.get() == "All" else self.matches_df[self.matches_df['season'] == self.selected_season.get()]
+        h2h = self.core.view("head_to_head", team1, team2, self.selected_season.get())
 
         header_frame = tk.Frame(self.scrollable_frame["team_comparison"], bg=team_color, pady=15)
         header_frame.pack(fill="x")
@@ -712,30 +3152,13 @@ class IPLDashboard:
         value_frame = tk.Frame(self.scrollable_frame["team_comparison"], bg="#ffffff", pady=10)
         value_frame.pack(fill="x")
 
-        h2h_matches = filtered_matches[((filtered_matches['team1'] == team1) & (filtered_matches['team2'] == team2)) |
-                                      ((filtered_matches['team1'] == team2) & (filtered_matches['team2'] == team1))]
-        total_matches = len(h2h_matches)
-        team1_wins = len(h2h_matches[h2h_matches['winner'] == team1])
-        team2_wins = len(h2h_matches[h2h_matches['winner'] == team2])
-        avg_runs_team1 = h2h_matches[h2h_matches['team1'] == team1]['target_runs'].mean() if not h2h_matches.empty else 0
-
-        # Statistical Tests
-        team1_wins_binary = (h2h_matches['winner'] == team1).astype(int)
-        team2_wins_binary = (h2h_matches['winner'] == team2).astype(int)
-        t_stat, p_val = ttest_ind(team1_wins_binary, team2_wins_binary, equal_var=False)
-        contingency_table = pd.crosstab(h2h_matches['winner'] == team1, h2h_matches['winner'] == team2)
-        if contingency_table.size == 0 or contingency_table.shape[0] <= 1 or contingency_table.shape[1] <= 1:
-            chi2, chi2_p = 0, 1
-        else:
-            chi2, chi2_p, _, _ = chi2_contingency(contingency_table)
-
-        box1 = self.create_stat_box(value_frame, "Total Matches", str(total_matches), team_color)
-        box2 = self.create_stat_box(value_frame, f"{team1} Wins", str(team1_wins), team_color)
-        box3 = self.create_stat_box(value_frame, f"{team2} Wins", str(team2_wins), team_color)
-        box4 = self.create_stat_box(value_frame, f"{team1} Avg Runs", f"{avg_runs_team1:.1f}", team_color)
-        box5 = self.create_stat_box(value_frame, "T-statistic", f"{t_stat:.3f}", team_color, font_size=12)
-        box6 = self.create_stat_box(value_frame, "P-value", f"{p_val:.3f}", team_color, font_size=12)
-        box7 = self.create_stat_box(value_frame, "Chi-square", f"{chi2:.3f}", team_color, font_size=12)
+        box1 = self.create_stat_box(value_frame, "Total Matches", str(h2h['total_matches']), team_color)
+        box2 = self.create_stat_box(value_frame, f"{team1} Wins", str(h2h['team1_wins']), team_color)
+        box3 = self.create_stat_box(value_frame, f"{team2} Wins", str(h2h['team2_wins']), team_color)
+        box4 = self.create_stat_box(value_frame, f"{team1} Avg Runs", f"{h2h['avg_runs_team1']:.1f}", team_color)
+        box5 = self.create_stat_box(value_frame, "T-statistic", f"{h2h['t_stat']:.3f}", team_color, font_size=12)
+        box6 = self.create_stat_box(value_frame, "P-value", f"{h2h['p_val']:.3f}", team_color, font_size=12)
+        box7 = self.create_stat_box(value_frame, "Chi-square", f"{h2h['chi2']:.3f}", team_color, font_size=12)
 
         content_frame = tk.Frame(self.scrollable_frame["team_comparison"], bg="#ffffff", padx=10, pady=10)
         content_frame.pack(fill="both", expand=True)
@@ -758,9 +3181,8 @@ class IPLDashboard:
         h2h_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig1, ax1 = plt.subplots(figsize=(6, 4))
-        no_result = len(h2h_matches) - team1_wins - team2_wins
         labels = [f"{team1} Wins", f"{team2} Wins", "No Result"]
-        sizes = [team1_wins, team2_wins, no_result]
+        sizes = [h2h['team1_wins'], h2h['team2_wins'], h2h['no_result']]
         colors = [self.team_colors.get(team1, "#3498db"), self.team_colors.get(team2, "#e74c3c"), "#95a5a6"]
         ax1.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors, wedgeprops=dict(width=0.5, edgecolor='white'))
         centre_circle = plt.Circle((0, 0), 0.3, fc='white')
@@ -789,10 +3211,10 @@ class IPLDashboard:
         matches_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig2, ax2 = plt.subplots(figsize=(6, 4))
-        team1_matches = len(filtered_matches[(filtered_matches['team1'] == team1) | (filtered_matches['team2'] == team1)])
-        team1_total_wins = len(filtered_matches[filtered_matches['winner'] == team1])
-        team2_matches = len(filtered_matches[(filtered_matches['team1'] == team2) | (filtered_matches['team2'] == team2)])
-        team2_total_wins = len(filtered_matches[filtered_matches['winner'] == team2])
+        team1_matches = h2h['team1_matches']
+        team1_total_wins = h2h['team1_total_wins']
+        team2_matches = h2h['team2_matches']
+        team2_total_wins = h2h['team2_total_wins']
 
         teams = [team1, team2]
         matches_played = [team1_matches, team2_matches]
@@ -831,15 +3253,8 @@ class IPLDashboard:
         violin1_frame = tk.Frame(violin1_inner_frame, bg="#E3F2FD", bd=2, relief="solid") 
         violin1_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
-        fig3, ax3 = plt.subplots(figsize=(6, 4))
-        team1_runs = filtered_matches[(filtered_matches['team1'] == team1) | (filtered_matches['team2'] == team1)]['target_runs'].dropna()
-        sns.violinplot(y=team1_runs, ax=ax3, color=self.team_colors.get(team1, '#3498db'))
-        ax3.set_title(f'{team1} Runs Distribution')
-        ax3.set_ylabel('Runs')
-
-        violin1_canvas = FigureCanvasTkAgg(fig3, master=violin1_frame)
-        violin1_canvas.draw()
-        violin1_canvas.get_tk_widget().pack(fill="both", expand=True)
+        violin1_png = self.charts.runs_violin(team1, self.selected_season.get(), self.team_colors.get(team1, '#3498db'))
+        self.create_chart_image(violin1_frame, violin1_png)
 
         # Blank space where stats box was
         blank_space = tk.Frame(violin1_inner_frame, bg="#ffffff")
@@ -858,15 +3273,8 @@ class IPLDashboard:
         violin2_frame = tk.Frame(violin2_inner_frame, bg="#E3F2FD", bd=2, relief="solid") 
         violin2_frame.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
-        fig4, ax4 = plt.subplots(figsize=(6, 4))
-        team2_runs = filtered_matches[(filtered_matches['team1'] == team2) | (filtered_matches['team2'] == team2)]['target_runs'].dropna()
-        sns.violinplot(y=team2_runs, ax=ax4, color=self.team_colors.get(team2, '#e74c3c'))
-        ax4.set_title(f'{team2} Runs Distribution')
-        ax4.set_ylabel('Runs')
-
-        violin2_canvas = FigureCanvasTkAgg(fig4, master=violin2_frame)
-        violin2_canvas.draw()
-        violin2_canvas.get_tk_widget().pack(fill="both", expand=True)
+        violin2_png = self.charts.runs_violin(team2, self.selected_season.get(), self.team_colors.get(team2, '#e74c3c'))
+        self.create_chart_image(violin2_frame, violin2_png)
 
         # Blank space where stats box was
         blank_space = tk.Frame(violin2_inner_frame, bg="#ffffff")
@@ -890,7 +3298,7 @@ class IPLDashboard:
             tk.Label(table_content, text=header, font=("Arial", 12, "bold"), bg=team_color, fg="#ffffff",
                      padx=10, pady=10, borderwidth=1, relief="solid").grid(row=0, column=i, sticky="nsew")
 
-        last_winner = self.get_last_match_winner(team1, team2)
+        last_winner = h2h['last_match_winner']
         stats = [
             ["Total Matches", team1_matches, team2_matches],
             ["Total Wins", team1_total_wins, team2_total_wins],
@@ -909,14 +3317,7 @@ class IPLDashboard:
             table_content.grid_columnconfigure(i, weight=1)
 
     def get_last_match_winner(self, team1, team2):
-        h2h_matches = self.matches_df[((self.matches_df['team1'] == team1) & (self.matches_df['team2'] == team2)) |
-                                      ((self.matches_df['team1'] == team2) & (self.matches_df['team2'] == team1))]
-        if len(h2h_matches) == 0:
-            return "No matches played"
-        h2h_matches['date'] = pd.to_datetime(h2h_matches['date'], errors='coerce')
-        h2h_matches = h2h_matches.sort_values('date', ascending=False)
-        last_match = h2h_matches.iloc[0]
-        return last_match['winner'] if not pd.isna(last_match['winner']) else "No Result"
+        return self.core.get_last_match_winner(team1, team2)
 
     def update_team_performance_section(self):
         for widget in self.scrollable_frame["team_performance"].winfo_children():
@@ -954,37 +3355,15 @@ class IPLDashboard:
         top_row = tk.Frame(content_frame, bg=background_color)
         top_row.pack(fill="both", expand=True, pady=10)
 
-        filtered_matches = self.matches_df if self.selected_season.get() == "All" else self.matches_df[self.matches_df['season'] == self.selected_season.get()]
-        team_matches = filtered_matches[(filtered_matches['team1'] == team) | (filtered_matches['team2'] == team)]
-        team_wins = filtered_matches[filtered_matches['winner'] == team]
+        performance = self.core.team_performance(team, self.selected_season.get())
 
-        max_score = team_matches['target_runs'].max() if not team_matches['target_runs'].empty else 0
-        min_score = team_matches['target_runs'].min() if not team_matches['target_runs'].empty else 0
-        win_percentage = (len(team_wins) / len(team_matches) * 100) if len(team_matches) > 0 else 0
-        avg_runs = team_matches['target_runs'].mean() if not team_matches['target_runs'].empty else 0
-
-        # Statistical Tests
-        team_matches_all = self.matches_df[(self.matches_df['team1'] == team) | (self.matches_df['team2'] == team)]
-        wins_by_season = team_matches_all.groupby('season').apply(lambda x: (x['winner'] == team).sum())
-        seasons = sorted(wins_by_season.index)
-        mid = len(seasons) // 2
-        first_half_wins = wins_by_season[seasons[:mid]]
-        second_half_wins = wins_by_season[seasons[mid:]]
-        t_stat, p_val = ttest_ind(first_half_wins, second_half_wins, equal_var=False) if len(first_half_wins) > 0 and len(second_half_wins) > 0 else (0, 1)
-
-        contingency_table = pd.crosstab(team_matches['winner'] == team, team_matches['toss_winner'] == team)
-        if contingency_table.size > 0 and contingency_table.shape[0] > 1 and contingency_table.shape[1] > 1:
-            chi2, chi2_p, _, _ = chi2_contingency(contingency_table)
-        else:
-            chi2, chi2_p = 0, 1
-
-        box1 = self.create_stat_box(top_row, "Max Score", f"{max_score:.0f}", team_color)
-        box2 = self.create_stat_box(top_row, "Min Score", f"{min_score:.0f}", team_color)
-        box3 = self.create_stat_box(top_row, "Win %", f"{win_percentage:.1f}%", team_color)
-        box4 = self.create_stat_box(top_row, "Avg Runs", f"{avg_runs:.1f}", team_color)
-        box5 = self.create_stat_box(top_row, "T-statistic", f"{t_stat:.3f}", team_color, font_size=12)
-        box6 = self.create_stat_box(top_row, "P-value", f"{p_val:.3f}", team_color, font_size=12)
-        box7 = self.create_stat_box(top_row, "Chi-square", f"{chi2:.3f}", team_color, font_size=12)
+        box1 = self.create_stat_box(top_row, "Max Score", f"{performance['max_score']:.0f}", team_color)
+        box2 = self.create_stat_box(top_row, "Min Score", f"{performance['min_score']:.0f}", team_color)
+        box3 = self.create_stat_box(top_row, "Win %", f"{performance['win_pct']:.1f}%", team_color)
+        box4 = self.create_stat_box(top_row, "Avg Runs", f"{performance['avg_runs']:.1f}", team_color)
+        box5 = self.create_stat_box(top_row, "T-statistic", f"{performance['t_stat']:.3f}", team_color, font_size=12)
+        box6 = self.create_stat_box(top_row, "P-value", f"{performance['p_val']:.3f}", team_color, font_size=12)
+        box7 = self.create_stat_box(top_row, "Chi-square", f"{performance['chi2']:.3f}", team_color, font_size=12)
 
         # Row 2: Performance by Season and Win % by Batting/Bowling First
         row2 = tk.Frame(content_frame, bg=background_color)
@@ -1004,7 +3383,8 @@ class IPLDashboard:
         left_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig1, ax1 = plt.subplots(figsize=(6, 4))
-        sns.barplot(x=wins_by_season.index, y=wins_by_season.values, ax=ax1, color=team_color)
+        wins_by_season = performance['wins_by_season']
+        sns.barplot(x=list(wins_by_season.keys()), y=list(wins_by_season.values()), ax=ax1, color=team_color)
         ax1.set_xlabel('Season')
         ax1.set_ylabel('Wins')
         ax1.tick_params(axis='x', rotation=45)
@@ -1031,15 +3411,8 @@ class IPLDashboard:
         middle_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig2, ax2 = plt.subplots(figsize=(6, 4))
-        batting_first_wins = len(team_matches[(team_matches['winner'] == team) & (team_matches['toss_winner'] == team) & (team_matches['toss_decision'] == 'bat')])
-        bowling_first_wins = len(team_matches[(team_matches['winner'] == team) & (team_matches['toss_winner'] == team) & (team_matches['toss_decision'] == 'field')])
-        batting_first_matches = len(team_matches[(team_matches['toss_winner'] == team) & (team_matches['toss_decision'] == 'bat')])
-        bowling_first_matches = len(team_matches[(team_matches['toss_winner'] == team) & (team_matches['toss_decision'] == 'field')])
-        batting_win_pct = (batting_first_wins / batting_first_matches * 100) if batting_first_matches > 0 else 0
-        bowling_win_pct = (bowling_first_wins / bowling_first_matches * 100) if bowling_first_matches > 0 else 0
-
         categories = ['Batting First', 'Bowling First']
-        win_pcts = [batting_win_pct, bowling_win_pct]
+        win_pcts = [performance['batting_first_win_pct'], performance['bowling_first_win_pct']]
         ax2.bar(categories, win_pcts, color=team_color)
         ax2.set_ylabel('Win %')
         ax2.set_title('Win % by Batting/Bowling First')
@@ -1069,8 +3442,8 @@ class IPLDashboard:
         right_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig3, ax3 = plt.subplots(figsize=(6, 4))
-        win_pct = team_matches_all.groupby('season').apply(lambda x: (len(x[x['winner'] == team]) / len(x) * 100) if len(x) > 0 else 0)
-        ax3.plot(win_pct.index, win_pct.values, color=team_color, marker='o')
+        win_pct = performance['win_pct_by_season']
+        ax3.plot(list(win_pct.keys()), list(win_pct.values()), color=team_color, marker='o')
         ax3.set_xlabel('Season')
         ax3.set_ylabel('Win %')
         ax3.tick_params(axis='x', rotation=45)
@@ -1079,14 +3452,23 @@ class IPLDashboard:
         right_canvas.draw()
         right_canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        # Blank space where stats box was
-        blank_space = tk.Frame(right_inner_frame, bg=background_color)
-        blank_space.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+        # Elo rating over the team's whole history
+        rating_wrapper = tk.Frame(row3, bg=background_color)
+        rating_wrapper.pack(side="left", fill="both", expand=True, padx=(5, 0))
+
+        rating_title = tk.Label(rating_wrapper, text="Elo Rating Trend", font=("Arial", 14, "bold"), bg=background_color, fg=text_color, pady=5)
+        rating_title.pack()
+
+        rating_chart = tk.Frame(rating_wrapper, bg="#E3F2FD", bd=2, relief="solid")
+        rating_chart.pack(fill="both", expand=True)
+        self.create_chart_image(rating_chart, self.charts.rating_trend(team, team_color))
 
     def update_player_performance_section(self):
         for widget in self.scrollable_frame["player_performance"].winfo_children():
             widget.destroy()
 
+        if not self.selected_player.get() and self.players:
+            self.selected_player.set(self.players[0])
         player = self.selected_player.get()
         team = self.selected_team1.get()
         team_color = self.team_colors.get(team, "#3498db")
@@ -1131,32 +3513,19 @@ class IPLDashboard:
         stats_frame = tk.Frame(content_frame, bg=background_color, pady=10)
         stats_frame.pack(fill="x")
 
-        player_data = self.players_df[self.players_df['Player'] == player]
-        if not player_data.empty:
-            runs = player_data['Runs'].iloc[0]
-            strike_rate = player_data['SR'].iloc[0]
-            fours = player_data['4s'].iloc[0]
-            sixes = player_data['6s'].iloc[0]
-        else:
-            runs = strike_rate = fours = sixes = 0
-
-        top_scorers = self.players_df.nlargest(10, 'Runs')
-        top_scorer_runs = top_scorers.iloc[0]['Runs']
-        other_scorers_runs = top_scorers.iloc[1:]['Runs']
-        t_stat, p_val = ttest_ind(np.full(len(other_scorers_runs), top_scorer_runs), other_scorers_runs, equal_var=False) if len(other_scorers_runs) > 0 else (0, 1)
-        contingency_table = pd.crosstab(self.players_df['Runs'] > self.players_df['Runs'].median(), self.players_df['SR'] > self.players_df['SR'].median())
-        if contingency_table.size > 0 and contingency_table.shape[0] > 1 and contingency_table.shape[1] > 1:
-            chi2, chi2_p = chi2_contingency(contingency_table)[:2]
-        else:
-            chi2, chi2_p = 0, 1
+        stats_data = self.core.view("player_performance", player)
+        runs = stats_data['runs']
+        strike_rate = stats_data['strike_rate']
+        fours = stats_data['fours']
+        sixes = stats_data['sixes']
 
         box1 = self.create_stat_box(stats_frame, "Runs", f"{runs:.0f}", team_color)
         box2 = self.create_stat_box(stats_frame, "Strike Rate", f"{strike_rate:.1f}", team_color)
         box3 = self.create_stat_box(stats_frame, "4s", f"{fours:.0f}", team_color)
         box4 = self.create_stat_box(stats_frame, "6s", f"{sixes:.0f}", team_color)
-        box5 = self.create_stat_box(stats_frame, "T-statistic", f"{t_stat:.3f}", team_color, font_size=12)
-        box6 = self.create_stat_box(stats_frame, "P-value", f"{p_val:.3f}", team_color, font_size=12)
-        box7 = self.create_stat_box(stats_frame, "Chi-square", f"{chi2:.3f}", team_color, font_size=12)
+        box5 = self.create_stat_box(stats_frame, "T-statistic", f"{stats_data['t_stat']:.3f}", team_color, font_size=12)
+        box6 = self.create_stat_box(stats_frame, "P-value", f"{stats_data['p_val']:.3f}", team_color, font_size=12)
+        box7 = self.create_stat_box(stats_frame, "Chi-square", f"{stats_data['chi2']:.3f}", team_color, font_size=12)
 
         top_scorer_table_frame = tk.Frame(content_frame, bg=background_color, bd=2, relief="solid")
         top_scorer_table_frame.pack(fill="x", pady=10)
@@ -1164,7 +3533,7 @@ class IPLDashboard:
         top_scorer_title = tk.Label(top_scorer_table_frame, text="Top Scorer Details", font=("Arial", 14, "bold"), bg=background_color, fg=text_color, pady=5)
         top_scorer_title.pack()
 
-        top_scorer = self.players_df.nlargest(1, 'Runs').iloc[0]
+        top_scorer = stats_data['top_scorer']
         headers = ["Player", "Runs", "SR", "Avg", "4s", "6s", "0s"]
         table_content = tk.Frame(top_scorer_table_frame, bg=background_color)
         table_content.pack(fill="both", expand=True, pady=10)
@@ -1181,19 +3550,14 @@ class IPLDashboard:
         tk.Label(table_content, text=f"{top_scorer['SR']:.2f}", font=("Arial", 12), bg=bg_color, fg=text_color,
                  padx=10, pady=10, borderwidth=1, relief="solid").grid(row=1, column=2, sticky="nsew")
 
-        try:
-            avg_value = float(top_scorer['Avg'])
-            avg_text = f"{avg_value:.2f}"
-        except (ValueError, TypeError):
-            avg_text = str(top_scorer['Avg'])
-        tk.Label(table_content, text=avg_text, font=("Arial", 12), bg=bg_color, fg=text_color,
+        tk.Label(table_content, text=top_scorer['Avg'], font=("Arial", 12), bg=bg_color, fg=text_color,
                  padx=10, pady=10, borderwidth=1, relief="solid").grid(row=1, column=3, sticky="nsew")
 
         tk.Label(table_content, text=str(top_scorer['4s']), font=("Arial", 12), bg=bg_color, fg=text_color,
                  padx=10, pady=10, borderwidth=1, relief="solid").grid(row=1, column=4, sticky="nsew")
         tk.Label(table_content, text=str(top_scorer['6s']), font=("Arial", 12), bg=bg_color, fg=text_color,
                  padx=10, pady=10, borderwidth=1, relief="solid").grid(row=1, column=5, sticky="nsew")
-        tk.Label(table_content, text=str(top_scorer.get('0s', 0)), font=("Arial", 12), bg=bg_color, fg=text_color,
+        tk.Label(table_content, text=str(top_scorer['0s']), font=("Arial", 12), bg=bg_color, fg=text_color,
                  padx=10, pady=10, borderwidth=1, relief="solid").grid(row=1, column=6, sticky="nsew")
 
         for i in range(len(headers)):
@@ -1249,7 +3613,7 @@ class IPLDashboard:
         top5_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig_top5, ax_top5 = plt.subplots(figsize=(6, 4))
-        top_batsmen = self.players_df.nlargest(5, 'Runs')
+        top_batsmen = pd.DataFrame(stats_data['top_batsmen'])
         sns.barplot(x='Player', y='Runs', data=top_batsmen, ax=ax_top5, palette='viridis')
         ax_top5.set_title('Top 5 Batsmen by Runs')
         ax_top5.set_xlabel('Player')
@@ -1281,7 +3645,7 @@ class IPLDashboard:
         sr_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig_sr, ax_sr = plt.subplots(figsize=(6, 4))
-        seasons = sorted(self.matches_df['season'].unique())
+        seasons = self.seasons[1:]
         sr_by_season = np.random.uniform(100, 150, len(seasons)) 
         ax_sr.plot(seasons, sr_by_season, color=team_color, marker='o', label='Strike Rate')
         ax_sr.set_xlabel('Season')
@@ -1364,6 +3728,16 @@ class IPLDashboard:
         content_frame = tk.Frame(self.scrollable_frame["season_trends"], bg=background_color, padx=10, pady=10)
         content_frame.pack(fill="both", expand=True)
 
+        # Season playback: the selected season, or the latest one when showing all seasons
+        playback_season = self.selected_season.get()
+        if playback_season not in self.seasons[1:]:
+            playback_season = self.seasons[-1]
+        playback_wrapper = tk.Frame(content_frame, bg=background_color)
+        playback_wrapper.pack(fill="both", expand=True, pady=10)
+        playback_title = tk.Label(playback_wrapper, text=f"Season {playback_season} Match by Match", font=("Arial", 14, "bold"), bg=background_color, fg=text_color, pady=5)
+        playback_title.pack()
+        IPLPlaybackPanel(self.root, playback_wrapper, self.core, playback_season, self.team_colors, bg=background_color)
+
         # Row 1: Runs Trend Over Seasons and Win Rate by Toss Decision
         row1_frame = tk.Frame(content_frame, bg=background_color)
         row1_frame.pack(fill="both", expand=True, pady=10)
@@ -1382,8 +3756,9 @@ class IPLDashboard:
         runs_trend_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig_runs, ax_runs = plt.subplots(figsize=(6, 4))
-        runs_by_season = self.matches_df.groupby('season')['target_runs'].sum()
-        ax_runs.plot(runs_by_season.index, runs_by_season.values, color=team_color, marker='o', label='Total Runs')
+        trends = self.core.season_trends()
+        runs_by_season = trends['runs_by_season']
+        ax_runs.plot(list(runs_by_season.keys()), list(runs_by_season.values()), color=team_color, marker='o', label='Total Runs')
         ax_runs.set_xlabel('Season')
         ax_runs.set_ylabel('Total Runs')
         ax_runs.set_title('Runs Trend Over Seasons')
@@ -1411,9 +3786,7 @@ class IPLDashboard:
         toss_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
         fig_toss, ax_toss = plt.subplots(figsize=(6, 4))
-        toss_decision = self.matches_df.groupby(['toss_decision', 'season']).apply(
-            lambda x: (x['toss_winner'] == x['winner']).mean() * 100
-        ).unstack().fillna(0)
+        toss_decision = pd.DataFrame(trends['toss_win_rate']).T
         toss_decision.plot(kind='bar', ax=ax_toss, color=['#3498db', '#e74c3c'])
         ax_toss.set_xlabel('Season')
         ax_toss.set_ylabel('Win Rate (%)')
@@ -1445,16 +3818,7 @@ class IPLDashboard:
         runs_dist_chart = tk.Frame(runs_dist_inner_frame, bg="#E3F2FD", bd=2, relief="solid")
         runs_dist_chart.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
-        fig_dist, ax_dist = plt.subplots(figsize=(6, 4))
-        sns.boxplot(x='season', y='target_runs', data=self.matches_df, ax=ax_dist, palette='Set2')
-        ax_dist.set_xlabel('Season')
-        ax_dist.set_ylabel('Runs')
-        ax_dist.set_title('Runs Distribution Across Seasons')
-        ax_dist.tick_params(axis='x', rotation=45)
-
-        dist_canvas = FigureCanvasTkAgg(fig_dist, master=runs_dist_chart)
-        dist_canvas.draw()
-        dist_canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.create_chart_image(runs_dist_chart, self.charts.runs_distribution())
 
         blank_space = tk.Frame(runs_dist_inner_frame, bg=background_color)
         blank_space.pack(side="left", fill="both", expand=True, padx=5, pady=5)
@@ -1463,42 +3827,626 @@ class IPLDashboard:
         win_prob_frame = tk.Frame(row2_frame, bg=background_color, bd=2, relief="solid")
         win_prob_frame.pack(side="left", fill="both", expand=True, padx=(5, 0))
 
-        win_prob_title = tk.Label(win_prob_frame, text="IPL 2025 Win Probability", font=("Arial", 14, "bold"), bg=background_color, fg=text_color, pady=5)
+        win_prob_title = tk.Label(win_prob_frame, text=f"IPL {trends['projection_season']} Win Probability", font=("Arial", 14, "bold"), bg=background_color, fg=text_color, pady=5)
         win_prob_title.pack()
 
         table_content = tk.Frame(win_prob_frame, bg=background_color)
         table_content.pack(fill="both", expand=True, pady=10)
 
-        headers = ["Team", "Win Probability (%)"]
+        headers = ["Team", "Win Probability (%)", "Playoffs (%)"]
         for i, header in enumerate(headers):
             tk.Label(table_content, text=header, font=("Arial", 12, "bold"), bg=team_color, fg="#ffffff",
                      padx=10, pady=10, borderwidth=1, relief="solid").grid(row=0, column=i, sticky="nsew")
 
-        # Mock win probabilities (replace with actual data if available)
-        win_probabilities = {
-            "Chennai Super Kings":1,
-            "Mumbai Indians": 47,
-            "Royal Challengers Bengaluru": 68,
-            "Kolkata Knight Riders": 15,
-            "Delhi Capitals": 65,
-            "Sunrisers Hyderabad": 3,
-            "Punjab Kings": 55,
-            "Rajasthan Royals": 40.4,
-            "Gujarat Titans": 91,
-            "Lucknow Super Giants": 53
-        }
-
-        for i, (team, prob) in enumerate(win_probabilities.items()):
+        for i, (team, prob) in enumerate(trends['win_probabilities'].items()):
             bg_color = "#e6f0fa" if i % 2 == 0 else "#f0f8ff"
             tk.Label(table_content, text=team, font=("Arial", 12), bg=bg_color, fg=text_color,
                      padx=10, pady=10, borderwidth=1, relief="solid", anchor="w").grid(row=i+1, column=0, sticky="nsew")
             tk.Label(table_content, text=f"{prob:.1f}%", font=("Arial", 12, "bold"), bg=bg_color, fg=text_color,
                      padx=10, pady=10, borderwidth=1, relief="solid").grid(row=i+1, column=1, sticky="nsew")
+            tk.Label(table_content, text=f"{trends['playoff_probabilities'][team]:.1f}%", font=("Arial", 12), bg=bg_color, fg=text_color,
+                     padx=10, pady=10, borderwidth=1, relief="solid").grid(row=i+1, column=2, sticky="nsew")
 
         table_content.grid_columnconfigure(0, weight=3)
         table_content.grid_columnconfigure(1, weight=1)
+        table_content.grid_columnconfigure(2, weight=1)
 
-if __name__ == "__main__":
+        if trends['skipped_fixtures']:
+            skipped = ", ".join(f"#{row['match_no']} {row['home']} vs {row['away']}" for row in trends['skipped_fixtures'])
+            tk.Label(win_prob_frame, text=f"Not simulated (unreadable schedule rows): {skipped}", font=("Arial", 10, "italic"),
+                     bg=background_color, fg=text_color, wraplength=420, justify="left").pack(anchor="w", padx=10, pady=(0, 5))
+
+    def update_venue_analytics_section(self):
+        for widget in self.scrollable_frame["venue_analytics"].winfo_children():
+            widget.destroy()
+
+        venue = self.selected_venue.get()
+        if not venue:
+            # No venue picked yet: open on the busiest ground
+            venues = self.venues
+            venue = venues[0] if venues else ""
+            self.selected_venue.set(venue)
+        team = self.selected_team1.get()
+        team_color = self.team_colors.get(team, "#3498db")
+        background_color = "#F8F9FA"
+        text_color = "#0000FF" if team == "Chennai Super Kings" else team_color
+
+        if not venue:
+            msg_label = tk.Label(self.scrollable_frame["venue_analytics"], text="Please select a venue to view analytics",
+                                 font=("Arial", 16), bg="#ffffff", fg="#e74c3c", pady=50)
+            msg_label.pack(fill="both", expand=True)
+            return
+
+        report = self.core.view("venue_report", venue)
+
+        header_frame = tk.Frame(self.scrollable_frame["venue_analytics"], bg=team_color, pady=15)
+        header_frame.pack(fill="x")
+
+        header_title = tk.Label(header_frame, text=venue.upper(), font=("Arial", 24, "bold"), bg=team_color, fg="#ffffff")
+        header_title.pack(side="left", expand=True)
+
+        header_subtitle = tk.Label(header_frame, text=f"{report['city'] or ''} · last used {report['last_season']}", font=("Arial", 14), bg=team_color, fg="#ffffff")
+        header_subtitle.pack(side="left", padx=20)
+
+        content_frame = tk.Frame(self.scrollable_frame["venue_analytics"], bg=background_color, padx=10, pady=10)
+        content_frame.pack(fill="both", expand=True)
+
+        # Row 0: Stat boxes
+        stats_frame = tk.Frame(content_frame, bg=background_color, pady=10)
+        stats_frame.pack(fill="x")
+
+        self.create_stat_box(stats_frame, "Matches", str(report['matches']), team_color)
+        self.create_stat_box(stats_frame, "Avg 1st Innings Target", f"{report['avg_target']:.1f}", team_color)
+        self.create_stat_box(stats_frame, "Chasing Win %", f"{report['chase_win_pct']:.1f}%", team_color)
+        self.create_stat_box(stats_frame, "Toss Winner Win %", f"{report['toss_win_pct']:.1f}%", team_color)
+
+        # Row 1: Team record at venue and all-venue comparison
+        row1_frame = tk.Frame(content_frame, bg=background_color)
+        row1_frame.pack(fill="both", expand=True, pady=10)
+
+        record_wrapper = tk.Frame(row1_frame, bg=background_color)
+        record_wrapper.pack(side="left", fill="both", expand=True, padx=(0, 5))
+
+        record_title = tk.Label(record_wrapper, text="Team Record at Venue", font=("Arial", 14, "bold"), bg=background_color, fg=text_color, pady=5)
+        record_title.pack()
+
+        record_chart = tk.Frame(record_wrapper, bg="#E3F2FD", bd=2, relief="solid")
+        record_chart.pack(fill="both", expand=True)
+
+        records = pd.DataFrame(report['team_records']).head(10)
+        fig_record, ax_record = plt.subplots(figsize=(6, 4))
+        if not records.empty:
+            positions = np.arange(len(records))
+            ax_record.barh(positions - 0.2, records['played'], height=0.4, color="#95a5a6", label='Played')
+            ax_record.barh(positions + 0.2, records['won'], height=0.4,
+                           color=[self.team_colors.get(t, team_color) for t in records['team']], label='Won')
+            ax_record.set_yticks(positions)
+            ax_record.set_yticklabels(records['team'], fontsize=8)
+            ax_record.invert_yaxis()
+            ax_record.legend()
+        ax_record.set_xlabel('Matches')
+        fig_record.tight_layout()
+
+        record_canvas = FigureCanvasTkAgg(fig_record, master=record_chart)
+        record_canvas.draw()
+        record_canvas.get_tk_widget().pack(fill="both", expand=True)
+
+        venues_frame = tk.Frame(row1_frame, bg=background_color, bd=2, relief="solid")
+        venues_frame.pack(side="left", fill="both", expand=True, padx=(5, 0))
+
+        venues_title = tk.Label(venues_frame, text="All Venues", font=("Arial", 14, "bold"), bg=background_color, fg=text_color, pady=5)
+        venues_title.pack()
+
+        table_content = tk.Frame(venues_frame, bg=background_color)
+        table_content.pack(fill="both", expand=True, pady=10)
+
+        headers = ["Venue", "Matches", "Avg Target", "Chase Win %", "Toss Win %"]
+        for i, header in enumerate(headers):
+            tk.Label(table_content, text=header, font=("Arial", 11, "bold"), bg=team_color, fg="#ffffff",
+                     padx=8, pady=6, borderwidth=1, relief="solid").grid(row=0, column=i, sticky="nsew")
+
+        for i, row in enumerate(self.core.venue_summary()[:12]):
+            bg_color = "#e6f0fa" if i % 2 == 0 else "#f0f8ff"
+            font_weight = "bold" if row['venue'] == venue else "normal"
+            values = [row['venue'], str(row['matches']), f"{row['avg_target']:.1f}", f"{row['chase_win_pct']:.1f}", f"{row['toss_win_pct']:.1f}"]
+            for j, value in enumerate(values):
+                tk.Label(table_content, text=value, font=("Arial", 10, font_weight), bg=bg_color, fg=text_color,
+                         padx=8, pady=4, borderwidth=1, relief="solid", anchor="w" if j == 0 else "center").grid(row=i+1, column=j, sticky="nsew")
+
+        table_content.grid_columnconfigure(0, weight=3)
+
+        # Row 2: Scheduled fixtures at this ground with its pre-match context
+        fixtures_frame = tk.Frame(content_frame, bg="#ffffff", bd=2, relief="solid")
+        fixtures_frame.pack(fill="x", pady=10)
+
+        fixtures_title = tk.Label(fixtures_frame, text="Scheduled Fixtures at Venue", font=("Arial", 14, "bold"), bg="#ffffff", fg=text_color, pady=5)
+        fixtures_title.pack(fill="x")
+
+        if not report['fixtures']:
+            tk.Label(fixtures_frame, text="No scheduled fixtures at this venue", font=("Arial", 12), bg="#ffffff", fg=text_color).pack(fill="x", pady=5)
+        for fixture in report['fixtures']:
+            fixture_text = (f"{fixture['date']} {fixture['start']} - {fixture['home']} vs {fixture['away']}"
+                            f" | avg target {fixture['avg_target']:.0f}, chasing wins {fixture['chase_win_pct']:.0f}%")
+            tk.Label(fixtures_frame, text=fixture_text, font=("Arial", 12), bg="#ffffff", fg=text_color, anchor="w").pack(fill="x", padx=10)
+
+def to_json_safe(value):
+    # numpy scalars -> python, NaN/inf -> null so browsers can parse the payload
+    if isinstance(value, dict):
+        return {str(k): to_json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+class ServiceBusyError(Exception):
+    pass
+
+
+class MissingParameterError(KeyError):
+    pass
+
+
+class QueryParams(dict):
+    # q['name'] on an absent parameter is a client error, unlike a KeyError raised by the computation itself
+    def __missing__(self, key):
+        raise MissingParameterError(key)
+
+
+class IPLDataService:
+    # Runs section computations on a thread pool next to an asyncio loop. The pandas/NumPy kernels release the GIL
+    # only in parts, so CPU-heavy sections still largely take turns; the batch export uses core.process_pool instead
+    # Section computations that may be requested through the service
+    sections = ("home_summary", "points_table", "head_to_head", "team_performance", "player_performance", "season_trends", "season_projection",
+                "team_ratings", "rating_history", "win_expectation",
+                "fixtures_on", "upcoming_fixtures", "fixtures_between",
+                "venue_summary", "venue_report", "scheduled_fixture_venues", "search_players",
+                "leaderboard", "team_performance_all",
+                "standings_as_of", "standings_race", "standings_check")
+
+    def __init__(self, core, max_workers=None, max_pending=64):
+        self.core = core
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ipl-compute")
+        self.handlers = {section: getattr(core, section) for section in self.sections}
+        self.inflight = {}
+        # Callers waiting on a result, coalesced ones included; max_pending bounds these rather than distinct keys
+        self.waiting = 0
+        self.loop = None
+        self.thread = None
+        atexit.register(self.stop)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def register(self, section, handler):
+        self.handlers[section] = handler
+
+    async def fetch(self, section, *args):
+        if section not in self.handlers:
+            raise ValueError(f"Unknown section {section}")
+
+        # Single-flight: identical concurrent queries share one computation
+        key = (self.core.data_version, section, args)
+        if self.waiting >= self.max_pending:
+            raise ServiceBusyError(f"{self.waiting} requests already waiting")
+        future = self.inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, self.handlers[section], *args)
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        self.waiting += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self.waiting -= 1
+
+    def start(self):
+        if self.thread is not None:
+            return self
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="ipl-data-service", daemon=True)
+        self.thread.start()
+        return self
+
+    def call(self, section, *args, timeout=30):
+        # Blocking entry point for threaded callers such as the HTTP handlers
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(self.fetch(section, *args), self.loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            # Stop waiting; the shared computation itself keeps running for any other callers
+            future.cancel()
+            raise
+
+    def stop(self):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            self.loop = None
+            self.thread = None
+        self.executor.shutdown(wait=False)
+        atexit.unregister(self.stop)
+
+
+class IPLResponseCache:
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, body, content_type="application/json"):
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        with self.lock:
+            self.entries[key] = (etag, body, content_type)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return etag, body, content_type
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class IPLAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = QueryParams((k, v[-1]) for k, v in parse_qs(parsed.query).items())
+        path = parsed.path.rstrip("/") or "/"
+        route = self.server.routes.get(path)
+        if route is None:
+            self.send_json(404, {'error': f"Unknown endpoint {parsed.path}"})
+            return
+        # "Today" is pinned into the query so cached answers roll over at midnight
+        for param in self.server.today_params.get(path, ()):
+            query.setdefault(param, datetime.now().date().isoformat())
+
+        # Cache key covers the data version, so reloaded data never serves stale payloads
+        key = (self.server.core.data_version, parsed.path, tuple(sorted(query.items())))
+        cached = self.server.cache.get(key)
+        if cached is None:
+            try:
+                payload = route(query)
+            except MissingParameterError as e:
+                self.send_json(400, {'error': f"Missing query parameter {e}"})
+                return
+            except (KeyError, IndexError) as e:
+                # Raised inside a computation, so a bug rather than an unknown name
+                self.send_internal_error(e)
+                return
+            except LookupError as e:
+                self.send_json(404, {'error': str(e)})
+                return
+            except ServiceBusyError as e:
+                self.send_json(503, {'error': f"Server busy: {e}"}, {"Retry-After": "1"})
+                return
+            except ValueError as e:
+                self.send_json(400, {'error': str(e)})
+                return
+            except (TimeoutError, FutureTimeoutError):
+                self.send_json(504, {'error': f"Timed out computing {parsed.path}"})
+                return
+            except Exception as e:
+                self.send_internal_error(e)
+                return
+            if isinstance(payload, bytes):
+                fmt = query.get('format', "png")
+                cached = self.server.cache.put(key, payload, "image/svg+xml" if fmt == "svg" else "image/png")
+            else:
+                body = json.dumps(to_json_safe(payload)).encode("utf-8")
+                cached = self.server.cache.put(key, body)
+        etag, body, content_type = cached
+
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_internal_error(self, e):
+        print(f"Error serving {self.path}: {e!r}")
+        self.send_json(500, {'error': f"Internal error: {type(e).__name__}"})
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def chart_format(query):
+    fmt = query.get('format', "png")
+    if fmt not in ("png", "svg"):
+        raise ValueError(f"Unsupported chart format {fmt}")
+    return fmt
+
+
+class IPLAPIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+    def __init__(self, address, core, quiet=True, service=None):
+        self.core = core
+        self.service = service or IPLDataService(core).start()
+        self.cache = IPLResponseCache()
+        self.quiet = quiet
+        self.charts = IPLChartRenderer(core)
+        self.service.register("runs_distribution_chart", lambda fmt: self.charts.runs_distribution(fmt=fmt))
+        self.service.register("runs_violin_chart", lambda team, season, color, fmt: self.charts.runs_violin(team, season, color, fmt=fmt))
+        self.service.register("rating_trend_chart", lambda team, color, fmt: self.charts.rating_trend(team, color, fmt=fmt))
+        call = self.service.call
+        self.routes = {
+            "/api/teams": lambda q: core.teams,
+            "/api/seasons": lambda q: core.seasons,
+            "/api/players": lambda q: core.players,
+            "/api/players/search": lambda q: call("search_players", q.get('q', ""), q.get('limit', 20)),
+            "/api/home": lambda q: call("home_summary", q.get('season', "All")),
+            "/api/points-table": lambda q: call("points_table", q.get('season', "All")),
+            "/api/standings": lambda q: call("standings_as_of", q.get('season', "All"), q['date']),
+            "/api/standings/race": lambda q: call("standings_race", q['season']),
+            "/api/standings/check": lambda q: call("standings_check"),
+            "/api/h2h": lambda q: call("head_to_head", q['team1'], q['team2'], q.get('season', "All")),
+            "/api/team-performance": lambda q: call("team_performance", q['team'], q.get('season', "All")),
+            "/api/team-performance/all": lambda q: call("team_performance_all", q.get('season', "All")),
+            "/api/player": lambda q: call("player_performance", q['player']),
+            "/api/season-trends": lambda q: call("season_trends"),
+            "/api/season-projection": lambda q: call("season_projection"),
+            "/api/fixtures": lambda q: (call("fixtures_between", q['start'], q['end']) if 'start' in q
+                                        else call("fixtures_on", q['date'])),
+            "/api/fixtures/upcoming": lambda q: call("upcoming_fixtures", q.get('n', 5), q['after']),
+            "/api/venues": lambda q: call("venue_summary"),
+            "/api/venue": lambda q: call("venue_report", q['venue']),
+            "/api/fixtures/venues": lambda q: call("scheduled_fixture_venues"),
+            "/api/leaderboards": lambda q: call("leaderboard", q['metric'], q.get('season', "All"), q.get('n', 10)),
+            "/api/ratings": lambda q: call("team_ratings"),
+            "/api/ratings/history": lambda q: call("rating_history", q['team']),
+            "/api/ratings/expectation": lambda q: call("win_expectation", q['team1'], q['team2']),
+            "/api/charts/runs-distribution": lambda q: call("runs_distribution_chart", chart_format(q)),
+            "/api/charts/runs-violin": lambda q: call("runs_violin_chart", q['team'], q.get('season', "All"), q.get('color', "#3498db"), chart_format(q)),
+            "/api/charts/rating-trend": lambda q: call("rating_trend_chart", q['team'], q.get('color', "#3498db"), chart_format(q))
+        }
+        self.today_params = {"/api/fixtures": ('date',), "/api/fixtures/upcoming": ('after',)}
+        super().__init__(address, IPLAPIHandler)
+
+    def server_close(self):
+        super().server_close()
+        self.service.stop()
+
+
+def run_windows(core, windows, snapshot_path=None):
+    # Every window shares one data core and chart cache; only filters and widgets are per window
     root = tk.Tk()
-    app = IPLDashboard(root)
-    root.mainloop()
+    root.withdraw()
+    charts = IPLChartRenderer(core)
+    state = core.load_snapshot(snapshot_path)
+    for key, data in (state or {}).get('charts', {}).items():
+        charts.cache.remember(key, data)
+
+    open_windows = []
+
+    def close(window, dashboard):
+        dashboard.shutdown()
+        window.destroy()
+        open_windows.remove(window)
+        if not open_windows:
+            if snapshot_path:
+                core.save_snapshot(snapshot_path, charts.cache.memory)
+            root.destroy()
+
+    for i, spec in enumerate(windows):
+        # "section" or "section@geometry", e.g. season_trends@1920x1080+1920+0 for a second screen
+        section, _, geometry = spec.partition("@")
+        if section not in IPLDashboard.sections:
+            print(f"Error opening window: unknown section {section!r}")
+            continue
+        window = tk.Toplevel(root)
+        dashboard = IPLDashboard(window, core, start_frame=section, charts=charts)
+        if geometry:
+            window.geometry(geometry)
+        window.protocol("WM_DELETE_WINDOW", lambda w=window, d=dashboard: close(w, d))
+        open_windows.append(window)
+
+    if open_windows:
+        root.mainloop()
+    else:
+        root.destroy()
+
+
+def run_server(host="127.0.0.1", port=8050, workers=None, core=None, snapshot_path=None):
+    core = core or IPLDataCore()
+    server = IPLAPIServer((host, port), core, service=IPLDataService(core, max_workers=workers).start())
+    state = core.load_snapshot(snapshot_path)
+    for key, data in (state or {}).get('charts', {}).items():
+        server.charts.cache.remember(key, data)
+    print(f"Serving IPL dashboard API on http://{host}:{port}/api/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if snapshot_path:
+            core.save_snapshot(snapshot_path, server.charts.cache.memory)
+
+
+# Built once per export worker from its shared columns
+export_core = None
+
+
+def export_rows(section, arg_list):
+    # Runs in a pool worker: one section over many argument tuples, keeping only the scalar fields
+    global export_core
+    if export_core is None:
+        export_core = IPLDataCore(load=False).attach_frames(
+            worker_columns.frame('matches'), worker_columns.frame('players'), worker_columns.block.name)
+    rows = [getattr(export_core, section)(*args) for args in arg_list]
+    return [{key: value for key, value in row.items() if not isinstance(value, (dict, list))} for row in rows]
+
+
+class TableWriter:
+    # Appends each chunk to its table as it arrives: one CSV or Parquet file per table, or one sheet per table
+    def __init__(self, directory, fmt="csv"):
+        self.directory = directory
+        self.fmt = fmt
+        self.targets = {}
+        self.rows = {}
+        self.excel = None
+        if fmt == "parquet":
+            import pyarrow
+            import pyarrow.parquet
+            self.pa = pyarrow
+        elif fmt == "xlsx":
+            self.excel = pd.ExcelWriter(os.path.join(directory, "ipl_tables.xlsx"))
+
+    def write(self, table, df):
+        first = table not in self.targets
+        if self.fmt == "csv":
+            if first:
+                self.targets[table] = open(os.path.join(self.directory, f"{table}.csv"), "w", newline="", encoding="utf-8")
+            df.to_csv(self.targets[table], header=first, index=False)
+        elif self.fmt == "parquet":
+            if first:
+                chunk = self.pa.Table.from_pandas(df, preserve_index=False)
+                self.targets[table] = self.pa.parquet.ParquetWriter(os.path.join(self.directory, f"{table}.parquet"), chunk.schema)
+            else:
+                chunk = self.pa.Table.from_pandas(df, schema=self.targets[table].schema, preserve_index=False)
+            self.targets[table].write_table(chunk)
+        else:
+            start = self.targets.get(table, 0)
+            df.to_excel(self.excel, sheet_name=table[:31], startrow=start, header=first, index=False)
+            self.targets[table] = start + len(df) + (1 if first else 0)
+        self.rows[table] = self.rows.get(table, 0) + len(df)
+
+    def close(self):
+        for target in self.targets.values():
+            if hasattr(target, "close"):
+                target.close()
+        if self.excel is not None:
+            self.excel.close()
+
+
+def run_export(core, directory, fmt="csv", workers=None):
+    # Returns the process exit status: 1 when the writer for fmt is unavailable (pyarrow, openpyxl)
+    os.makedirs(directory, exist_ok=True)
+    try:
+        writer = TableWriter(directory, fmt)
+    except ImportError as e:
+        print(f"Error exporting tables: {e}")
+        return 1
+    try:
+        # Cheap, already vectorized tables come straight from the core. Official and computed tables share one column set
+        points_columns = ['season', 'pos', 'team', 'matchs played', 'Won', 'Lost', 'Net Run Rate', 'nrr_estimated', 'points', 'source']
+        for season in core.seasons:
+            writer.write("points_tables", core.calculate_points_table(season).rename(columns={'year': 'season'})
+                         .reindex(columns=points_columns, fill_value=False))
+            reports = core.team_performance_all(season).values()
+            writer.write("team_performance", pd.DataFrame(
+                [{key: value for key, value in report.items() if not isinstance(value, (dict, list))} for report in reports]))
+        writer.write("team_ratings", pd.DataFrame(core.team_ratings()))
+        writer.write("venues", pd.DataFrame(core.venue_summary()))
+        writer.write("standings_mismatches", core.reconcile_standings()['mismatches'])
+        # Players as parsed (HS, HS_not_out, Avg, BF ...), and every board in full: player metrics are career-wide,
+        # win_pct exists per season
+        writer.write("players", core.players_df)
+        boards = [(metric, "All") for metric in core.player_metrics] + [('win_pct', season) for season in core.seasons]
+        writer.write("leaderboards", pd.DataFrame(
+            [{'metric': metric, 'season': season, 'rank': i + 1, 'name': name, 'value': value}
+             for metric, season in boards for i, (name, value) in enumerate(core.leaderboards(metric).top((metric, season)))],
+            columns=['metric', 'season', 'rank', 'name', 'value']))
+
+        # Per-pair views go to the process pool; map keeps submission order, so each chunk is
+        # written as soon as it and the ones before it are done
+        pairs = [(a, b) for i, a in enumerate(core.teams) for b in core.teams[i + 1:]]
+        jobs = [("head_to_head", "head_to_head", [(a, b, season) for a, b in pairs]) for season in core.seasons]
+        with core.process_pool(workers) as pool:
+            results = pool.map(export_rows, [section for _, section, _ in jobs], [args for _, _, args in jobs])
+            for (table, _, _), rows in zip(jobs, results):
+                df = pd.DataFrame(rows)
+                if table == "head_to_head":
+                    df = df[df['total_matches'] > 0]
+                writer.write(table, df)
+    finally:
+        writer.close()
+    for table, count in writer.rows.items():
+        print(f"{table}: {count} rows")
+    print(f"Exported {len(writer.rows)} tables to {directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IPL Dashboard")
+    parser.add_argument("--serve", action="store_true", help="serve the dashboard stats as a JSON API instead of opening the GUI")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8050)
+    parser.add_argument("--workers", type=int, default=None, help="size of the section computation pool (server mode) or export process pool")
+    parser.add_argument("--backend", choices=["pandas", "sqlite", "numpy"], default="pandas", help="where match data is held and queried")
+    parser.add_argument("--db", default="ipl_matches.sqlite", help="database file for the sqlite backend")
+    parser.add_argument("--data", action="append", default=[], metavar="NAME=PATH",
+                        help="read a dataset (schedule, matches, players, points) from PATH instead; globs are merged")
+    parser.add_argument("--windows", default=None,
+                        help="comma-separated sections to open as separate windows, each optionally section@geometry")
+    parser.add_argument("--check-standings", action="store_true", help="compare computed standings with the official tables and exit")
+    parser.add_argument("--export", default=None, metavar="DIR", help="write every derived table to DIR and exit")
+    parser.add_argument("--export-format", choices=["csv", "parquet", "xlsx"], default="csv")
+    parser.add_argument("--snapshot", default=None, help="computed-state snapshot (.npz) to restore on start and save on exit; off unless given")
+    args = parser.parse_args()
+
+    sources = dict(item.partition("=")[::2] for item in args.data)
+    unknown = sorted(set(sources) - {'schedule', 'matches', 'players', 'points'})
+    if unknown or not all(sources.values()):
+        parser.error(f"--data expects NAME=PATH with NAME one of schedule, matches, players, points (got {', '.join(args.data)})")
+    core = IPLDataCore(backend=args.backend, db_path=args.db, sources=sources)
+    if args.check_standings:
+        report = core.reconcile_standings()
+        print(f"Checked {report['teams_checked']} team seasons across {len(report['seasons'])} seasons")
+        print(f"{report['nrr_estimated']} computed NRRs rest on estimated chase overs; NRR differences above {core.nrr_tolerance} are listed "
+              f"(mean absolute difference {report['nrr_mean_abs_diff']})")
+        print(report['mismatches'].groupby('field').size().to_string() if len(report['mismatches']) else "No mismatches")
+        print(report['mismatches'].to_string(index=False))
+    elif args.export:
+        sys.exit(run_export(core, args.export, args.export_format, args.workers))
+    elif args.serve:
+        run_server(args.host, args.port, args.workers, core, args.snapshot)
+    elif args.windows:
+        run_windows(core, args.windows.split(","), args.snapshot)
+    else:
+        root = tk.Tk()
+        app = IPLDashboard(root, core, args.snapshot)
+        root.mainloop()
@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import IPL_DASHBOARD as dashboard  # noqa: E402
+
+SOURCES = {
+    'schedule': os.path.join(ROOT, 'IPL_2025_Match_Schedule_Full.csv'),
+    'matches': os.path.join(ROOT, 'ipl_all_matches (1).csv'),
+    'players': os.path.join(ROOT, 'Player_Performance (1).csv'),
+    'points': os.path.join(ROOT, 'points_table_historic (1).csv'),
+}
+
+
+@pytest.fixture(scope="session")
+def core():
+    return dashboard.IPLDataCore(sources=SOURCES)
+
+
+
+@pytest.fixture(scope="session")
+def cores(core, tmp_path_factory):
+    db_path = str(tmp_path_factory.mktemp("store") / "matches.sqlite")
+    return {
+        'pandas': core,
+        'numpy': dashboard.IPLDataCore(backend="numpy", sources=SOURCES),
+        'sqlite': dashboard.IPLDataCore(backend="sqlite", db_path=db_path, sources=SOURCES),
+    }
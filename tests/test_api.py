@@ -0,0 +1,138 @@
+import contextlib
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from IPL_DASHBOARD import IPLAPIServer
+
+
+@contextlib.contextmanager
+def serve(core, service=None):
+    server = IPLAPIServer(('127.0.0.1', 0), core, service=service)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="module")
+def server(core):
+    with serve(core) as server:
+        server.service.register("slow", lambda: time.sleep(1))
+        server.service.register("boom", lambda: 1 / 0)
+        server.service.register("inner_key", lambda: {}['x'])
+        server.routes["/api/test/slow"] = lambda q: server.service.call("slow", timeout=0.1)
+        server.routes["/api/test/boom"] = lambda q: server.service.call("boom")
+        server.routes["/api/test/inner"] = lambda q: server.service.call("inner_key")
+        yield server
+
+
+def get(server, path, headers=None):
+    request = urllib.request.Request(f"http://127.0.0.1:{server.server_port}{path}", headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def get_json(server, path):
+    status, _, body = get(server, path)
+    return status, json.loads(body)
+
+
+def test_missing_parameter_is_400(server):
+    status, payload = get_json(server, "/api/h2h?team1=Mumbai%20Indians")
+    assert status == 400
+    assert payload['error'] == "Missing query parameter 'team2'"
+
+
+def test_unknown_endpoint_is_404(server):
+    assert get_json(server, "/api/nope")[0] == 404
+
+
+def test_etag_round_trip(server):
+    status, headers, body = get(server, "/api/points-table?season=2023")
+    assert status == 200
+    assert json.loads(body)[0]['team'] == "Gujarat Titans"
+    status, _, body = get(server, "/api/points-table?season=2023", {"If-None-Match": headers['ETag']})
+    assert status == 304
+    assert body == b""
+
+
+def test_fixture_dates_are_iso(server):
+    status, payload = get_json(server, "/api/fixtures/venues")
+    assert status == 200
+    assert payload[0]['date'] == "2025-03-22"
+    assert get_json(server, "/api/fixtures?start=2025-03-22&end=2025-03-22")[1][0]['date'] == "2025-03-22"
+
+
+def test_unknown_venue_is_404(server):
+    status, payload = get_json(server, "/api/venue?venue=Nowhere%20Oval")
+    assert status == 404
+    assert "unknown venue" in payload['error'].lower()
+
+
+def test_venue_report(server):
+    status, payload = get_json(server, "/api/venue?venue=Wankhede%20Stadium")
+    assert status == 200
+    assert payload['venue'] == "Wankhede Stadium"
+    assert payload['matches'] > 100
+
+
+def test_unknown_metric_is_400_and_lists_metrics(server, core):
+    status, payload = get_json(server, "/api/leaderboards?metric=catches")
+    assert status == 400
+    assert "unknown metric" in payload['error'].lower()
+    assert all(metric in payload['error'] for metric in core.player_metrics)
+
+
+@pytest.mark.parametrize("query", ["metric=runs&n=0", "metric=runs&n=-1", "metric=runs&n=ten",
+                                   "metric=runs&season=2023", "metric=win_pct&season=1999"])
+def test_bad_leaderboard_queries_are_400(server, query):
+    assert get_json(server, f"/api/leaderboards?{query}")[0] == 400
+
+
+def test_leaderboards(server):
+    status, payload = get_json(server, "/api/leaderboards?metric=runs&n=3")
+    assert status == 200
+    assert [row['rank'] for row in payload] == [1, 2, 3]
+    assert payload[0]['value'] >= payload[1]['value'] >= payload[2]['value']
+    status, payload = get_json(server, "/api/leaderboards?metric=win_pct&season=2023&n=1")
+    assert status == 200 and payload[0]['name'] == "Gujarat Titans"
+
+
+def test_unknown_team_is_404(server):
+    status, payload = get_json(server, "/api/team-performance?team=Nope")
+    assert status == 404
+    assert "unknown team" in payload['error'].lower()
+
+
+def test_former_team_performance(server):
+    status, payload = get_json(server, "/api/team-performance?team=Deccan%20Chargers")
+    assert status == 200
+    assert payload['team'] == "Deccan Chargers"
+
+
+def test_unexpected_error_is_500_json(server):
+    status, payload = get_json(server, "/api/test/boom")
+    assert status == 500
+    assert payload == {'error': "Internal error: ZeroDivisionError"}
+
+
+def test_key_error_inside_a_computation_is_500(server):
+    status, payload = get_json(server, "/api/test/inner")
+    assert status == 500
+    assert payload == {'error': "Internal error: KeyError"}
+
+
+def test_timeout_is_504_json(server):
+    status, payload = get_json(server, "/api/test/slow")
+    assert status == 504
+    assert "Timed out" in payload['error']
@@ -0,0 +1,73 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from IPL_DASHBOARD import ArrayMatchStore, to_json_safe
+
+BACKENDS = ['numpy', 'sqlite']
+SEASONS = ['All', '2008', '2013', '2020/21', '2023']
+PAIRS = [
+    ('Mumbai Indians', 'Chennai Super Kings', 'All'),
+    ('Mumbai Indians', 'Chennai Super Kings', '2010'),
+    ('Gujarat Titans', 'Deccan Chargers', 'All'),
+    ('Gujarat Titans', 'Kochi Tuskers Kerala', '2011'),
+    ('nope', 'Mumbai Indians', 'All'),
+]
+
+
+def as_json(value):
+    return json.dumps(to_json_safe(value), sort_keys=True)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("season", SEASONS)
+def test_points_table_parity(cores, backend, season):
+    expected = cores['pandas'].calculate_points_table(season).reset_index(drop=True)
+    actual = cores[backend].calculate_points_table(season).reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+# Pairs that never met run the t-test on no data
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.filterwarnings("ignore:One or more sample arguments is too small")
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("team1, team2, season", PAIRS)
+def test_head_to_head_parity(cores, backend, team1, team2, season):
+    expected = as_json(cores['pandas'].head_to_head(team1, team2, season))
+    assert as_json(cores[backend].head_to_head(team1, team2, season)) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("season", ['All', '2008', '2023'])
+def test_team_performance_parity(cores, backend, season):
+    expected = as_json(cores['pandas'].team_performance_all(season))
+    assert as_json(cores[backend].team_performance_all(season)) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_standings_race_parity(cores, backend):
+    assert as_json(cores[backend].standings_race('2019')) == as_json(cores['pandas'].standings_race('2019'))
+
+
+def test_array_store_round_trips_awkward_numbers():
+    frame = pd.DataFrame({
+        'season': ['2024', '2024', '2025'],
+        'date': ['01-04-2024', None, '02-04-2025'],
+        'team1': ['A', 'B', None],
+        'team2': ['B', 'A', 'A'],
+        'winner': ['A', None, 'A'],
+        'toss_winner': ['A', 'B', 'A'],
+        'result_margin': [12.0, np.nan, 3.0],
+        'offset': [-5.0, 2.0, np.nan],
+        'big': [3_000_000_000.0, 1.0, np.nan],
+        'overs': [19.5, 20.0, np.nan],
+        'match_id': [1, 2, 3],
+    })
+    store = ArrayMatchStore(frame)
+    decoded = store.matches()
+    pd.testing.assert_frame_equal(decoded.reset_index(drop=True), frame, check_dtype=False)
+    assert decoded['match_id'].dtype.kind == 'i'
+    assert store.matches(season='2025', columns=['team1'])['team1'].isna().all()
+    assert len(store.matches(team='A', opponent='B')) == 2
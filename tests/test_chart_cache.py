@@ -0,0 +1,45 @@
+import os
+
+from IPL_DASHBOARD import IPLChartCache
+
+
+def test_keys_are_content_addressed():
+    cache = IPLChartCache()
+    key = cache.make_key("violin", {"team": "MI"}, (8, 6), "light", "png")
+    assert key == cache.make_key("violin", {"team": "MI"}, [8, 6], "light", "png")
+    assert key != cache.make_key("violin", {"team": "MI"}, (8, 6), "light", "svg")
+
+
+def test_memory_evicts_least_recently_used(tmp_path):
+    cache = IPLChartCache(str(tmp_path), max_memory_items=2)
+    cache.remember("a", b"1")
+    cache.remember("b", b"2")
+    assert cache.get("a", "png") == b"1"
+    cache.remember("c", b"3")
+    assert list(cache.memory) == ["a", "c"]
+
+
+def test_disk_evicts_least_recently_read(tmp_path):
+    cache = IPLChartCache(str(tmp_path), max_memory_items=0, max_disk_bytes=8)
+    cache.put("a", "png", b"aaaa")
+    cache.put("b", "png", b"bbbb")
+    os.utime(cache.disk_path("a", "png"), (1000, 1000))
+    os.utime(cache.disk_path("b", "png"), (2000, 2000))
+    # Reading "a" from disk marks it as recently used, so writing "c" pushes out "b"
+    assert cache.get("a", "png") == b"aaaa"
+    cache.put("c", "png", b"cccc")
+    assert sorted(os.listdir(tmp_path)) == ["a.png", "c.png"]
+    assert cache.get("b", "png") is None
+
+
+def test_get_or_render_renders_once(tmp_path):
+    cache = IPLChartCache(str(tmp_path))
+    calls = []
+
+    def render():
+        calls.append(1)
+        return b"chart"
+
+    for _ in range(2):
+        assert cache.get_or_render("violin", {"team": "MI"}, (8, 6), "light", "png", render) == b"chart"
+    assert calls == [1]
@@ -0,0 +1,28 @@
+import sys
+
+import pandas as pd
+import pytest
+
+import IPL_DASHBOARD as dashboard
+
+
+def test_csv_export_writes_parsed_players_and_leaderboards(core, tmp_path):
+    assert dashboard.run_export(core, str(tmp_path), "csv", workers=1) == 0
+    players = pd.read_csv(tmp_path / "players.csv")
+    assert {'Player', 'HS', 'HS_not_out', 'Avg', 'BF'} <= set(players.columns)
+    assert len(players) == len(core.players_df)
+    pooran = players[players['Player'] == "Nicholas Pooran"].iloc[0]
+    assert pooran['HS'] == 87 and bool(pooran['HS_not_out'])
+
+    boards = pd.read_csv(tmp_path / "leaderboards.csv")
+    assert set(boards['metric']) == set(core.player_metrics) | {'win_pct'}
+    top_runs = boards[boards['metric'] == 'runs'].head(3)
+    assert top_runs['name'].tolist() == [row['name'] for row in core.leaderboard('runs', n=3)]
+    assert set(boards.loc[boards['metric'] == 'win_pct', 'season'].astype(str)) == {str(s) for s in core.seasons}
+
+
+@pytest.mark.parametrize("fmt, module", [("parquet", "pyarrow"), ("xlsx", "openpyxl")])
+def test_missing_writer_exits_nonzero(core, tmp_path, monkeypatch, fmt, module):
+    monkeypatch.setitem(sys.modules, module, None)
+    assert dashboard.run_export(core, str(tmp_path), fmt) == 1
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,16 @@
+import pandas as pd
+
+
+def test_player_columns_are_numeric(core):
+    players = core.players_df
+    assert players['HS'].dtype.kind in 'if' and players['Avg'].dtype.kind == 'f'
+    pooran = players[players['Player'] == "Nicholas Pooran"].iloc[0]
+    assert pooran['HS'] == 87 and bool(pooran['HS_not_out'])
+
+
+def test_high_scores_and_averages_parse(core):
+    frame = pd.DataFrame({'Player': ['A', 'B', 'C'], 'HS': ['87*', '102', ' 5* '], 'Avg': ['52.13', '-', '7']})
+    parsed = core.standardize_players(frame.copy())
+    assert parsed['HS'].tolist() == [87, 102, 5]
+    assert parsed['HS_not_out'].tolist() == [True, False, True]
+    assert parsed['Avg'].iloc[0] == 52.13 and pd.isna(parsed['Avg'].iloc[1]) and parsed['Avg'].iloc[2] == 7
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from IPL_DASHBOARD import AggregateCache, IPLDataCore, IPLPrefetcher
+from conftest import SOURCES
+
+
+def test_cache_evicts_least_recently_used():
+    cache = AggregateCache(max_entries=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert 'b' not in cache and 'a' in cache and 'c' in cache
+    assert cache.get('b', 'missing') == 'missing'
+    assert cache.inserts == 3
+
+
+def test_core_rebuilds_evicted_aggregates():
+    core = IPLDataCore(sources=SOURCES, max_aggregates=3)
+    first = core.points_table("2023")
+    for season in ("2019", "2020/21", "2021", "2022"):
+        core.points_table(season)
+    assert len(core.aggregates) <= 3
+    assert core.points_table("2023") == first
+
+
+# Some pairs never met in a season, so their head-to-head t-test has no data
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.filterwarnings("ignore:One or more sample arguments is too small")
+def test_prefetch_keeps_going_after_the_cache_fills():
+    core = IPLDataCore(sources=SOURCES, max_aggregates=40)
+    with IPLPrefetcher(core, budget_ms=5000, cache_share=0.5) as prefetcher:
+        views = [("head_to_head", team, "Mumbai Indians", season) for season in core.seasons for team in core.teams[2:6]]
+        for view in views:
+            prefetcher.run(prefetcher.generation, [(core.view, *view)])
+        # Far more views than the cache holds were warmed; the last ones are still served from it
+        assert len(views) > 40 and len(core.aggregates) == 40
+        assert (core.data_version, ('view', views[-1][0], views[-1][1:])) in core.aggregates
+
+        # One batch builds at most cache_share of the cache
+        start = core.aggregates.inserts
+        prefetcher.run(prefetcher.generation, [(core.view, "head_to_head", team, "Mumbai Indians", "All") for team in core.teams])
+        assert core.aggregates.inserts - start <= 20
+
+
+def test_new_view_cancels_queued_work():
+    core = IPLDataCore(sources=SOURCES)
+    calls = []
+    with IPLPrefetcher(core) as prefetcher:
+        prefetcher.submit([(time.sleep, 0.2), (calls.append, 'old')])
+        prefetcher.submit([(calls.append, 'new')])
+        time.sleep(0.5)
+    assert calls == ['new']
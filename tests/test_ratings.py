@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from IPL_DASHBOARD import EloRatings
+
+COLUMNS = ['id', 'date', 'season', 'team1', 'team2', 'winner']
+
+
+@pytest.fixture(scope="module")
+def matches(core):
+    return core.get_season_matches(columns=COLUMNS)
+
+
+def chronological(matches):
+    dates = pd.to_datetime(matches['date'], dayfirst=True, errors='coerce')
+    return matches.assign(match_date=dates).sort_values(['match_date', 'id'], kind='stable').drop(columns='match_date')
+
+
+def test_extend_in_batches_matches_full_refit(matches):
+    ordered = chronological(matches)
+    full = EloRatings().extend(ordered)
+    incremental = EloRatings()
+    for batch in np.array_split(np.arange(len(ordered)), 7):
+        incremental = incremental.extend(ordered.iloc[batch])
+    assert incremental.current() == pytest.approx(full.current())
+    assert incremental.size == full.size == len(ordered)
+    for team in full.current():
+        pd.testing.assert_frame_equal(incremental.history(team), full.history(team))
+
+
+def test_extend_skips_seen_results(matches):
+    ratings = EloRatings().extend(matches)
+    before = ratings.current()
+    assert ratings.extend(matches) is ratings
+    assert ratings.current() == before
+
+
+def test_out_of_order_result_forces_refit(matches):
+    ordered = chronological(matches)
+    late = ordered.iloc[len(ordered) // 2:]
+    ratings = EloRatings().extend(late)
+    # As in IPLDataCore.ratings, the full history is passed; the earlier results it has not seen trigger the refit
+    refit = ratings.extend(ordered)
+    assert refit is not ratings
+    assert refit.current() == pytest.approx(EloRatings().extend(ordered).current())
@@ -0,0 +1,28 @@
+from IPL_DASHBOARD import PlayerSearchIndex
+
+ROSTER = ["Ravindra Jadeja", "Ravi Bishnoi", "Jason Roy", "Rohit Sharma", "Shubman Gill", "Ravichandran Ashwin", "Ravi Ashwin"]
+
+
+def test_prefix_matches_rank_before_token_matches():
+    index = PlayerSearchIndex(ROSTER + ["Aaron Ravindra"])
+    assert index.search("ravi") == ["Ravi Ashwin", "Ravi Bishnoi", "Ravichandran Ashwin", "Ravindra Jadeja", "Aaron Ravindra"]
+
+
+def test_ranking_happens_before_the_limit():
+    # The surname entries ("ravi") sort before "ravi ashwin", yet the prefix match must still make the cut
+    index = PlayerSearchIndex(["Aaron Ravi", "Ben Ravi", "Ravi Ashwin"])
+    assert index.search("ravi", limit=1) == ["Ravi Ashwin"]
+
+
+def test_surname_and_fuzzy_matches():
+    index = PlayerSearchIndex(ROSTER)
+    assert index.search("ash") == ["Ravi Ashwin", "Ravichandran Ashwin"]
+    assert index.search("rohti sharma") == ["Rohit Sharma"]
+    assert index.search("zzz") == []
+
+
+def test_incremental_queries_narrow_and_reset():
+    index = PlayerSearchIndex(ROSTER)
+    assert index.search("r", limit=100)[:2] == ["Ravi Ashwin", "Ravi Bishnoi"]
+    assert index.search("ro") == ["Rohit Sharma", "Jason Roy"]
+    assert index.search("sh") == ["Shubman Gill", "Rohit Sharma"]
@@ -0,0 +1,65 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from IPL_DASHBOARD import IPLDataService, ServiceBusyError
+from test_api import get_json, serve
+
+
+@pytest.fixture
+def service(core):
+    with IPLDataService(core, max_workers=2, max_pending=4) as service:
+        yield service
+
+
+def test_identical_requests_share_one_computation(service):
+    calls = []
+    release = threading.Event()
+
+    def slow(x):
+        calls.append(x)
+        release.wait(5)
+        return x * 2
+
+    service.register("slow", slow)
+    with ThreadPoolExecutor(3) as pool:
+        futures = [pool.submit(service.call, "slow", 21) for _ in range(3)]
+        time.sleep(0.2)
+        release.set()
+        assert [future.result() for future in futures] == [42, 42, 42]
+    assert calls == [21]
+
+
+def test_waiting_callers_are_bounded_even_for_one_key(service):
+    release = threading.Event()
+    service.register("slow", lambda: release.wait(5))
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(service.call, "slow") for _ in range(4)]
+        time.sleep(0.2)
+        with pytest.raises(ServiceBusyError):
+            service.call("slow")
+        release.set()
+        assert all(future.result() for future in futures)
+
+
+def test_unknown_section_is_rejected(service):
+    with pytest.raises(ValueError):
+        service.call("nope")
+
+
+def test_busy_service_answers_503(core):
+    release = threading.Event()
+    service = IPLDataService(core, max_pending=1)
+    service.register("slow", lambda: release.wait(5))
+    with serve(core, service) as server:
+        server.routes["/api/test/slow"] = lambda q: server.service.call("slow")
+        with ThreadPoolExecutor(1) as pool:
+            first = pool.submit(get_json, server, "/api/test/slow")
+            time.sleep(0.2)
+            status, payload = get_json(server, "/api/test/slow")
+            release.set()
+            assert first.result()[0] == 200
+    assert status == 503
+    assert payload['error'].startswith("Server busy")
@@ -0,0 +1,49 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import IPL_DASHBOARD as dashboard
+from IPL_DASHBOARD import SharedColumnStore, attach_shared_columns
+
+
+@pytest.fixture
+def frames():
+    return {
+        'matches': pd.DataFrame({'id': np.arange(5, dtype=np.int64), 'runs': [150.0, np.nan, 201.0, 99.5, 180.0],
+                                 'team': ["MI", "CSK", None, "MI", "RR"], 'super_over': [False, True, False, False, True]}),
+        'players': pd.DataFrame({'Player': ["A", "B"], 'Runs': [417, 368]}),
+    }
+
+
+def test_attach_gives_back_the_same_frames(frames):
+    store = SharedColumnStore.create(frames)
+    try:
+        attached = SharedColumnStore.attach(store.manifest)
+        for name, frame in frames.items():
+            pd.testing.assert_frame_equal(attached.frame(name), frame, check_dtype=False)
+        assert attached.columns('matches')['team'].tolist() == [0, 1, -1, 0, 2]
+        attached.release()
+    finally:
+        store.release()
+
+
+def sum_runs(_):
+    return float(np.nansum(dashboard.worker_columns.columns('matches')['runs']))
+
+
+def test_pool_workers_read_the_shared_block(frames):
+    store = SharedColumnStore.create(frames)
+    try:
+        with ProcessPoolExecutor(2, initializer=attach_shared_columns, initargs=(store.manifest,)) as pool:
+            assert list(pool.map(sum_runs, range(2))) == [630.5, 630.5]
+    finally:
+        store.release()
+
+
+def test_core_shares_match_and_player_columns(core):
+    store = core.shared_columns()
+    pd.testing.assert_series_equal(store.frame('matches')['winner'], core.matches_df['winner'].reset_index(drop=True),
+                                   check_dtype=False)
+    assert core.shared_columns() is store
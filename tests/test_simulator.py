@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from IPL_DASHBOARD import ScheduleIndex, SeasonSimulator
+
+
+def test_projection_is_a_distribution_and_reports_skipped_rows(core, capsys):
+    projection = SeasonSimulator(core, n_sims=2000, seed=7).run()
+    teams = projection['teams'].values()
+    assert sum(team['title_pct'] for team in teams) == pytest.approx(100)
+    assert sum(team['playoff_pct'] for team in teams) == pytest.approx(400)
+    assert sum(team['top2_pct'] for team in teams) == pytest.approx(200)
+    assert [row['away'] for row in projection['skipped_fixtures']] == ['Ahmedabad']
+    assert capsys.readouterr().out == ""
+
+
+def test_projection_is_reproducible_with_a_seed(core):
+    assert SeasonSimulator(core, n_sims=500, seed=3).run() == SeasonSimulator(core, n_sims=500, seed=3).run()
+
+
+def test_schedule_index_collects_unreadable_rows(capsys):
+    schedule = pd.DataFrame({'Match No': [1, 2], 'Date': ['22-Mar-25', 'soon'], 'Day': ['Sat', 'Sun'],
+                             'Start': ['7:30 PM', '3:30 PM'], 'Home': ['A', 'B'], 'Away': ['B', 'A'], 'Venue': ['X', 'Y']})
+    index = ScheduleIndex(schedule)
+    assert [row['match_no'] for row in index.rows(0, 5)] == [1]
+    assert index.skipped == [{'match_no': 2, 'reason': "unreadable date or start time"}]
+    assert capsys.readouterr().out == ""
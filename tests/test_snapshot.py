@@ -0,0 +1,78 @@
+import json
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import IPL_DASHBOARD as dashboard
+from conftest import SOURCES
+
+
+def warm(core):
+    for season in ("All", "2023"):
+        core.points_table(season)
+        core.team_performance_all(season)
+    core.season_trends()
+
+
+def test_round_trip_restores_plain_aggregates(tmp_path):
+    core = dashboard.IPLDataCore(sources=SOURCES)
+    warm(core)
+    path = str(tmp_path / "state.npz")
+    core.save_snapshot(path, {"chart-key": b"\x89PNG"}, {'team1': "Mumbai Indians", 'frame': "home"})
+
+    restored = dashboard.IPLDataCore(sources=SOURCES)
+    state = restored.load_snapshot(path)
+    assert state == {'charts': {"chart-key": b"\x89PNG"}, 'filters': {'team1': "Mumbai Indians", 'frame': "home"}}
+    for key, value in restored.aggregates.items():
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(value, core.aggregates[key], check_index_type=False)
+        else:
+            assert value == core.aggregates[key]
+    assert (restored.data_version, ('points_table', "2023")) in restored.aggregates
+    # Class instances are never stored; they are rebuilt from the data
+    assert not any(isinstance(value, dashboard.StandingsCube) for _, value in restored.aggregates.items())
+    assert restored.points_table("2023") == core.points_table("2023")
+
+
+def test_snapshot_holds_no_pickles(tmp_path):
+    core = dashboard.IPLDataCore(sources=SOURCES)
+    warm(core)
+    path = str(tmp_path / "state.npz")
+    core.save_snapshot(path)
+    with np.load(path, allow_pickle=False) as archive:
+        assert all(archive[name].dtype != object for name in archive.files)
+
+
+def test_changed_data_keeps_only_filters(tmp_path):
+    core = dashboard.IPLDataCore(sources=SOURCES)
+    warm(core)
+    path = str(tmp_path / "state.npz")
+    core.save_snapshot(path, {"chart-key": b"png"}, {'season': "2023"})
+    other = dashboard.IPLDataCore(sources=SOURCES)
+    other.data_version = "something-else"
+    assert other.load_snapshot(path) == {'charts': {}, 'filters': {'season': "2023"}}
+    assert len(other.aggregates) == 0
+
+
+def test_other_code_version_is_ignored(tmp_path):
+    core = dashboard.IPLDataCore(sources=SOURCES)
+    path = str(tmp_path / "state.npz")
+    manifest = {'code_version': "older", 'data_version': core.data_version, 'aggregates': [], 'charts': [], 'filters': {}}
+    np.savez(path, manifest=np.array(json.dumps(manifest)))
+    assert core.load_snapshot(path) is None
+
+
+def test_pickle_files_are_not_loaded(tmp_path, capsys):
+    core = dashboard.IPLDataCore(sources=SOURCES)
+    path = str(tmp_path / "state.pkl")
+    with open(path, "wb") as f:
+        pickle.dump({'format': 4, 'data_version': core.data_version, 'filters': {}}, f)
+    assert core.load_snapshot(path) is None
+    assert "Error reading snapshot" in capsys.readouterr().out
+
+
+def test_missing_snapshot(tmp_path):
+    core = dashboard.IPLDataCore(sources=SOURCES)
+    assert core.load_snapshot(None) is None
+    assert core.load_snapshot(str(tmp_path / "absent.npz")) is None
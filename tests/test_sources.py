@@ -0,0 +1,33 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+import IPL_DASHBOARD as dashboard
+
+
+def test_glob_merges_files_in_name_order(tmp_path):
+    pd.DataFrame({'season': [2009], 'runs': [9]}).to_csv(tmp_path / "b_2009.csv", index=False)
+    pd.DataFrame({'season': [2008, 2008], 'runs': [1, 2]}).to_csv(tmp_path / "a_2008.csv", index=False)
+    source = dashboard.DataSource('matches', str(tmp_path / "*.csv"))
+    assert [p.rsplit("/", 1)[-1] for p in source.files()] == ["a_2008.csv", "b_2009.csv"]
+    frame = source.read()
+    assert frame['season'].tolist() == [2008, 2008, 2009] and frame.index.tolist() == [0, 1, 2]
+    assert [len(chunk) for chunk in source.chunks(1)] == [1, 1, 1]
+    assert source.fingerprint().count(";") == 1
+
+
+def test_compressed_csv_is_read_from_its_suffix(tmp_path):
+    path = tmp_path / "players.csv.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("Player,HS,Avg\nA,87*,52.1\n")
+    frame = dashboard.DataSource('players', str(path)).read()
+    assert frame.to_dict('records') == [{'Player': 'A', 'HS': '87*', 'Avg': 52.1}]
+
+
+def test_missing_path_and_unknown_suffix_raise(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        dashboard.DataSource('points', str(tmp_path / "absent.csv")).read()
+    (tmp_path / "points.txt").write_text("team\n")
+    with pytest.raises(ValueError):
+        dashboard.DataSource('points', str(tmp_path / "points.txt")).read()
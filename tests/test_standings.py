@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from IPL_DASHBOARD import StandingsCube, net_run_rate, overs_to_balls, runs_and_balls
+
+# Seasons whose match data holds every league game, so computed tables must equal the official ones
+COMPLETE_SEASONS = ['2009/10', '2013', '2014', '2016', '2018', '2019', '2020/21', '2021', '2022', '2023']
+
+
+def test_overs_to_balls_reads_cricket_notation():
+    assert overs_to_balls(pd.Series(["261.1", "20", "19.5", "0.3"])).tolist() == [1567, 120, 119, 3]
+
+
+def test_overs_to_balls_handles_empty_and_missing():
+    assert len(overs_to_balls(pd.Series([], dtype=object))) == 0
+    assert np.isnan(overs_to_balls(pd.Series([None]))[0])
+    assert np.isnan(runs_and_balls(pd.Series([None]))[1][0])
+
+
+def test_runs_and_balls_splits_totals():
+    runs, balls = runs_and_balls(pd.Series(["2245/261.1", "2153/270.2"]))
+    assert runs.tolist() == [2245, 2153]
+    assert balls.tolist() == [1567, 1622]
+    assert [len(values) for values in runs_and_balls(pd.Series([], dtype=object))] == [0, 0]
+
+
+def test_net_run_rate_matches_official_table():
+    # Rajasthan Royals 2008: For 2245/261.1, Against 2153/270.2, official NRR 0.632
+    assert round(float(net_run_rate(2245, 1567, 2153, 1622)), 3) == 0.632
+
+
+def test_official_nrr_recomputes_from_totals(core):
+    official = core.official_run_rates()
+    assert (official['nrr_from_totals'] - official['Net Run Rate']).abs().max() <= 0.002
+
+
+@pytest.mark.parametrize("season", COMPLETE_SEASONS)
+def test_cube_matches_official_results(core, season):
+    # Places can differ where the estimated NRR breaks a tie, so only the results are compared
+    columns = ['matchs played', 'Won', 'Lost', 'points']
+    computed = core.standings_cube(season).table().set_index('team')[columns].sort_index()
+    official = core.official_standings(season).set_index('team')[columns].sort_index()
+    pd.testing.assert_frame_equal(computed, official, check_dtype=False)
+
+
+@pytest.mark.parametrize("season", COMPLETE_SEASONS)
+def test_cube_orders_by_points_then_nrr_then_wins(core, season):
+    for after in (10, None):
+        table = core.standings_cube(season).table(after)
+        keys = list(zip(-table['points'], -table['Net Run Rate'], -table['Won'], table['team']))
+        assert keys == sorted(keys)
+        assert table['pos'].tolist() == list(range(1, len(table) + 1))
+
+
+def test_ties_use_only_results_so_far(core):
+    # After ten matches of 2023 KKR (NRR +2.06) led CSK (-0.23) on two points each, whoever won the title later
+    table = core.standings_cube('2023').table(10).set_index('team')
+    assert table.loc['Kolkata Knight Riders', 'points'] == table.loc['Chennai Super Kings', 'points'] == 2
+    assert table.loc['Kolkata Knight Riders', 'pos'] < table.loc['Chennai Super Kings', 'pos']
+
+
+def test_cube_flags_estimated_nrr_and_breaks_ties_on_it():
+    matches = pd.DataFrame({
+        'date': ['01-04-2024', '02-04-2024', '03-04-2024'],
+        'match_type': 'League',
+        'team1': ['A', 'B', 'C'],
+        'team2': ['B', 'C', 'A'],
+        'toss_winner': ['A', 'B', 'C'],
+        'toss_decision': ['bat', 'bat', 'field'],
+        'winner': ['A', 'B', 'C'],
+        'result': ['runs', 'runs', 'wickets'],
+        'result_margin': [50.0, 1.0, 8.0],
+        'target_runs': [200.0, 150.0, 120.0],
+        'target_overs': [20.0, 20.0, 20.0],
+    })
+    # Each side wins once, so NRR decides; only C's win and A's defeat rest on a chase won by wickets
+    table = StandingsCube(matches, ['A', 'B', 'C'], '2024').table()
+    assert table['points'].tolist() == [2, 2, 2]
+    assert table['Net Run Rate'].is_monotonic_decreasing
+    assert table['team'].tolist() == ['A', 'C', 'B']
+    assert table.set_index('team')['nrr_estimated'].to_dict() == {'A': True, 'B': False, 'C': True}
+
+    # The chase's balls come from the wickets in hand: 8 wickets leave 16% of the quota
+    innings = StandingsCube.innings(matches, StandingsCube.team_codes(matches)[0])
+    assert innings['second_balls'].tolist() == [120, 120, 101]
+    assert innings['estimated'].tolist() == [False, False, True]
+
+
+def test_cube_as_of_steps(core):
+    cube = core.standings_cube('2023')
+    assert cube.table(0)['matchs played'].sum() == 0
+    assert cube.table(1)['matchs played'].sum() == 2
+    assert core.standings_after('2023', len(cube)) is core.calculate_points_table('2023')
+
+
+def test_empty_season_has_empty_table(core):
+    assert len(core.standings_cube('1999').table()) == 0
+
+
+def test_reconcile_reports_independent_positions_and_every_nrr_difference(core):
+    report = core.reconcile_standings()
+    mismatches = report['mismatches'].set_index(['season', 'team', 'field'])
+    assert report['teams_checked'] == 156
+    # RCB and RR finished 2023 level on points; the estimated NRR puts them the other way round
+    assert mismatches.loc[('2023', 'Royal Challengers Bengaluru', 'pos'), 'official'] == 6
+    nrr = report['mismatches'][report['mismatches']['field'] == 'Net Run Rate']
+    assert len(nrr) > 0 and (nrr['computed'] - nrr['official']).abs().min() > core.nrr_tolerance
+    assert nrr['nrr_estimated'].all()
+    # Delhi's 2009/10 NRR matches to three decimals, so it is not listed
+    assert ('2009/10', 'Delhi Capitals', 'Net Run Rate') not in mismatches.index
+    assert 0 < report['nrr_mean_abs_diff'] < 0.5